@@ -0,0 +1,87 @@
+# benchmarks/parser_scaling.py
+"""Check that parse time grows linearly with program size
+
+Parses synthetic programs of doubling size and compares the time per
+statement of the largest against the smallest.  Exits with status 1 when
+the ratio exceeds --max-ratio, which is what a quadratic rule shows up as.
+
+    python benchmarks/parser_scaling.py [--sizes 5000 10000 20000 40000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tracelang_astcache import parse
+
+# One unit of the synthetic program: statement lists, parameter lists and
+# argument lists all grow with the size
+UNIT = """int v{i} = {i} + 1;
+v{i} = v{i} * 2;
+print(v{i});
+"""
+
+
+def make_program(statements, width=50):
+    """Source with about `statements` top-level statements
+
+    Also contains a function with `width` parameters per 1000 statements
+    and a call passing as many arguments, so the list rules are exercised
+    at every size.
+    """
+    parts = [UNIT.format(i=i) for i in range(statements // 3)]
+    params = max(1, width * statements // 1000)
+    parts.append(
+        "function int f("
+        + ", ".join(f"int p{i}" for i in range(params))
+        + ") { return p0; }\n"
+    )
+    parts.append("int r = f(" + ", ".join(str(i) for i in range(params)) + ");\n")
+    return "".join(parts)
+
+
+def time_parse(source, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ast, _ = parse(source)
+        elapsed = time.perf_counter() - start
+        if ast is None:
+            raise SystemExit("Error: benchmark program failed to parse")
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[5000, 10000, 20000, 40000]
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=1.5,
+        help="allowed growth of time per statement, largest over smallest",
+    )
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'statements':>10} {'seconds':>10} {'us/stmt':>10}")
+    per_statement = []
+    for size in sorted(args.sizes):
+        seconds = time_parse(make_program(size), args.repeat)
+        per_statement.append(seconds / size)
+        print(f"{size:>10} {seconds:>10.4f} {seconds / size * 1e6:>10.2f}")
+
+    ratio = per_statement[-1] / per_statement[0]
+    print(f"\nTime per statement, largest / smallest: {ratio:.2f}")
+    if ratio > args.max_ratio:
+        print(f"Parse time is growing faster than linearly (limit {args.max_ratio})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# benchmarks/recursion.py
+"""Measure TraceLang function calls per second
+
+Runs a doubly recursive fibonacci and a linear countdown on each engine
+and reports calls per second, best of --repeat runs.
+
+    python benchmarks/recursion.py [--fib 20] [--depth 200] [--engines closure vm]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tracelang_astcache import parse
+from tracelang_compiler import ENGINES, execute
+from tracelang_interpreter import TraceSystem
+
+FIB = """
+function int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+print(fib(%d));
+"""
+
+COUNTDOWN = """
+function int down(int n) {
+    if (n == 0) {
+        return 0;
+    }
+    return down(n - 1);
+}
+int i = 0;
+while (i < %d) {
+    down(%d);
+    i = i + 1;
+}
+"""
+
+
+def fib_calls(n):
+    """Number of calls fib(n) makes, itself included"""
+    a, b = 0, 1
+    for _ in range(n + 1):
+        a, b = b, a + b
+    return 2 * a - 1
+
+
+def calls_per_second(source, calls, engine, repeat):
+    ast, _ = parse(source)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            execute(ast, TraceSystem(), {}, engine)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return calls / best
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--fib", type=int, default=20)
+    arg_parser.add_argument("--depth", type=int, default=200)
+    arg_parser.add_argument("--loops", type=int, default=100)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--engines", nargs="+", choices=ENGINES, default=ENGINES)
+    args = arg_parser.parse_args(argv)
+
+    workloads = [
+        (f"fib({args.fib})", FIB % args.fib, fib_calls(args.fib)),
+        (
+            f"countdown({args.depth}) x{args.loops}",
+            COUNTDOWN % (args.loops, args.depth),
+            args.loops * (args.depth + 1),
+        ),
+    ]
+    print(f"{'workload':<24} {'engine':<8} {'calls/sec':>12}")
+    for name, source, calls in workloads:
+        for engine in args.engines:
+            rate = calls_per_second(source, calls, engine, args.repeat)
+            print(f"{name:<24} {engine:<8} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
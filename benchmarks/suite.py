@@ -0,0 +1,376 @@
+# benchmarks/suite.py
+"""TraceLang benchmark suite
+
+Runs scalable synthetic workloads through the lexer, parser, execution
+engines and trace system and reports, for each one, operations per second
+(best of --repeat runs), peak traced memory from a separate tracemalloc
+run and, for traced workloads, how fast the trace file is written.
+
+    python benchmarks/suite.py [--scale 1.0] [--only lex parse] [--output results.json]
+    python benchmarks/suite.py --save-baseline baseline.json
+    python benchmarks/suite.py --compare baseline.json [--tolerance 0.2]
+
+--compare exits with status 1 if any workload's ops/sec fell by more than
+the tolerance.  benchmarks/baseline.json is a reference run; timings are
+machine-specific, so record a baseline on the machine you compare on.
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from recursion import COUNTDOWN, FIB, fib_calls
+
+from tracelang_astcache import parse
+from tracelang_compiler import execute
+from tracelang_fastlex import lexer as fast_lexer
+from tracelang_interpreter import TraceSystem, TraceWriter
+from tracelang_lexer import lexer as ply_lexer
+from tracelang_tracefile import BinaryTraceWriter
+
+# One unit of generated source for the lexer and parser workloads
+SOURCE_UNIT = """// unit {i}
+int a{i} = {i} * 3 + 7;
+float f{i} = 2.5 / 1.25;
+string s{i} = "value\\t{i}\\n";
+if (a{i} > 10 && f{i} != 0.0) {{
+    a{i} = a{i} - 1;
+}} else {{
+    print(s{i});
+}}
+"""
+SOURCE_UNIT_STATEMENTS = 5
+
+ARITHMETIC = """
+int i = 0;
+int total = 0;
+while (i < %d) {
+    total = total + i * 3 %% 7 - 1;
+    i = i + 1;
+}
+print(total);
+"""
+
+ARRAYS = """
+array<int> values = %s;
+int n = length(values);
+int round = 0;
+while (round < %d) {
+    for (int i = 0; i < n; i++) {
+        values[i] = values[i] + i;
+    }
+    round = round + 1;
+}
+print(values[n - 1]);
+"""
+
+ARRAY_MATH = """
+array<float> values = %s;
+float total = 0.0;
+int round = 0;
+while (round < %d) {
+    array<float> scaled = values * 1.5 + values;
+    total = total + sum(scaled) - max(scaled);
+    round = round + 1;
+}
+print(total);
+"""
+
+TRACED = """
+%(trace)s int i = 0;
+%(trace)s int total = 0;
+while (i < %(iterations)d) {
+    total = total + i;
+    i = i + 1;
+}
+"""
+
+
+class Workload:
+    """A benchmark: run() performs `ops` operations of the named kind"""
+
+    def __init__(self, name, unit, ops, run, trace_file=None):
+        self.name = name
+        self.unit = unit
+        self.ops = ops
+        self.run = run
+        self.trace_file = trace_file  # Written by run(), for throughput
+
+
+def run_program(source, engine="closure", max_depth=None):
+    ast, _ = parse(source)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            if max_depth is None:
+                execute(ast, TraceSystem(), {}, engine)
+            else:
+                execute(ast, TraceSystem(), {}, engine, max_depth)
+
+    return run
+
+
+def lex_workload(name, lexer):
+    def build(scale):
+        units = max(1, int(4000 * scale))
+        source = "".join(SOURCE_UNIT.format(i=i) for i in range(units))
+        lexer.input(source)
+        tokens = sum(1 for _ in iter(lexer.token, None))
+
+        def run():
+            lexer.lineno = 1
+            lexer.input(source)
+            for _ in iter(lexer.token, None):
+                pass
+
+        return Workload(name, "tokens", tokens, run)
+
+    return build
+
+
+def parse_workload(scale):
+    units = max(1, int(4000 * scale))
+    source = "".join(SOURCE_UNIT.format(i=i) for i in range(units))
+
+    def run():
+        parse(source)
+
+    return Workload("parse", "statements", units * SOURCE_UNIT_STATEMENTS, run)
+
+
+def arithmetic_workload(engine, iterations):
+    def build(scale):
+        iterations_run = max(1, int(iterations * scale))
+        return Workload(
+            f"arithmetic_loop[{engine}]",
+            "iterations",
+            iterations_run,
+            run_program(ARITHMETIC % iterations_run, engine),
+        )
+
+    return build
+
+
+def recursion_workload(scale):
+    # fib(n) makes about 1.618**n calls, so scaling the work means shifting n
+    n = max(5, 20 + round(math.log(scale, (1 + 5**0.5) / 2)))
+    return Workload(
+        "recursion_fib", "calls", fib_calls(n), run_program(FIB % n, "closure")
+    )
+
+
+def deep_recursion_workload(scale):
+    depth = max(1, int(100000 * scale))
+    return Workload(
+        "deep_recursion[vm]",
+        "calls",
+        depth + 1,
+        run_program(COUNTDOWN % (1, depth), "vm", depth + 10),
+    )
+
+
+def arrays_workload(scale):
+    size = 1000
+    rounds = max(1, int(100 * scale))
+    source = ARRAYS % ("[" + ", ".join(["0"] * size) + "]", rounds)
+    return Workload(
+        "arrays", "element updates", size * rounds, run_program(source, "closure")
+    )
+
+
+def array_math_workload(scale):
+    size = 10000
+    rounds = max(1, int(100 * scale))
+    source = ARRAY_MATH % ("[" + ", ".join(["0.5"] * size) + "]", rounds)
+    # Each round makes two element-wise passes, a sum and a max
+    return Workload(
+        "array_math",
+        "element operations",
+        4 * size * rounds,
+        run_program(source, "closure"),
+    )
+
+
+def traced_workload(trace_format, trace="trace", label=None):
+    """The traced loop; trace is the declarations' trace spec"""
+
+    def build(scale):
+        iterations = max(1, int(100000 * scale))
+        ast, _ = parse(TRACED % {"trace": trace, "iterations": iterations})
+        directory = tempfile.mkdtemp(prefix="tracelang-bench-")
+        if trace_format == "binary":
+            trace_file = os.path.join(directory, "Trace.bin")
+        else:
+            trace_file = os.path.join(directory, "Trace.txt")
+
+        def run():
+            if trace_format == "binary":
+                trace_system = TraceSystem(BinaryTraceWriter(trace_file))
+            elif trace_format == "stream":
+                trace_system = TraceSystem(TraceWriter(trace_file))
+            else:
+                trace_system = TraceSystem()
+            with contextlib.redirect_stdout(io.StringIO()):
+                execute(ast, trace_system, {}, "closure")
+                trace_system.write_trace_file(trace_file)
+
+        # Two traced updates per iteration plus the two declarations
+        return Workload(
+            f"traced_loop[{label or trace_format}]",
+            "trace updates",
+            2 * iterations + 2,
+            run,
+            trace_file,
+        )
+
+    return build
+
+
+WORKLOADS = {
+    # The lexer the parser uses, and the PLY lexer it must agree with
+    "lex": lex_workload("lex", fast_lexer),
+    "lex_ply": lex_workload("lex_ply", ply_lexer),
+    "parse": parse_workload,
+    # Sized so each engine takes a similar time; the tree engine is slowest
+    # and allocates heavily, which tracemalloc makes far slower still
+    "arithmetic_closure": arithmetic_workload("closure", 200000),
+    "arithmetic_vm": arithmetic_workload("vm", 100000),
+    "arithmetic_tree": arithmetic_workload("tree", 20000),
+    "recursion": recursion_workload,
+    "deep_recursion": deep_recursion_workload,
+    "arrays": arrays_workload,
+    "array_math": array_math_workload,
+    "traced_text": traced_workload("text"),
+    "traced_stream": traced_workload("stream"),
+    "traced_binary": traced_workload("binary"),
+    # Updates a policy drops cost only its check
+    "traced_sampled": traced_workload("text", "trace(every=100)", "every=100"),
+}
+
+
+def measure(workload, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload.run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    workload.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "unit": workload.unit,
+        "ops": workload.ops,
+        "seconds": best,
+        "ops_per_sec": workload.ops / best,
+        "peak_memory_bytes": peak,
+    }
+    if workload.trace_file is not None:
+        size = os.path.getsize(workload.trace_file)
+        result["trace_bytes"] = size
+        # Bytes of trace output produced per second of the whole run
+        result["trace_write_bytes_per_sec"] = size / best
+        os.remove(workload.trace_file)
+        os.rmdir(os.path.dirname(workload.trace_file))
+    return result
+
+
+def run_suite(names, scale, repeat, log=sys.stderr):
+    results = {}
+    for name in names:
+        workload = WORKLOADS[name](scale)
+        result = measure(workload, repeat)
+        results[workload.name] = result
+        print(
+            f"{workload.name:<28} {result['ops_per_sec']:>14,.0f} "
+            f"{workload.unit}/sec  peak {result['peak_memory_bytes'] / 1e6:.1f} MB",
+            file=log,
+        )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "scale": scale,
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance, log=sys.stderr):
+    """Print ops/sec against the baseline; True if nothing regressed"""
+    ok = True
+    print(f"\n{'workload':<28} {'baseline':>14} {'current':>14} {'change':>8}", file=log)
+    for name, result in report["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<28} {'-':>14} {result['ops_per_sec']:>14,.0f}", file=log)
+            continue
+        change = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        flag = ""
+        if change < -tolerance:
+            flag = "  REGRESSION"
+            ok = False
+        print(
+            f"{name:<28} {before['ops_per_sec']:>14,.0f} "
+            f"{result['ops_per_sec']:>14,.0f} {change:>+8.1%}{flag}",
+            file=log,
+        )
+    if baseline["meta"].get("scale") != report["meta"]["scale"]:
+        print("Warning: baseline was recorded at a different --scale", file=log)
+    return ok
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--scale", type=float, default=1.0)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument(
+        "--only", nargs="+", choices=sorted(WORKLOADS), metavar="WORKLOAD"
+    )
+    arg_parser.add_argument("--output", metavar="FILE", help="write the JSON here")
+    arg_parser.add_argument("--save-baseline", metavar="FILE")
+    arg_parser.add_argument("--compare", metavar="FILE")
+    arg_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed ops/sec drop against the baseline (default: 0.2)",
+    )
+    args = arg_parser.parse_args(argv)
+
+    report = run_suite(args.only or list(WORKLOADS), args.scale, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(report, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
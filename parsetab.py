@@ -1,118 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'leftORleftANDleftEQNEleftLTGTLEGEleftPLUSMINUSleftTIMESDIVIDEMODULOrightNOTrightUMINUSAND ARRAY ASSIGN AT BOOL COMMA DECREMENT DIVIDE DIVIDEASSIGN ELSE EQ FALSE FLOAT FLOAT_TYPE FOR FUNCTION GE GT ID IF INCREMENT INT LBRACE LBRACKET LE LPAREN LT MINUS MINUSASSIGN MODULO NE NOT NUMBER OR PLUS PLUSASSIGN PRINT RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING STRING_TYPE TIMES TIMESASSIGN TRACE TRUE WHILEprogram : statement_liststatement_list : statement_list statement\n| statementstatement : declaration\n| assignment\n| compound_assignment\n| increment_decrement\n| if_statement\n| while_statement\n| for_statement\n| return_statement\n| print_statement\n| function_declaration\n| expression SEMICOLON\n| blockblock : LBRACE statement_list RBRACE\n| LBRACE RBRACEdeclaration : type ID ASSIGN expression SEMICOLON\n| type ID SEMICOLON\n| TRACE type ID ASSIGN expression SEMICOLON\n| TRACE type ID SEMICOLONtype : INT\n| FLOAT_TYPE\n| STRING_TYPE\n| BOOL\n| array_typearray_type : ARRAY LT type GTassignment : ID ASSIGN expression SEMICOLON\n| ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLONcompound_assignment : ID PLUSASSIGN expression SEMICOLON\n| ID MINUSASSIGN expression SEMICOLON\n| ID TIMESASSIGN expression SEMICOLON\n| ID DIVIDEASSIGN expression SEMICOLONincrement_decrement : ID INCREMENT SEMICOLON\n| ID DECREMENT SEMICOLONif_statement : IF LPAREN expression RPAREN statement\n| IF LPAREN expression RPAREN statement ELSE statementwhile_statement : WHILE LPAREN expression RPAREN statementfor_statement : FOR LPAREN for_init SEMICOLON expression SEMICOLON for_update RPAREN statementfor_init : type ID ASSIGN expression\n| ID ASSIGN expression\n|for_update : ID ASSIGN expression\n| ID PLUSASSIGN expression\n| ID MINUSASSIGN expression\n| ID TIMESASSIGN expression\n| ID DIVIDEASSIGN expression\n| ID INCREMENT\n| ID DECREMENT\n|function_declaration : FUNCTION type ID LPAREN parameter_list RPAREN block\n| FUNCTION type ID LPAREN RPAREN blockparameter_list : parameter_list COMMA parameter\n| parameterparameter : type IDreturn_statement : RETURN expression SEMICOLON\n| RETURN SEMICOLONprint_statement : PRINT LPAREN expression RPAREN SEMICOLONexpression : expression PLUS expression\n| expression MINUS expression\n| expression TIMES expression\n| expression DIVIDE expression\n| expression MODULO expression\n| expression EQ expression\n| expression NE expression\n| expression LT expression\n| expression GT expression\n| expression LE expression\n| expression GE expression\n| expression AND expression\n| expression OR expressionexpression : NOT expression\n| MINUS expression %prec UMINUSexpression : LPAREN expression RPARENexpression : NUMBERexpression : FLOATexpression : STRINGexpression : TRUE\n| FALSEexpression : IDexpression : ID AT NUMBERexpression : LBRACKET argument_list RBRACKET\n| LBRACKET RBRACKETexpression : ID LBRACKET expression RBRACKETexpression : ID LPAREN argument_list RPAREN\n| ID LPAREN RPARENargument_list : argument_list COMMA expression\n| expression'
-    
-_lr_action_items = {'TRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[18,18,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,18,-2,-14,-57,18,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,18,18,-18,-36,-38,-58,-20,18,-52,-29,-37,-51,18,-39,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,16,19,21,24,27,28,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,67,72,74,75,77,78,79,82,83,98,99,106,107,113,114,119,121,124,127,129,130,131,132,134,135,138,139,140,142,145,146,147,150,151,153,155,156,161,162,163,168,169,170,173,175,176,177,178,179,180,183,],[17,17,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,56,71,71,71,71,71,17,-22,-23,-24,-25,-26,-2,-14,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,111,71,71,120,-57,71,123,17,-17,71,-19,-34,-35,71,71,141,-56,-16,-28,-30,-31,-32,-33,71,-21,17,17,71,71,-27,-18,71,-36,-38,71,-58,165,-20,17,172,-52,-29,-37,-51,17,71,71,71,71,71,-39,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[20,20,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,20,-2,-14,-57,20,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,20,20,-18,-36,-38,-58,-20,20,-52,-29,-37,-51,20,-39,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[22,22,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,22,-2,-14,-57,22,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,22,22,-18,-36,-38,-58,-20,22,-52,-29,-37,-51,22,-39,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[23,23,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,23,-2,-14,-57,23,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,23,23,-18,-36,-38,-58,-20,23,-52,-29,-37,-51,23,-39,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[24,24,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,24,-2,-14,-57,24,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,24,24,-18,-36,-38,-58,-20,24,-52,-29,-37,-51,24,-39,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[25,25,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,25,-2,-14,-57,25,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,25,25,-18,-36,-38,-58,-20,25,-52,-29,-37,-51,25,-39,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,161,162,168,169,170,173,175,183,],[26,26,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,26,-2,-14,-57,26,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,26,26,-18,-36,-38,-58,-20,26,-52,-29,-37,-51,26,-39,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[28,28,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,28,28,28,28,28,28,-2,-14,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-57,28,28,-17,28,-19,-34,-35,28,28,-56,-16,-28,-30,-31,-32,-33,28,-21,28,28,28,28,-18,28,-36,-38,28,-58,-20,28,-52,-29,-37,-51,28,28,28,28,28,28,-39,]),'MINUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,17,19,21,24,27,28,29,30,31,32,33,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,69,70,71,72,73,74,76,77,78,80,81,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,112,113,114,115,116,117,121,122,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,146,147,148,149,150,151,152,153,154,155,160,161,162,164,168,169,170,173,175,176,177,178,179,180,183,184,185,186,187,188,],[27,27,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,44,-15,-80,27,27,27,27,27,-75,-76,-77,-78,-79,27,-2,-14,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-83,44,-80,27,44,27,44,-57,27,-73,-72,27,-17,-59,-60,-61,-62,-63,44,44,44,44,44,44,44,44,27,-19,44,44,44,44,44,44,-34,-35,-81,-86,-82,27,27,44,-74,44,-56,44,-16,44,-28,-84,-30,-31,-32,-33,-85,27,-21,44,44,27,27,27,27,-18,27,44,-84,-36,-38,44,27,44,-58,44,-20,27,44,-52,-29,-37,-51,27,27,27,27,27,27,-39,44,44,44,44,44,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,17,19,20,21,22,23,24,25,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,71,72,74,77,78,82,83,98,99,106,107,113,114,121,123,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[21,21,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,66,21,72,21,74,75,21,78,21,21,21,-2,-14,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,66,21,21,-57,21,21,-17,21,-19,-34,-35,21,21,-56,144,-16,-28,-30,-31,-32,-33,21,-21,21,21,21,21,-18,21,-36,-38,21,-58,-20,21,-52,-29,-37,-51,21,21,21,21,21,21,-39,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,65,66,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[29,29,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,29,29,29,29,29,29,-2,-14,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,108,29,29,29,-57,29,29,-17,29,-19,-34,-35,29,29,-56,-16,-28,-30,-31,-32,-33,29,-21,29,29,29,29,-18,29,-36,-38,29,-58,-20,29,-52,-29,-37,-51,29,29,29,29,29,29,-39,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[30,30,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,30,30,30,30,30,30,-2,-14,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-57,30,30,-17,30,-19,-34,-35,30,30,-56,-16,-28,-30,-31,-32,-33,30,-21,30,30,30,30,-18,30,-36,-38,30,-58,-20,30,-52,-29,-37,-51,30,30,30,30,30,30,-39,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[31,31,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,31,31,31,31,31,31,-2,-14,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-57,31,31,-17,31,-19,-34,-35,31,31,-56,-16,-28,-30,-31,-32,-33,31,-21,31,31,31,31,-18,31,-36,-38,31,-58,-20,31,-52,-29,-37,-51,31,31,31,31,31,31,-39,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[32,32,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,32,32,32,32,32,32,-2,-14,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-57,32,32,-17,32,-19,-34,-35,32,32,-56,-16,-28,-30,-31,-32,-33,32,-21,32,32,32,32,-18,32,-36,-38,32,-58,-20,32,-52,-29,-37,-51,32,32,32,32,32,32,-39,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[33,33,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,33,33,33,33,33,33,-2,-14,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-57,33,33,-17,33,-19,-34,-35,33,33,-56,-16,-28,-30,-31,-32,-33,33,-21,33,33,33,33,-18,33,-36,-38,33,-58,-20,33,-52,-29,-37,-51,33,33,33,33,33,33,-39,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,17,19,21,24,27,28,34,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,71,72,74,77,78,82,83,98,99,106,107,113,114,121,124,127,129,130,131,132,134,135,138,139,140,142,146,147,150,151,153,155,161,162,168,169,170,173,175,176,177,178,179,180,183,],[19,19,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,58,19,19,19,19,19,19,-2,-14,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,114,19,19,-57,19,19,-17,19,-19,-34,-35,19,19,-56,-16,-28,-30,-31,-32,-33,19,-21,19,19,19,19,-18,19,-36,-38,19,-58,-20,19,-52,-29,-37,-51,19,19,19,19,19,19,-39,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,138,139,146,150,151,155,158,161,162,166,168,169,170,173,175,183,],[34,34,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,34,-2,-14,-57,34,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,34,34,-18,-36,-38,-58,34,-20,34,34,-52,-29,-37,-51,34,-39,]),'INT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,41,42,75,77,82,83,84,99,106,107,121,124,127,129,130,131,132,135,138,139,144,146,150,151,155,161,162,167,168,169,170,173,175,183,],[35,35,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,35,35,35,-2,-14,35,-57,35,-17,35,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,35,35,35,-18,-36,-38,-58,-20,35,35,-52,-29,-37,-51,35,-39,]),'FLOAT_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,41,42,75,77,82,83,84,99,106,107,121,124,127,129,130,131,132,135,138,139,144,146,150,151,155,161,162,167,168,169,170,173,175,183,],[36,36,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,36,36,36,-2,-14,36,-57,36,-17,36,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,36,36,36,-18,-36,-38,-58,-20,36,36,-52,-29,-37,-51,36,-39,]),'STRING_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,41,42,75,77,82,83,84,99,106,107,121,124,127,129,130,131,132,135,138,139,144,146,150,151,155,161,162,167,168,169,170,173,175,183,],[37,37,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,37,37,37,-2,-14,37,-57,37,-17,37,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,37,37,37,-18,-36,-38,-58,-20,37,37,-52,-29,-37,-51,37,-39,]),'BOOL':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,41,42,75,77,82,83,84,99,106,107,121,124,127,129,130,131,132,135,138,139,144,146,150,151,155,161,162,167,168,169,170,173,175,183,],[38,38,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,38,38,38,-2,-14,38,-57,38,-17,38,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,38,38,38,-18,-36,-38,-58,-20,38,38,-52,-29,-37,-51,38,-39,]),'ARRAY':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,41,42,75,77,82,83,84,99,106,107,121,124,127,129,130,131,132,135,138,139,144,146,150,151,155,161,162,167,168,169,170,173,175,183,],[40,40,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,40,40,40,-2,-14,40,-57,40,-17,40,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,40,40,40,-18,-36,-38,-58,-20,40,40,-52,-29,-37,-51,40,-39,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,15,41,42,77,83,99,106,107,121,124,127,129,130,131,132,135,146,150,151,155,161,168,169,170,173,183,],[0,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,-2,-14,-57,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,-18,-36,-38,-58,-20,-52,-29,-37,-51,-39,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,15,34,41,42,77,82,83,99,106,107,121,124,127,129,130,131,132,135,146,150,151,155,161,168,169,170,173,183,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,83,-2,-14,-57,124,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,-18,-36,-38,-58,-20,-52,-29,-37,-51,-39,]),'ELSE':([4,5,6,7,8,9,10,11,12,13,15,42,77,83,99,106,107,121,124,127,129,130,131,132,135,146,150,151,155,161,168,169,170,173,183,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,-14,-57,-17,-19,-34,-35,-56,-16,-28,-30,-31,-32,-33,-21,-18,162,-38,-58,-20,-52,-29,-37,-51,-39,]),'SEMICOLON':([14,17,24,29,30,31,32,33,56,63,64,69,71,75,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,102,103,104,105,108,110,111,112,116,118,126,128,133,143,148,149,152,154,160,164,],[42,-80,77,-75,-76,-77,-78,-79,99,106,107,-83,-80,-42,121,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,127,129,130,131,132,-81,-86,135,-82,-74,140,146,-84,-85,155,161,-84,163,-41,169,-40,]),'PLUS':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[43,-80,-75,-76,-77,-78,-79,-83,43,-80,43,43,-73,-72,-59,-60,-61,-62,-63,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-81,-86,-82,43,-74,43,43,43,-84,-85,43,43,43,-84,43,43,43,43,43,43,43,43,43,]),'TIMES':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[45,-80,-75,-76,-77,-78,-79,-83,45,-80,45,45,-73,-72,45,45,-61,-62,-63,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-81,-86,-82,45,-74,45,45,45,-84,-85,45,45,45,-84,45,45,45,45,45,45,45,45,45,]),'DIVIDE':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[46,-80,-75,-76,-77,-78,-79,-83,46,-80,46,46,-73,-72,46,46,-61,-62,-63,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-81,-86,-82,46,-74,46,46,46,-84,-85,46,46,46,-84,46,46,46,46,46,46,46,46,46,]),'MODULO':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[47,-80,-75,-76,-77,-78,-79,-83,47,-80,47,47,-73,-72,47,47,-61,-62,-63,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-81,-86,-82,47,-74,47,47,47,-84,-85,47,47,47,-84,47,47,47,47,47,47,47,47,47,]),'EQ':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[48,-80,-75,-76,-77,-78,-79,-83,48,-80,48,48,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,48,48,48,48,48,48,48,48,-81,-86,-82,48,-74,48,48,48,-84,-85,48,48,48,-84,48,48,48,48,48,48,48,48,48,]),'NE':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[49,-80,-75,-76,-77,-78,-79,-83,49,-80,49,49,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,49,49,49,49,49,49,49,49,-81,-86,-82,49,-74,49,49,49,-84,-85,49,49,49,-84,49,49,49,49,49,49,49,49,49,]),'LT':([14,17,29,30,31,32,33,40,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[50,-80,-75,-76,-77,-78,-79,84,-83,50,-80,50,50,-73,-72,-59,-60,-61,-62,-63,50,50,-66,-67,-68,-69,50,50,50,50,50,50,50,50,-81,-86,-82,50,-74,50,50,50,-84,-85,50,50,50,-84,50,50,50,50,50,50,50,50,50,]),'GT':([14,17,29,30,31,32,33,35,36,37,38,39,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,125,126,128,133,136,137,145,148,149,152,154,160,164,184,185,186,187,188,],[51,-80,-75,-76,-77,-78,-79,-22,-23,-24,-25,-26,-83,51,-80,51,51,-73,-72,-59,-60,-61,-62,-63,51,51,-66,-67,-68,-69,51,51,51,51,51,51,51,51,-81,-86,-82,51,-74,51,51,145,51,-84,-85,51,51,-27,51,-84,51,51,51,51,51,51,51,51,51,]),'LE':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[52,-80,-75,-76,-77,-78,-79,-83,52,-80,52,52,-73,-72,-59,-60,-61,-62,-63,52,52,-66,-67,-68,-69,52,52,52,52,52,52,52,52,-81,-86,-82,52,-74,52,52,52,-84,-85,52,52,52,-84,52,52,52,52,52,52,52,52,52,]),'GE':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[53,-80,-75,-76,-77,-78,-79,-83,53,-80,53,53,-73,-72,-59,-60,-61,-62,-63,53,53,-66,-67,-68,-69,53,53,53,53,53,53,53,53,-81,-86,-82,53,-74,53,53,53,-84,-85,53,53,53,-84,53,53,53,53,53,53,53,53,53,]),'AND':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[54,-80,-75,-76,-77,-78,-79,-83,54,-80,54,54,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,54,54,54,54,54,54,54,-81,-86,-82,54,-74,54,54,54,-84,-85,54,54,54,-84,54,54,54,54,54,54,54,54,54,]),'OR':([14,17,29,30,31,32,33,69,70,71,73,76,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,108,110,112,115,116,117,122,126,128,133,136,137,148,149,152,154,160,164,184,185,186,187,188,],[55,-80,-75,-76,-77,-78,-79,-83,55,-80,55,55,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,55,55,55,55,55,55,-81,-86,-82,55,-74,55,55,55,-84,-85,55,55,55,-84,55,55,55,55,55,55,55,55,55,]),'ASSIGN':([17,56,111,120,128,141,172,],[57,98,134,142,147,153,176,]),'PLUSASSIGN':([17,172,],[59,177,]),'MINUSASSIGN':([17,172,],[60,178,]),'TIMESASSIGN':([17,172,],[61,179,]),'DIVIDEASSIGN':([17,172,],[62,180,]),'INCREMENT':([17,172,],[63,181,]),'DECREMENT':([17,172,],[64,182,]),'AT':([17,71,],[65,65,]),'RBRACKET':([19,29,30,31,32,33,68,69,70,71,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,101,108,110,112,116,133,136,137,149,],[69,-75,-76,-77,-78,-79,112,-83,-88,-80,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,128,-81,-86,-82,-74,-85,-87,149,-84,]),'COMMA':([29,30,31,32,33,68,69,70,71,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,108,109,110,112,116,133,136,149,157,159,165,174,],[-75,-76,-77,-78,-79,113,-83,-88,-80,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-81,113,-86,-82,-74,-85,-87,-84,167,-54,-55,-53,]),'RPAREN':([29,30,31,32,33,66,69,70,71,73,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,108,109,110,112,115,116,117,122,133,136,144,149,157,159,163,165,171,174,181,182,184,185,186,187,188,],[-75,-76,-77,-78,-79,110,-83,-88,-80,116,-73,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-81,133,-86,-82,138,-74,139,143,-85,-87,158,-84,166,-54,-50,-55,175,-53,-48,-49,-43,-44,-45,-46,-47,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,34,],[2,82,]),'statement':([0,2,34,82,138,139,162,175,],[3,41,3,41,150,151,170,183,]),'declaration':([0,2,34,82,138,139,162,175,],[4,4,4,4,4,4,4,4,]),'assignment':([0,2,34,82,138,139,162,175,],[5,5,5,5,5,5,5,5,]),'compound_assignment':([0,2,34,82,138,139,162,175,],[6,6,6,6,6,6,6,6,]),'increment_decrement':([0,2,34,82,138,139,162,175,],[7,7,7,7,7,7,7,7,]),'if_statement':([0,2,34,82,138,139,162,175,],[8,8,8,8,8,8,8,8,]),'while_statement':([0,2,34,82,138,139,162,175,],[9,9,9,9,9,9,9,9,]),'for_statement':([0,2,34,82,138,139,162,175,],[10,10,10,10,10,10,10,10,]),'return_statement':([0,2,34,82,138,139,162,175,],[11,11,11,11,11,11,11,11,]),'print_statement':([0,2,34,82,138,139,162,175,],[12,12,12,12,12,12,12,12,]),'function_declaration':([0,2,34,82,138,139,162,175,],[13,13,13,13,13,13,13,13,]),'expression':([0,2,19,21,24,27,28,34,43,44,45,46,47,48,49,50,51,52,53,54,55,57,58,59,60,61,62,66,72,74,78,82,98,113,114,134,138,139,140,142,147,153,162,175,176,177,178,179,180,],[14,14,70,73,76,80,81,14,85,86,87,88,89,90,91,92,93,94,95,96,97,100,101,102,103,104,105,70,115,117,122,14,126,136,137,148,14,14,152,154,160,164,14,14,184,185,186,187,188,]),'block':([0,2,34,82,138,139,158,162,166,175,],[15,15,15,15,15,15,168,15,173,15,]),'type':([0,2,18,26,34,75,82,84,138,139,144,162,167,175,],[16,16,67,79,16,119,16,125,16,16,156,16,156,16,]),'array_type':([0,2,18,26,34,75,82,84,138,139,144,162,167,175,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'argument_list':([19,66,],[68,109,]),'for_init':([75,],[118,]),'parameter_list':([144,],[157,]),'parameter':([144,167,],[159,174,]),'for_update':([163,],[171,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','tracelang_parser.py',20),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','tracelang_parser.py',25),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','tracelang_parser.py',26),
-  ('statement -> declaration','statement',1,'p_statement','tracelang_parser.py',34),
-  ('statement -> assignment','statement',1,'p_statement','tracelang_parser.py',35),
-  ('statement -> compound_assignment','statement',1,'p_statement','tracelang_parser.py',36),
-  ('statement -> increment_decrement','statement',1,'p_statement','tracelang_parser.py',37),
-  ('statement -> if_statement','statement',1,'p_statement','tracelang_parser.py',38),
-  ('statement -> while_statement','statement',1,'p_statement','tracelang_parser.py',39),
-  ('statement -> for_statement','statement',1,'p_statement','tracelang_parser.py',40),
-  ('statement -> return_statement','statement',1,'p_statement','tracelang_parser.py',41),
-  ('statement -> print_statement','statement',1,'p_statement','tracelang_parser.py',42),
-  ('statement -> function_declaration','statement',1,'p_statement','tracelang_parser.py',43),
-  ('statement -> expression SEMICOLON','statement',2,'p_statement','tracelang_parser.py',44),
-  ('statement -> block','statement',1,'p_statement','tracelang_parser.py',45),
-  ('block -> LBRACE statement_list RBRACE','block',3,'p_block','tracelang_parser.py',50),
-  ('block -> LBRACE RBRACE','block',2,'p_block','tracelang_parser.py',51),
-  ('declaration -> type ID ASSIGN expression SEMICOLON','declaration',5,'p_declaration','tracelang_parser.py',60),
-  ('declaration -> type ID SEMICOLON','declaration',3,'p_declaration','tracelang_parser.py',61),
-  ('declaration -> TRACE type ID ASSIGN expression SEMICOLON','declaration',6,'p_declaration','tracelang_parser.py',62),
-  ('declaration -> TRACE type ID SEMICOLON','declaration',4,'p_declaration','tracelang_parser.py',63),
-  ('type -> INT','type',1,'p_type','tracelang_parser.py',75),
-  ('type -> FLOAT_TYPE','type',1,'p_type','tracelang_parser.py',76),
-  ('type -> STRING_TYPE','type',1,'p_type','tracelang_parser.py',77),
-  ('type -> BOOL','type',1,'p_type','tracelang_parser.py',78),
-  ('type -> array_type','type',1,'p_type','tracelang_parser.py',79),
-  ('array_type -> ARRAY LT type GT','array_type',4,'p_array_type','tracelang_parser.py',84),
-  ('assignment -> ID ASSIGN expression SEMICOLON','assignment',4,'p_assignment','tracelang_parser.py',90),
-  ('assignment -> ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLON','assignment',7,'p_assignment','tracelang_parser.py',91),
-  ('compound_assignment -> ID PLUSASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',99),
-  ('compound_assignment -> ID MINUSASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',100),
-  ('compound_assignment -> ID TIMESASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',101),
-  ('compound_assignment -> ID DIVIDEASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',102),
-  ('increment_decrement -> ID INCREMENT SEMICOLON','increment_decrement',3,'p_increment_decrement','tracelang_parser.py',107),
-  ('increment_decrement -> ID DECREMENT SEMICOLON','increment_decrement',3,'p_increment_decrement','tracelang_parser.py',108),
-  ('if_statement -> IF LPAREN expression RPAREN statement','if_statement',5,'p_if_statement','tracelang_parser.py',114),
-  ('if_statement -> IF LPAREN expression RPAREN statement ELSE statement','if_statement',7,'p_if_statement','tracelang_parser.py',115),
-  ('while_statement -> WHILE LPAREN expression RPAREN statement','while_statement',5,'p_while_statement','tracelang_parser.py',123),
-  ('for_statement -> FOR LPAREN for_init SEMICOLON expression SEMICOLON for_update RPAREN statement','for_statement',9,'p_for_statement','tracelang_parser.py',128),
-  ('for_init -> type ID ASSIGN expression','for_init',4,'p_for_init','tracelang_parser.py',133),
-  ('for_init -> ID ASSIGN expression','for_init',3,'p_for_init','tracelang_parser.py',134),
-  ('for_init -> <empty>','for_init',0,'p_for_init','tracelang_parser.py',135),
-  ('for_update -> ID ASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',147),
-  ('for_update -> ID PLUSASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',148),
-  ('for_update -> ID MINUSASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',149),
-  ('for_update -> ID TIMESASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',150),
-  ('for_update -> ID DIVIDEASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',151),
-  ('for_update -> ID INCREMENT','for_update',2,'p_for_update','tracelang_parser.py',152),
-  ('for_update -> ID DECREMENT','for_update',2,'p_for_update','tracelang_parser.py',153),
-  ('for_update -> <empty>','for_update',0,'p_for_update','tracelang_parser.py',154),
-  ('function_declaration -> FUNCTION type ID LPAREN parameter_list RPAREN block','function_declaration',7,'p_function_declaration','tracelang_parser.py',170),
-  ('function_declaration -> FUNCTION type ID LPAREN RPAREN block','function_declaration',6,'p_function_declaration','tracelang_parser.py',171),
-  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','tracelang_parser.py',179),
-  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','tracelang_parser.py',180),
-  ('parameter -> type ID','parameter',2,'p_parameter','tracelang_parser.py',188),
-  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','tracelang_parser.py',193),
-  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','tracelang_parser.py',194),
-  ('print_statement -> PRINT LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','tracelang_parser.py',202),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','tracelang_parser.py',208),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','tracelang_parser.py',209),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','tracelang_parser.py',210),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','tracelang_parser.py',211),
-  ('expression -> expression MODULO expression','expression',3,'p_expression_binop','tracelang_parser.py',212),
-  ('expression -> expression EQ expression','expression',3,'p_expression_binop','tracelang_parser.py',213),
-  ('expression -> expression NE expression','expression',3,'p_expression_binop','tracelang_parser.py',214),
-  ('expression -> expression LT expression','expression',3,'p_expression_binop','tracelang_parser.py',215),
-  ('expression -> expression GT expression','expression',3,'p_expression_binop','tracelang_parser.py',216),
-  ('expression -> expression LE expression','expression',3,'p_expression_binop','tracelang_parser.py',217),
-  ('expression -> expression GE expression','expression',3,'p_expression_binop','tracelang_parser.py',218),
-  ('expression -> expression AND expression','expression',3,'p_expression_binop','tracelang_parser.py',219),
-  ('expression -> expression OR expression','expression',3,'p_expression_binop','tracelang_parser.py',220),
-  ('expression -> NOT expression','expression',2,'p_expression_unary','tracelang_parser.py',225),
-  ('expression -> MINUS expression','expression',2,'p_expression_unary','tracelang_parser.py',226),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','tracelang_parser.py',231),
-  ('expression -> NUMBER','expression',1,'p_expression_number','tracelang_parser.py',236),
-  ('expression -> FLOAT','expression',1,'p_expression_float','tracelang_parser.py',241),
-  ('expression -> STRING','expression',1,'p_expression_string','tracelang_parser.py',246),
-  ('expression -> TRUE','expression',1,'p_expression_bool','tracelang_parser.py',251),
-  ('expression -> FALSE','expression',1,'p_expression_bool','tracelang_parser.py',252),
-  ('expression -> ID','expression',1,'p_expression_id','tracelang_parser.py',257),
-  ('expression -> ID AT NUMBER','expression',3,'p_expression_trace_access','tracelang_parser.py',262),
-  ('expression -> LBRACKET argument_list RBRACKET','expression',3,'p_expression_array_literal','tracelang_parser.py',267),
-  ('expression -> LBRACKET RBRACKET','expression',2,'p_expression_array_literal','tracelang_parser.py',268),
-  ('expression -> ID LBRACKET expression RBRACKET','expression',4,'p_expression_array_access','tracelang_parser.py',276),
-  ('expression -> ID LPAREN argument_list RPAREN','expression',4,'p_expression_function_call','tracelang_parser.py',281),
-  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_function_call','tracelang_parser.py',282),
-  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','tracelang_parser.py',290),
-  ('argument_list -> expression','argument_list',1,'p_argument_list','tracelang_parser.py',291),
-]
@@ -0,0 +1,52 @@
+"""Running TraceLang source in tests"""
+import contextlib
+import glob
+import io
+import os
+
+from tracelang_astcache import parse
+from tracelang_compiler import execute
+from tracelang_interpreter import TraceSystem
+from tracelang_optimizer import optimize
+
+ENGINES = ("closure", "tree", "vm")
+
+EXAMPLES = sorted(
+    glob.glob(
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "*.tl")
+    )
+)
+
+
+def run_source(source, engine="closure", trace_system=None):
+    """Run a program, returning what it printed and its TraceSystem"""
+    ast, clean = parse(source)
+    assert clean, "source does not parse"
+    if trace_system is None:
+        trace_system = TraceSystem()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        execute(ast, trace_system, {}, engine)
+    return output.getvalue(), trace_system
+
+
+def run_example(path, engine, optimized=False):
+    """Output, error, trace lines and final values of an example"""
+    with open(path, encoding="utf-8") as f:
+        ast, _ = parse(f.read())
+    if optimized:
+        ast, _ = optimize(ast)
+    trace_system = TraceSystem()
+    output = io.StringIO()
+    error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            execute(ast, trace_system, {}, engine)
+        except Exception as e:  # Some examples end on a runtime error
+            error = repr(e)
+    return (
+        output.getvalue(),
+        error,
+        list(trace_system.trace_lines()),
+        list(trace_system.final_values()),
+    )
@@ -0,0 +1,121 @@
+import pytest
+from helpers import ENGINES, run_source
+
+from tracelang_history import ArrayVersions
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_fill_records_a_version(engine):
+    _, trace_system = run_source(
+        """
+        trace array<int> a = [1, 2, 3];
+        fill(a, 7);
+        a[0] = 0;
+        """,
+        engine,
+    )
+    assert list(trace_system.trace_lines())[1] == "Main@1 a [7, 7, 7]"
+    assert list(trace_system.history("a")) == [[1, 2, 3], [7, 7, 7], [0, 7, 7]]
+    assert dict(trace_system.final_values()) == {"a": [0, 7, 7]}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_write_through_a_parameter_is_recorded(engine):
+    _, trace_system = run_source(
+        """
+        trace array<int> a = [1, 2, 3];
+        function int set(array<int> values, int i) {
+            values[i] = 9;
+            fill(values, 4);
+        }
+        set(a, 1);
+        array<int> b = [5, 6];
+        set(b, 0);
+        """,
+        engine,
+    )
+    assert list(trace_system.trace_lines()) == [
+        "Main -> a [1, 2, 3]",
+        "Main -> Set@1 a[1] 9",
+        "Main -> Set@2 a [4, 4, 4]",
+    ]
+    assert trace_system.history_at("a", 1) == [1, 9, 3]
+    assert dict(trace_system.final_values()) == {"a": [4, 4, 4]}
+
+
+def test_versions_share_unchanged_elements():
+    history = ArrayVersions()
+    values = list(range(1000))
+    history.append(values)
+    for i in range(5):
+        values[i] = -i
+        history.write(values, i)
+    # Writes are kept as (index, value) entries, not whole copies
+    assert sum(type(entry) is not tuple for entry in history.entries) == 1
+    assert history[0] == list(range(1000))
+    assert history[3][:5] == [0, -1, -2, 3, 4]
+    values[0] = 99  # Not recorded: earlier versions are unaffected
+    assert history[5][0] == 0
+    bounded = ArrayVersions(2)
+    for version in ([1], [2], [3]):
+        bounded.append(version)
+    assert bounded.first_index == 1 and list(bounded) == [[2], [3]]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_float_arrays_hold_floats(engine):
+    output, _ = run_source(
+        """
+        array<float> typed = [1.5, 2.5];
+        typed[0] = 3;
+        print(typed);
+        array<float> mixed = [1, 2.5];
+        print(mixed);
+        mixed = [1, 2];
+        print(mixed);
+        """,
+        engine,
+    )
+    assert output == "[3.0, 2.5]\n[1.0, 2.5]\n[1.0, 2.0]\n"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_operators_follow_the_declared_type(engine):
+    output, _ = run_source(
+        """
+        function array<float> scale(array<float> v) {
+            return v * 2;
+        }
+        function array<int> ones() {
+            return [1, 1];
+        }
+        array<int> a = [1, 2, 3];
+        print(a + a);
+        a = [1, 2, 3];
+        print(a + a);
+        a += [1, 1, 1];
+        print(a + a);
+        array<float> f = [1, 2.5];
+        print(f + f);
+        print(scale([1, 2]));
+        print(ones() + ones());
+        array<string> words = ["a", "b"];
+        print(words + words);
+        """,
+        engine,
+    )
+    assert output.splitlines() == [
+        "[2, 4, 6]",
+        "[2, 4, 6]",
+        "[4, 6, 8]",
+        "[2.0, 5.0]",
+        "[2.0, 4.0]",
+        "[2, 2]",
+        "['a', 'b', 'a', 'b']",
+    ]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_int_array_rejects_floats(engine):
+    with pytest.raises(TypeError, match="array<int> cannot hold a float"):
+        run_source("array<int> a = [1, 2]; a = [1.5];", engine)
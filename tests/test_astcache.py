@@ -0,0 +1,32 @@
+from tracelang_astcache import cache_path, load_ast, parse
+
+
+def test_entries_follow_the_source(tmp_path):
+    source_file = str(tmp_path / "prog.tl")
+    code = "int x = 1;\nprint(x);\n"
+    ast = load_ast(source_file, code)
+    assert ast == parse(code)[0]
+    path = cache_path(source_file)
+    entry = open(path, "rb").read()
+    assert load_ast(source_file, code) == ast
+    assert open(path, "rb").read() == entry  # A hit leaves the entry alone
+    changed = "int x = 2;\nprint(x);\n"
+    assert load_ast(source_file, changed) == parse(changed)[0]
+    assert open(path, "rb").read() != entry
+
+
+def test_corrupt_entries_are_parsed_again(tmp_path):
+    source_file = str(tmp_path / "prog.tl")
+    code = "print(1);\n"
+    load_ast(source_file, code)
+    path = cache_path(source_file)
+    with open(path, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 2)
+    assert load_ast(source_file, code) == parse(code)[0]
+
+
+def test_programs_with_errors_are_not_cached(tmp_path, capsys):
+    source_file = str(tmp_path / "prog.tl")
+    load_ast(source_file, "print(1) print(2);\n")
+    assert "Syntax error" in capsys.readouterr().out
+    assert not (tmp_path / "__tlcache__" / "prog.tl.ast").exists()
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+from tracelang_batch import trace_paths
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_trace_files_never_clash():
+    assert trace_paths(["a/demo.tl", "b/demo.tl", "demo.tl"], "out", ".txt") == [
+        os.path.join("out", "demo.txt"),
+        os.path.join("out", "demo-2.txt"),
+        os.path.join("out", "demo-3.txt"),
+    ]
+
+
+def test_batch_prints_jobs_in_order(tmp_path):
+    for directory, value in (("a", 1), ("b", 2)):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "demo.tl").write_text(
+            f"trace int x = {value}; print(x);\n", encoding="utf-8"
+        )
+    (tmp_path / "bad.tl").write_text("print(missing);\n", encoding="utf-8")
+    result = subprocess.run(
+        [
+            sys.executable,
+            os.path.join(ROOT, "tracelang_batch.py"),
+            "--jobs",
+            "2",
+            "--no-ast-cache",
+            "a/demo.tl",
+            "bad.tl",
+            "b/demo.tl",
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1
+    headers = [line for line in result.stdout.splitlines() if line.startswith("==>")]
+    assert headers == ["==> a/demo.tl <==", "==> bad.tl <==", "==> b/demo.tl <=="]
+    assert "1 failed" in result.stderr
+    traces = tmp_path / "traces"
+    assert (traces / "demo.txt").read_text(encoding="utf-8").endswith("\nx: 1\n")
+    assert (traces / "demo-2.txt").read_text(encoding="utf-8").endswith("\nx: 2\n")
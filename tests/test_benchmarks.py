@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUITE = os.path.join(ROOT, "benchmarks", "suite.py")
+
+
+def run_suite(*args, cwd):
+    return subprocess.run(
+        [sys.executable, SUITE, "--scale", "0.001", "--repeat", "1", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_every_workload_runs(tmp_path):
+    result = run_suite("--output", "results.json", cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    report = json.loads((tmp_path / "results.json").read_text(encoding="utf-8"))
+    assert report["meta"]["scale"] == 0.001
+    for name, workload in report["results"].items():
+        assert workload["ops"] > 0 and workload["ops_per_sec"] > 0, name
+    # Traced workloads remove their trace files
+    assert sorted(os.listdir(tmp_path)) == ["results.json"]
+
+
+def test_compare_reports_regressions(tmp_path):
+    baseline = {
+        "meta": {"scale": 0.001},
+        "results": {"parse": {"ops_per_sec": 1e15}},
+    }
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline), encoding="utf-8")
+    result = run_suite("--only", "parse", "--compare", "baseline.json", cwd=tmp_path)
+    assert result.returncode == 1
+    assert "REGRESSION" in result.stderr
@@ -0,0 +1,42 @@
+import pytest
+from helpers import ENGINES, run_source
+
+from tracelang_astcache import parse
+from tracelang_memo import pure_functions
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_functions_shadow_builtins(engine):
+    output, _ = run_source(
+        """
+        print(max([1, 5, 2]));
+        function int max(int a, int b) {
+            if (a > b) {
+                return a;
+            }
+            return b;
+        }
+        print(max(3, 4));
+        """,
+        engine,
+    )
+    assert output == "5\n4\n"
+
+
+def test_shadowing_function_decides_purity():
+    ast, _ = parse(
+        """
+        int calls = 0;
+        function int sum(int a) {
+            calls++;
+            return a;
+        }
+        function int twice(int a) {
+            return sum(a) * 2;
+        }
+        function int longest(array<int> a) {
+            return max(a) * 2;
+        }
+        """
+    )
+    assert pure_functions(ast) == {"longest"}
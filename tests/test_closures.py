@@ -0,0 +1,9 @@
+import os
+
+import pytest
+from helpers import EXAMPLES, run_example
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=os.path.basename)
+def test_closures_run_examples_like_the_interpreter(path):
+    assert run_example(path, "closure") == run_example(path, "tree")
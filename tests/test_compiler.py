@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs a program through the command line's entry point, then reports
+# whether PLY was loaded
+RUN = """
+import sys
+from tracelang_compiler import main
+main([sys.argv[1]])
+print("ply" in sys.modules, "ply.lex" in sys.modules)
+"""
+
+
+def run_reporting_ply(path, cwd):
+    result = subprocess.run(
+        [sys.executable, "-c", RUN, str(path)],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.splitlines()
+
+
+def test_ast_cache_hit_does_not_load_ply(tmp_path):
+    path = tmp_path / "hello.tl"
+    path.write_text('print("hello");\n', encoding="utf-8")
+    assert run_reporting_ply(path, tmp_path) == ["hello", "True True"]
+    # The AST now comes from the cache
+    assert run_reporting_ply(path, tmp_path) == ["hello", "False False"]
@@ -0,0 +1,87 @@
+import pytest
+from helpers import ENGINES, run_source
+
+from tracelang_interpreter import MAX_CONTEXTS
+
+DEEP = """
+trace int bottom = 0;
+function int down(int n) {
+    if (n == 0) {
+        bottom = 1;
+        return 0;
+    }
+    return down(n - 1);
+}
+down(%d);
+"""
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_trace_lines_name_the_call_path(engine):
+    _, trace_system = run_source(DEEP % 3, engine)
+    assert list(trace_system.trace_lines()) == [
+        "Main -> bottom 0",
+        "Main -> Down -> Down -> Down -> Down@1 bottom 1",
+    ]
+
+
+def test_deep_recursion_releases_its_contexts():
+    depth = MAX_CONTEXTS * 2
+    _, trace_system = run_source(DEEP % depth, "vm")
+    assert trace_system.context_count <= MAX_CONTEXTS
+    _, line = trace_system.trace_lines()
+    assert line == "Main" + " -> Down" * (depth + 1) + "@1 bottom 1"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_within_policy_follows_the_call_path(engine):
+    _, trace_system = run_source(
+        """
+        trace(within=b) int x = 0;
+        function int a(int n) {
+            x = n;
+            if (n > 0) {
+                return b(n - 1);
+            }
+            return 0;
+        }
+        function int b(int n) {
+            x = n;
+            return a(n);
+        }
+        a(2);
+        x = 5;
+        a(1);
+        """,
+        engine,
+    )
+    # Kept only below a call of b(): a(2) and the two at Main are not
+    assert list(trace_system.history("x")) == [1, 1, 0, 0, 0, 0]
+    main = trace_system.context_stack[0]
+    assert main.within == {frozenset(["B"]): False}
+
+
+def test_names_are_built_only_for_traced_contexts():
+    _, trace_system = run_source(
+        """
+        trace int x = 0;
+        function int quiet(int n) {
+            return n;
+        }
+        function int loud(int n) {
+            x = quiet(n);
+            return 0;
+        }
+        loud(1);
+        loud(2);
+        """
+    )
+    main = trace_system.context_stack[0]
+    loud = main.children
+    assert loud.func_name == "Loud" and loud.children.func_name == "Quiet"
+    # Records keep the context, formatted only when the lines are written
+    assert trace_system.trace_output[-1][0] is loud
+    assert loud.name is None
+    assert list(trace_system.trace_lines())[-1] == "Main -> Loud@2 x 2"
+    assert loud.name == "Main -> Loud"
+    assert loud.children.name is None
@@ -0,0 +1,39 @@
+import glob
+import os
+
+import pytest
+import tracelang_fastlex
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples")
+
+EDGE_CASES = [
+    "",
+    "\n\n\n",
+    'string s = "a\\n\\t\\"b\\\\";',
+    'print("\\\\n is not a newline");',
+    'print("unknown \\q escape");',
+    'string s = "unterminated',
+    "int x = 1 $ 2;\n# ? `",
+    "float f = 1.5 + 10.25 - 3.;",
+    "x<=y>=z==w!=v&&u||!t",
+    "a+=1;b-=2;c*=3;d/=4;e++;f--;",
+    "trace(history=3, every=2) int x@-1;",
+    "// only a comment",
+    "int x = 1; // trailing comment\nx = 2;",
+    "\t\r\n  if (x) {\r\n}\r\n",
+    "arrayx array<int> functional function",
+]
+
+
+@pytest.mark.parametrize(
+    "path", sorted(glob.glob(os.path.join(EXAMPLES, "*.tl"))), ids=os.path.basename
+)
+def test_lexers_agree_on_example(path):
+    with open(path) as f:
+        code = f.read()
+    assert tracelang_fastlex.first_difference(code) is None
+
+
+@pytest.mark.parametrize("code", EDGE_CASES)
+def test_lexers_agree_on_edge_case(code):
+    assert tracelang_fastlex.first_difference(code) is None
@@ -0,0 +1,153 @@
+import pytest
+from helpers import ENGINES, run_source
+from tracelang_history import HistoryEvicted, RingHistory, new_history
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_hist_builtins_agree_on_a_bounded_history(engine):
+    output, _ = run_source(
+        """
+        trace(3) int x = 0;
+        for (int i = 1; i <= 5; i++) {
+            x = i;
+        }
+        print(hist_len(x));
+        print(hist_sum(x));
+        print(hist_avg(x));
+        print(x@(1 - hist_len(x)));
+        """,
+        engine,
+    )
+    # 0, 1 and 2 have been evicted
+    assert output == "3\n12\n4.0\n3\n"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_hist_builtins_on_an_unbounded_history(engine):
+    output, _ = run_source(
+        """
+        trace int x = 0;
+        for (int i = 1; i <= 5; i++) {
+            x = i;
+        }
+        print(hist_len(x));
+        print(hist_avg(x) == hist_sum(x) / hist_len(x));
+        """,
+        engine,
+    )
+    assert output == "6\nTrue\n"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_functions_shadow_hist_builtins(engine):
+    output, _ = run_source(
+        """
+        trace int x = 4;
+        print(hist_len(x));
+        function int hist_len(int n) {
+            return n * 10;
+        }
+        print(hist_len(x));
+        """,
+        engine,
+    )
+    assert output == "1\n40\n"
+
+
+@pytest.mark.parametrize("var_type", ["int", "string", ("array_type", "int")])
+def test_new_history_rejects_a_zero_capacity(var_type):
+    with pytest.raises(ValueError, match="History capacity must be at least 1"):
+        new_history(0, var_type)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "declaration",
+    ["trace(history=0) int x = 1;", "trace(history=-2) array<int> x = [1];"],
+)
+def test_history_option_must_be_positive(engine, declaration):
+    with pytest.raises(TypeError, match="history of 'x' must be a positive integer"):
+        run_source(declaration, engine)
+
+
+def test_ring_history_keeps_the_last_values():
+    history = RingHistory(3)
+    for value in range(5):
+        history.append(value)
+    assert len(history) == 5
+    assert history.first_index == 2
+    assert list(history) == [2, 3, 4]
+    assert history[-1] == 4
+    with pytest.raises(HistoryEvicted, match="keeping 2-4"):
+        history[1]
+
+
+def test_numeric_histories_are_unboxed():
+    history = new_history(None, "int")
+    for value in (1, 2, 3):
+        history.append(value)
+    view = history.export()
+    assert view.format == "q"
+    assert view.tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("value", [True, 2.5, 2**70])
+def test_int_history_falls_back_to_a_list(value):
+    history = new_history(None, "int")
+    history.append(1)
+    history.append(value)
+    # Read back exactly as stored
+    assert list(history) == [1, value]
+    assert type(history[-1]) is type(value)
+    assert history.export() is None
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_history_export_through_the_trace_system(engine):
+    _, trace_system = run_source(
+        'trace float f = 0.5; f = f * 3; trace string s = "a";', engine
+    )
+    assert trace_system.export_history("f").tolist() == [0.5, 1.5]
+    assert trace_system.export_history("s") is None
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_every_and_when_pick_the_updates_kept(engine):
+    _, trace_system = run_source(
+        """
+        trace(every=3) int ticks = 0;
+        trace(when=v % 2 == 0) int v = 0;
+        for (int i = 1; i <= 7; i++) {
+            ticks = i;
+            v = i;
+        }
+        """,
+        engine,
+    )
+    assert list(trace_system.history("ticks")) == [0, 3, 6]
+    assert list(trace_system.history("v")) == [0, 2, 4, 6]
+    # The footer shows the last value kept, not the last one assigned
+    assert dict(trace_system.final_values()) == {"ticks": 6, "v": 6}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_history_indices_count_from_either_end(engine):
+    output, _ = run_source(
+        """
+        trace int x = 10;
+        for (int i = 1; i <= 4; i++) {
+            x = x + i;
+        }
+        int back = 2;
+        print(x@0 + " " + x@-1 + " " + x@(-back) + " " + x@(hist_len(x) - 1));
+        """,
+        engine,
+    )
+    # x went 10, 11, 13, 16, 20
+    assert output == "10 16 13 20\n"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_history_indices_out_of_range(engine):
+    with pytest.raises(IndexError, match=r"History index -2 out of range .*\(0-1\)"):
+        run_source("trace int x = 1; x = 2; print(x@-2);", engine)
@@ -0,0 +1,72 @@
+import contextlib
+import io
+
+from tracelang_astcache import parse
+from tracelang_compiler import execute
+from tracelang_interpreter import TraceSystem
+from tracelang_memo import MemoCache, Memoizer, memo_key, pure_functions
+
+PROGRAM = """
+trace int t = 0;
+int total = 0;
+function int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+function int reads_global(int n) {
+    return n + total;
+}
+function int traces(int n) {
+    t = n;
+    return n;
+}
+function int prints(int n) {
+    print(n);
+    return n;
+}
+function int calls_impure(int n) {
+    return prints(n);
+}
+print(fib(30));
+print(traces(3) + traces(3));
+"""
+
+
+def test_only_pure_functions_are_memoized():
+    ast, _ = parse(PROGRAM)
+    assert pure_functions(ast) == {"fib"}
+
+
+def test_memoized_calls_keep_output_and_traces():
+    ast, _ = parse(PROGRAM)
+    memoizer = Memoizer(ast)
+    trace_system = TraceSystem()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        execute(ast, trace_system, {}, memoizer=memoizer)
+    assert output.getvalue() == "832040\n6\n"
+    assert list(trace_system.history("t")) == [0, 3, 3]
+    cache = memoizer.caches["fib"]
+    assert cache.misses == 31  # One call per distinct n
+    assert cache.hits == 28
+    report = io.StringIO()
+    memoizer.report(report)
+    assert "fib" in report.getvalue().splitlines()[-1]
+
+
+def test_cache_evicts_the_least_recently_used():
+    cache = MemoCache(2)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    cache.get(1)
+    cache.put(3, "c")
+    assert list(cache.entries) == [1, 3]
+    assert cache.evictions == 1
+
+
+def test_only_immutable_arguments_make_keys():
+    assert memo_key((1, "x")) != memo_key((1.0, "x"))
+    assert memo_key(([1, 2],)) is None
+    assert memo_key((-0.0,)) is None
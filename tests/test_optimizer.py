@@ -0,0 +1,51 @@
+import contextlib
+import io
+import os
+
+import pytest
+from helpers import ENGINES, EXAMPLES, run_example
+
+from tracelang_astcache import parse
+from tracelang_compiler import execute
+from tracelang_interpreter import TraceSystem
+from tracelang_optimizer import ConstantFolder, optimize
+
+
+def test_constants_are_folded_and_dead_branches_removed():
+    ast, _ = parse(
+        """
+        int x = 2 * 3 + 1;
+        if (1 > 2) {
+            print("never");
+        } else {
+            print("always" + "!");
+        }
+        while (false) {
+            x++;
+        }
+        """
+    )
+    folder = ConstantFolder()
+    optimized = folder.optimize(ast)
+    assert optimized[1] == [
+        ("declare", "int", "x", ("num", 7), False, {}),
+        ("block", [("print", ("string", "always!"))], [6]),
+    ]
+    assert folder.removed == 2
+    assert "dead branches removed" in folder.report()
+    assert ast != optimized  # The input is left alone
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_failing_operations_still_fail_at_run_time(engine):
+    ast, _ = parse('print("start"); int x = 1 / 0;')
+    optimized, _ = optimize(ast)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), pytest.raises(ZeroDivisionError):
+        execute(optimized, TraceSystem(), {}, engine)
+    assert output.getvalue() == "start\n"
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=os.path.basename)
+def test_folding_keeps_what_examples_do(path):
+    assert run_example(path, "closure", optimized=True) == run_example(path, "closure")
@@ -0,0 +1,20 @@
+from tracelang_astcache import parse
+
+
+def test_long_statement_lists_keep_every_line():
+    count = 20000
+    ast, clean = parse("".join(f"int v{i} = {i};\n" for i in range(count)))
+    assert clean
+    _, statements, linenos = ast
+    assert len(statements) == count
+    name = f"v{count - 1}"
+    assert statements[-1] == ("declare", "int", name, ("num", count - 1), False, {})
+    assert linenos == list(range(1, count + 1))
+
+
+def test_long_argument_lists_keep_their_order():
+    count = 20000
+    ast, clean = parse(f"print([{', '.join(map(str, range(count)))}]);")
+    assert clean
+    [(_, (_, elements))] = ast[1]  # print([...]);
+    assert [value for _, value in elements] == list(range(count))
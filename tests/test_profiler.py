@@ -0,0 +1,35 @@
+import contextlib
+import io
+
+from tracelang_astcache import parse
+from tracelang_compiler import execute
+from tracelang_interpreter import TraceSystem
+from tracelang_profiler import Profiler
+
+SOURCE = """int total = 0;
+for (int i = 0; i < 3; i++) total += i;
+while (total < 10)
+    total += 4;
+if (total > 0) print(total); else print(0);
+for (int j = 0; j < 2; j++) {
+    total -= 1;
+}
+"""
+
+
+def test_line_hits_count_statements_outside_blocks():
+    ast, clean = parse(SOURCE)
+    assert clean
+    profiler = Profiler()
+    with contextlib.redirect_stdout(io.StringIO()):
+        execute(ast, TraceSystem(), {}, profiler=profiler)
+    assert profiler.line_hits == {
+        1: 1,
+        # The loop, its init, three bodies and three updates
+        2: 8,
+        # The loop and the two bodies on the next line
+        3: 3,
+        5: 2,
+        6: 4,
+        7: 2,
+    }
@@ -0,0 +1,56 @@
+import pytest
+from helpers import ENGINES, run_source
+
+from tracelang_resolver import Frame, Scope, assign, lookup
+
+
+def test_only_certain_bindings_resolve_to_slots():
+    outer = Scope()
+    outer.add("x")
+    outer.bound.add("x")
+    inner = Scope(outer)
+    inner.add("y")
+    assert inner.resolve("x") == (1, 0)
+    # y may not have been declared yet, and could be found further out
+    assert inner.resolve("y") is None
+    inner.bound.add("y")
+    assert inner.resolve("y") == (0, 0)
+
+
+def test_names_fall_back_to_the_frame_chain():
+    scope = Scope()
+    scope.add("x")
+    outer = Frame(scope)
+    inner = Frame(Scope(), outer)
+    with pytest.raises(NameError, match="'x' is not defined"):
+        lookup(inner, "x")
+    assign(outer, "x", 1)
+    assert lookup(inner, "x") == 1
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_variables_are_scoped_dynamically(engine):
+    output, _ = run_source(
+        """
+        function int show() {
+            print(n);
+            return 0;
+        }
+        function int caller(bool declare) {
+            if (declare) {
+                int n = 2;
+            }
+            show();
+            return 0;
+        }
+        int n = 1;
+        caller(true);
+        caller(false);
+        for (int n = 3; n < 4; n++) {
+            show();
+        }
+        show();
+        """,
+        engine,
+    )
+    assert output == "2\n1\n3\n1\n"
@@ -0,0 +1,41 @@
+import pytest
+from helpers import ENGINES, run_source
+
+from tracelang_closures import RETURN, ClosureCompiler
+from tracelang_interpreter import TraceSystem
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_return_leaves_nested_loops(engine):
+    output, _ = run_source(
+        """
+        function int find(int target) {
+            for (int i = 0; i < 10; i++) {
+                int j = 0;
+                while (j < 10) {
+                    if (i * 10 + j == target) {
+                        return i * 100 + j;
+                    }
+                    j++;
+                }
+            }
+            return -1;
+        }
+        function int fact(int n) {
+            if (n <= 1) return 1;
+            return n * fact(n - 1);
+        }
+        print(find(42));
+        print(find(420));
+        print(fact(10));
+        """,
+        engine,
+    )
+    assert output == "402\n-1\n3628800\n"
+
+
+def test_closure_returns_do_not_raise():
+    compiler = ClosureCompiler(TraceSystem(), {})
+    block = compiler.compile(("block", [("return", ("num", 7))], [1]))
+    assert block(None) is RETURN
+    assert compiler.returned == [7]
@@ -0,0 +1,57 @@
+import base64
+import os
+import tempfile
+import threading
+
+import pytest
+
+from tracelang_client import send, submit
+from tracelang_server import JobServer, run_job
+
+
+@pytest.fixture
+def socket_path():
+    # Short enough for AF_UNIX, unlike most pytest temporary paths
+    directory = tempfile.mkdtemp(prefix="tl-")
+    path = os.path.join(directory, "server.sock")
+    server = JobServer(path)
+    thread = threading.Thread(target=server.serve_until_stopped)
+    thread.start()
+    yield path
+    send({"command": "stop"}, path)
+    thread.join()
+    server.server_close()
+    os.unlink(path)
+    os.rmdir(directory)
+
+
+def test_jobs_run_in_isolation(socket_path):
+    first = submit(
+        ["job.tl"],
+        source="trace int x = 1; x = 2; function int f() { return 1; } print(x);",
+        socket_path=socket_path,
+    )
+    assert first["status"] == 0
+    assert first["stdout"].startswith("2\n")
+    trace = base64.b64decode(first["files"]["Trace.txt"]).decode()
+    assert trace.endswith("\nx: 2\n")
+    # Neither the variable nor the function outlives its job
+    second = submit(["job.tl"], source="print(f());", socket_path=socket_path)
+    assert second["status"] == 1
+    assert "not defined" in second["stdout"] + second["stderr"]
+
+
+def test_bad_requests_get_an_error_reply(socket_path):
+    assert send(["not", "an", "object"], socket_path)["status"] == 2
+    reply = run_job({"argv": "job.tl"})
+    assert reply["status"] == 1
+    assert "argv must be a list of strings" in reply["stderr"]
+
+
+def test_source_files_are_read_from_the_clients_directory(socket_path, tmp_path):
+    (tmp_path / "job.tl").write_text('print("from a file");\n', encoding="utf-8")
+    reply = submit(
+        ["--no-ast-cache", "job.tl"], cwd=str(tmp_path), socket_path=socket_path
+    )
+    assert reply["status"] == 0
+    assert reply["stdout"] == "from a file\n"
@@ -0,0 +1,61 @@
+import contextlib
+import io
+import os
+
+import pytest
+from helpers import ENGINES, EXAMPLES, run_example
+
+from tracelang_compiler import execute_stream
+from tracelang_interpreter import TraceSystem
+from tracelang_stream import StreamParseError, parse_statements
+
+
+def run_stream(lines, engine="closure"):
+    """What a streamed run printed, its error, and its TraceSystem"""
+    trace_system = TraceSystem()
+    output = io.StringIO()
+    error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            execute_stream(parse_statements(lines), trace_system, {}, engine)
+        except Exception as e:  # Some examples end on a runtime error
+            error = repr(e)
+    return output.getvalue(), error, trace_system
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("path", EXAMPLES, ids=os.path.basename)
+def test_streamed_examples_run_as_a_whole(path, engine):
+    with open(path, encoding="utf-8") as f:
+        output, error, trace_system = run_stream(f, engine)
+    assert (
+        output,
+        error,
+        list(trace_system.trace_lines()),
+        list(trace_system.final_values()),
+    ) == run_example(path, engine)
+
+
+def test_statements_run_before_the_rest_is_read():
+    read = []
+
+    def lines():
+        for line in ("print(1);\n", "if (true) print(2);\n", "else print(3);\n"):
+            read.append(line)
+            yield line
+        yield "print(4);\n"
+
+    output = io.StringIO()
+    printed = []
+    with contextlib.redirect_stdout(output):
+        for ast in parse_statements(lines()):
+            execute_stream([ast], TraceSystem(), {})
+            printed.append((output.getvalue(), len(read)))
+    # The if statement waits for the next line, which could be an else
+    assert printed == [("1\n", 1), ("1\n2\n", 3), ("1\n2\n4\n", 3)]
+
+
+def test_statements_before_an_unfinished_one_have_run():
+    output, error, _ = run_stream(["print(1);\n", "print(2\n"])
+    assert output == "1\nSyntax error at EOF\n"
+    assert error == repr(StreamParseError("Error: Failed to parse code"))
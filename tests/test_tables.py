@@ -0,0 +1,24 @@
+import ply.lex as lex
+from ply import yacc
+
+import tracelang_lexer
+import tracelang_lextab
+import tracelang_parser
+import tracelang_parsetab
+
+# Stale tables still work, rebuilt in memory on every start; these fail
+# until `python tracelang_parser.py` regenerates them
+
+
+def test_parse_tables_match_the_grammar():
+    grammar = yacc.ParserReflect(vars(tracelang_parser))
+    grammar.get_all()
+    assert grammar.signature() == tracelang_parsetab._lr_signature
+
+
+def test_lexer_tables_match_the_token_rules():
+    built = lex.lex(module=tracelang_lexer)
+    assert tracelang_lextab._lextokens == set(tracelang_lexer.tokens)
+    assert [pattern for pattern, _ in tracelang_lextab._lexstatere["INITIAL"]] == [
+        regex.pattern for regex, _ in built.lexstatere["INITIAL"]
+    ]
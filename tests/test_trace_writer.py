@@ -0,0 +1,62 @@
+from helpers import run_source
+
+from tracelang_astcache import parse
+from tracelang_history import retained_count
+from tracelang_interpreter import TraceSystem, TraceWriter, read_histories
+
+LOOP = """
+trace int a = 0;
+trace(5) int b = 0;
+for (int i = 1; i <= 1000; i++) {
+    a = i;
+    b = i;
+}
+"""
+
+
+def test_streamed_trace_holds_few_lines(tmp_path):
+    path = tmp_path / "Trace.txt"
+    writer = TraceWriter(str(path), flush_lines=10)
+    _, trace_system = run_source(LOOP, trace_system=TraceSystem(writer))
+    assert trace_system.trace_output == []
+    assert len(writer.pending) < 10
+    assert writer.record_count == 2002
+    trace_system.write_trace_file()
+    assert path.read_text(encoding="utf-8").endswith("\na: 1000\nb: 1000\n")
+
+
+def test_streamed_trace_still_keeps_history(tmp_path):
+    writer = TraceWriter(str(tmp_path / "Trace.txt"), flush_lines=10)
+    _, trace_system = run_source(LOOP, trace_system=TraceSystem(writer))
+    writer.close()
+    # Values stay readable as a@i unless the declaration bounds them
+    assert retained_count(trace_system.traces["a"]) == 1001
+    assert retained_count(trace_system.traces["b"]) == 5
+
+
+def test_unread_history_keeps_only_the_last_value(tmp_path):
+    source = LOOP + """
+    trace array<int> c = [0, 0];
+    trace int d = 0;
+    for (int j = 1; j <= 100; j++) {
+        c[0] = j;
+        d = j;
+    }
+    print(d@1 + hist_len(a));
+    """
+    history_reads = read_histories(parse(source)[0])
+    assert history_reads == {"a", "d"}
+    path = tmp_path / "Trace.txt"
+    writer = TraceWriter(str(path), flush_lines=10)
+    output, trace_system = run_source(
+        source, trace_system=TraceSystem(writer, history_reads)
+    )
+    assert output == "1002\n"
+    assert retained_count(trace_system.traces["a"]) == 1001
+    assert retained_count(trace_system.traces["b"]) == 5
+    assert retained_count(trace_system.traces["c"]) == 1
+    assert retained_count(trace_system.traces["d"]) == 101
+    trace_system.write_trace_file()
+    text = path.read_text(encoding="utf-8")
+    assert "Main@100 c[0] 100\n" in text
+    assert text.endswith("\na: 1000\nb: 1000\nc: [100, 0]\nd: 100\n")
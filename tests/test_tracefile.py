@@ -0,0 +1,48 @@
+import pytest
+from helpers import run_source
+
+from tracelang_interpreter import TraceSystem, TraceWriter
+from tracelang_tracefile import BinaryTraceWriter, TraceFile
+
+PROGRAM = """
+trace int i = 0;
+trace float f = 0.5;
+trace bool b = true;
+trace string s = "café";
+trace array<int> a = [1, 2];
+function int step(int n) {
+    i = n * 99999999999;
+    f = f * 2;
+    b = !b;
+    s = s + "!";
+    a[0] = n;
+    return 0;
+}
+step(1);
+step(100000000000);
+"""
+
+
+def write_trace(writer):
+    run_source(PROGRAM, trace_system=TraceSystem(writer))[1].write_trace_file()
+
+
+def test_binary_trace_renders_like_the_text_trace(tmp_path):
+    write_trace(TraceWriter(str(tmp_path / "Trace.txt"), flush_lines=3))
+    write_trace(BinaryTraceWriter(str(tmp_path / "Trace.bin"), flush_lines=3))
+    with TraceFile(str(tmp_path / "Trace.bin")) as trace:
+        assert trace.render_text() == (tmp_path / "Trace.txt").read_text(
+            encoding="utf-8"
+        )
+        # A value too big for a record comes back as an int
+        assert trace.history("i") == [0, 99999999999, 9999999999900000000000]
+        assert trace.history("b") == [True, False, True]
+        assert trace.history("missing") == []
+        assert dict(trace.final_values())["f"] == 2.0
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "Trace.txt"
+    path.write_text("not a binary trace, but long enough for a header\n")
+    with pytest.raises(ValueError, match="not a TraceLang binary trace"):
+        TraceFile(str(path))
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+from helpers import EXAMPLES, run_example, run_source
+
+from tracelang_astcache import parse
+from tracelang_interpreter import Environment, TraceSystem
+from tracelang_vm import OPNAMES, VirtualMachine, compile_bytecode
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=os.path.basename)
+def test_vm_runs_examples_like_the_interpreter(path):
+    assert run_example(path, "vm") == run_example(path, "tree")
+
+
+def test_loops_compile_to_jumps():
+    ast, _ = parse("int i = 0; while (i < 3) { i++; }")
+    code = compile_bytecode(ast)
+    ops = [OPNAMES[op] for op, _ in code.instructions]
+    assert "JUMP_IF_FALSE" in ops
+    jump = ops.index("JUMP", ops.index("JUMP_IF_FALSE"))
+    # The loop jumps back to its condition, which starts after the declaration
+    assert code.instructions[jump][1] == ops.index("DECLARE") + 1
+
+
+def test_recursion_runs_deeper_than_the_python_stack():
+    output, _ = run_source(
+        """
+        function int total(int n) {
+            if (n == 0) {
+                return 0;
+            }
+            return n + total(n - 1);
+        }
+        print(total(100000));
+        """,
+        "vm",
+    )
+    assert output == "5000050000\n"
+
+
+def test_call_depth_is_limited():
+    ast, _ = parse("function int down(int n) { return down(n + 1); } down(0);")
+    vm = VirtualMachine(TraceSystem(), {}, max_depth=100)
+    with pytest.raises(RecursionError, match="Maximum call depth of 100 exceeded"):
+        vm.execute(compile_bytecode(ast), Environment())
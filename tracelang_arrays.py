@@ -0,0 +1,384 @@
+# tracelang_arrays.py
+"""Typed numeric arrays and the array built-ins
+
+An array<int> or array<float> variable always holds a TypedArray: an
+array.array subclass storing its elements unboxed as 64-bit integers or
+doubles, so indexing and len() are array.array's own C code.  Whatever
+array the variable is given, by its declaration, an assignment, as a
+function parameter or as a function's result, is converted.  Elements
+convert as stores into the array do: an int becomes a float in
+array<float>, and an element the type cannot hold, such as a float in
+array<int>, raises.
+
+Arithmetic operators work element-wise on a TypedArray, against another
+array of the same length or a number, and run as one native loop: a
+NumPy ufunc over zero-copy views when NumPy is installed and the arrays
+are long enough to repay the call, otherwise map() straight into a new
+array.  Arrays of other element types are plain lists, and + still joins
+them.
+"""
+import operator
+from array import array
+from itertools import repeat
+
+from tracelang_history import TYPECODES
+
+# Imported on first use: NumPy takes longer to import than most TraceLang
+# programs take to run.  Without it element-wise operations use map().
+numpy = None
+_numpy_checked = False
+
+ELEMENT_TYPES = {typecode: name for name, typecode in TYPECODES.items()}
+
+DTYPES = {"q": "int64", "d": "float64"}
+
+UFUNCS = {
+    operator.add: "add",
+    operator.sub: "subtract",
+    operator.mul: "multiply",
+    operator.truediv: "true_divide",
+    operator.mod: "remainder",
+}
+
+# Shorter arrays are faster through map() than through a ufunc call
+NUMPY_MIN_LENGTH = 64
+
+INT64_LIMIT = 2**63
+
+# Integers up to this size convert to a double exactly
+EXACT_DOUBLE_LIMIT = 2**53
+
+
+class TypedArray(array):
+    """Value of an array<int> or array<float> variable
+
+    Prints and compares equal like a list of its elements.  Stores convert
+    as array.array does: an int stored in array<float> becomes a float,
+    and a value the element type cannot hold raises.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def __eq__(self, other):
+        if type(other) is list:
+            return self.tolist() == other
+        return array.__eq__(self, other)
+
+    def __ne__(self, other):
+        if type(other) is list:
+            return self.tolist() != other
+        return array.__ne__(self, other)
+
+    def __add__(self, other):
+        return elementwise(operator.add, self, other)
+
+    def __radd__(self, other):
+        return elementwise(operator.add, other, self)
+
+    def __sub__(self, other):
+        return elementwise(operator.sub, self, other)
+
+    def __rsub__(self, other):
+        return elementwise(operator.sub, other, self)
+
+    def __mul__(self, other):
+        return elementwise(operator.mul, self, other)
+
+    def __rmul__(self, other):
+        return elementwise(operator.mul, other, self)
+
+    def __truediv__(self, other):
+        return elementwise(operator.truediv, self, other)
+
+    def __rtruediv__(self, other):
+        return elementwise(operator.truediv, other, self)
+
+    def __mod__(self, other):
+        return elementwise(operator.mod, self, other)
+
+    def __rmod__(self, other):
+        return elementwise(operator.mod, other, self)
+
+    def __neg__(self):
+        # Exact negation for int64 and IEEE doubles, -0.0 included
+        return elementwise(operator.mul, self, -1)
+
+
+# Arrays as TraceLang sees them, for isinstance() and for the engines'
+# fast path, which tests type(value) in ARRAY_CLASSES
+ARRAY_TYPES = (list, TypedArray)
+ARRAY_CLASSES = frozenset(ARRAY_TYPES)
+
+
+def array_typecode(var_type):
+    """Typecode for an array<int> or array<float> declaration, else None"""
+    if isinstance(var_type, tuple) and var_type[0] == "array_type":
+        return TYPECODES.get(var_type[1])
+    return None
+
+
+def typed_array(values, typecode):
+    """values as the TypedArray of an array<int> or array<float> variable
+
+    A TypedArray of that type is returned as it is, so variables can
+    share one.  Elements convert as stores do, and anything but an array
+    is returned unchanged.
+    """
+    if type(values) is TypedArray:
+        if values.typecode == typecode:
+            return values
+    elif type(values) is not list:
+        return values
+    try:
+        return TypedArray(typecode, values)
+    except (TypeError, OverflowError):
+        for value in values:
+            try:
+                array(typecode, (value,))
+            except (TypeError, OverflowError):
+                raise _store_error(typecode, value) from None
+        raise
+
+
+def declared_array(var_type, value):
+    """value as given to a variable, parameter or result of type var_type"""
+    typecode = array_typecode(var_type)
+    if typecode is None:
+        return value
+    return typed_array(value, typecode)
+
+
+def retyped(current, value):
+    """value as assigned to a variable holding current
+
+    An array<int> or array<float> variable holds a TypedArray from its
+    declaration on, so current's element type is the declared one.
+    """
+    if type(current) is TypedArray:
+        return typed_array(value, current.typecode)
+    return value
+
+
+def _operand(value):
+    """(typecode, value) for one side of an element-wise operation
+
+    A list of numbers is converted to a TypedArray.
+    """
+    if isinstance(value, TypedArray):
+        return value.typecode, value
+    value_type = type(value)
+    if value_type is int or value_type is bool:
+        return "q", value
+    if value_type is float:
+        return "d", value
+    if value_type is list:
+        types = set(map(type, value))
+        if types <= {int}:
+            return "q", TypedArray("q", value)
+        if types <= {int, float}:
+            return "d", TypedArray("d", value)
+    raise TypeError("Array arithmetic needs numeric operands")
+
+
+def elementwise(op, left, right):
+    """Apply a binary operator to each pair of elements
+
+    One side is a TypedArray; the other is an array of the same length or
+    a number, which is applied to every element.
+    """
+    left_code, left = _operand(left)
+    right_code, right = _operand(right)
+    left_array = isinstance(left, TypedArray)
+    right_array = isinstance(right, TypedArray)
+    if left_array and right_array and len(left) != len(right):
+        raise ValueError(f"Array lengths differ ({len(left)} and {len(right)})")
+    if op is operator.truediv or op is operator.mod:
+        if (0 in right) if right_array else right == 0:
+            raise ZeroDivisionError("Division by zero")
+
+    if left_code == "d" or right_code == "d" or op is operator.truediv:
+        typecode = "d"
+    else:
+        typecode = "q"
+
+    size = len(left) if left_array else len(right)
+    if size >= NUMPY_MIN_LENGTH and have_numpy():
+        result = _numpy_elementwise(op, typecode, left, right)
+        if result is not None:
+            return result
+
+    if left_array and right_array:
+        values = map(op, left, right)
+    elif left_array:
+        values = map(op, left, repeat(right))
+    else:
+        values = map(op, repeat(left), right)
+    try:
+        return TypedArray(typecode, values)
+    except OverflowError:
+        raise OverflowError("Integer overflow in array arithmetic") from None
+
+
+def have_numpy():
+    global numpy, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy as module
+        except ImportError:
+            pass
+        else:
+            numpy = module
+    return numpy is not None
+
+
+def _numpy_view(value):
+    if isinstance(value, TypedArray):
+        return numpy.frombuffer(value, DTYPES[value.typecode])
+    return value
+
+
+def _magnitude(value):
+    if isinstance(value, numpy.ndarray):
+        return max(int(value.max()), -int(value.min()))
+    return abs(int(value))
+
+
+def _exact_as_double(value):
+    if isinstance(value, numpy.ndarray):
+        return value.dtype.kind == "f" or _magnitude(value) <= EXACT_DOUBLE_LIMIT
+    return isinstance(value, float) or abs(value) <= EXACT_DOUBLE_LIMIT
+
+
+def _numpy_elementwise(op, typecode, left, right):
+    """The result computed by a ufunc, or None where it could differ
+
+    That is where int64 arithmetic might overflow, and int / int where an
+    operand is too large for a double: Python divides those exactly.
+    """
+    left = _numpy_view(left)
+    right = _numpy_view(right)
+    if op is operator.truediv:
+        if not (_exact_as_double(left) and _exact_as_double(right)):
+            return None
+    elif typecode == "q" and op is not operator.mod:
+        # NumPy integers wrap around silently; leave anything that could
+        # overflow to map(), which raises
+        if op is operator.mul:
+            bound = _magnitude(left) * _magnitude(right)
+        else:
+            bound = _magnitude(left) + _magnitude(right)
+        if bound >= INT64_LIMIT:
+            return None
+    with numpy.errstate(all="ignore"):
+        values = getattr(numpy, UFUNCS[op])(left, right)
+    values = values.astype(DTYPES[typecode], copy=False)
+    result = TypedArray(typecode)
+    result.frombytes(memoryview(values).cast("B"))
+    return result
+
+
+# Element access, for the engines' slow path and the tree interpreter
+
+
+def load_element(name, values, index):
+    """values[index] with the checks and errors of a TraceLang access"""
+    if not isinstance(values, ARRAY_TYPES):
+        raise TypeError(f"'{name}' is not an array")
+    if not isinstance(index, int):
+        raise TypeError("Array index must be an integer")
+    if index < 0 or index >= len(values):
+        raise IndexError(f"Array index {index} out of range")
+    return values[index]
+
+
+def store_element(name, values, index, value):
+    """values[index] = value with the checks and errors of a TraceLang store"""
+    if not isinstance(values, ARRAY_TYPES):
+        raise TypeError(f"'{name}' is not an array")
+    if not isinstance(index, int):
+        raise TypeError("Array index must be an integer")
+    if index < 0 or index >= len(values):
+        raise IndexError(f"Array index {index} out of range")
+    try:
+        values[index] = value
+    except (TypeError, OverflowError):
+        raise _store_error(values.typecode, value) from None
+
+
+def _store_error(typecode, value):
+    element_type = ELEMENT_TYPES[typecode]
+    if isinstance(value, int):
+        return OverflowError(f"{value} does not fit in array<{element_type}>")
+    return TypeError(f"array<{element_type}> cannot hold a {type(value).__name__}")
+
+
+# Built-in functions.  Each takes evaluated arguments; calls to them are
+# arity-checked before the arguments are evaluated.
+
+
+def _check_array(func_name, values):
+    if not isinstance(values, ARRAY_TYPES):
+        raise TypeError(f"{func_name}() argument must be an array")
+
+
+def array_length(values):
+    _check_array("length", values)
+    return len(values)
+
+
+def array_sum(values):
+    # The builtin's C loop adds in order, so lists and both backends agree
+    _check_array("sum", values)
+    return sum(values)
+
+
+def array_min(values):
+    _check_array("min", values)
+    if not values:
+        raise ValueError("min() of an empty array")
+    return min(values)
+
+
+def array_max(values):
+    _check_array("max", values)
+    if not values:
+        raise ValueError("max() of an empty array")
+    return max(values)
+
+
+def array_fill(values, value):
+    """Set every element to value, in place"""
+    _check_array("fill", values)
+    if isinstance(values, TypedArray):
+        try:
+            filler = array(values.typecode, (value,))
+        except (TypeError, OverflowError):
+            raise _store_error(values.typecode, value) from None
+        values[:] = filler * len(values)
+    else:
+        values[:] = [value] * len(values)
+
+
+# {name: (number of arguments, function)}
+BUILTINS = {
+    "length": (1, array_length),
+    "sum": (1, array_sum),
+    "min": (1, array_min),
+    "max": (1, array_max),
+    "fill": (2, array_fill),
+}
+
+# Built-ins that change the array given as their first argument in place
+MUTATING_BUILTINS = frozenset(("fill",))
+
+
+def arity_error(func_name, given):
+    expected = BUILTINS[func_name][0]
+    plural = "" if expected == 1 else "s"
+    return TypeError(
+        f"{func_name}() takes exactly {expected} argument{plural} ({given} given)"
+    )
@@ -0,0 +1,107 @@
+# tracelang_astcache.py
+"""On-disk cache of parsed programs
+
+Like __pycache__, each script gets one entry in a __tlcache__ directory
+next to it.  The entry starts with a key covering the source text and the
+grammar version; on a match the AST is unmarshalled without importing PLY
+at all, otherwise the script is parsed and the entry rewritten.
+"""
+import hashlib
+import marshal
+import os
+import sys
+
+CACHE_DIR = "__tlcache__"
+KEY_SIZE = hashlib.sha256().digest_size
+
+# Modules whose source decides what AST a program parses to
+GRAMMAR_MODULES = ("tracelang_lexer.py", "tracelang_fastlex.py", "tracelang_parser.py")
+
+_grammar_version = None
+
+
+def grammar_version():
+    """Digest of the lexer and parser sources and the marshal format"""
+    global _grammar_version
+    if _grammar_version is None:
+        digest = hashlib.sha256()
+        digest.update(f"{sys.version_info[:2]} {marshal.version}".encode())
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in GRAMMAR_MODULES:
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(f.read())
+        _grammar_version = digest.digest()
+    return _grammar_version
+
+
+def cache_key(code):
+    return hashlib.sha256(grammar_version() + code.encode("utf-8")).digest()
+
+
+def cache_path(source_file):
+    directory, name = os.path.split(os.path.abspath(source_file))
+    return os.path.join(directory, CACHE_DIR, name + ".ast")
+
+
+def parse(code):
+    """Parse with PLY, returning (ast, clean) where clean means no errors
+
+    Tokens come from tracelang_fastlex, which gives the same ones as the
+    PLY lexer in far less time.
+    """
+    from tracelang_fastlex import lexer
+    from tracelang_parser import parser
+
+    lexer.lineno = 1
+    lexer.error_count = 0
+    parser.error_count = 0
+    # Tracking gives statements the line of their first token
+    ast = parser.parse(code, lexer=lexer, tracking=True)
+    return ast, not (lexer.error_count or parser.error_count)
+
+
+def read_entry(path, key):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if data[:KEY_SIZE] != key:
+        return None
+    try:
+        return marshal.loads(data[KEY_SIZE:])
+    except (EOFError, ValueError, TypeError):
+        return None  # Truncated or corrupt entry; parse again
+
+
+def write_entry(path, key, ast):
+    """Store an entry, quietly giving up when the directory is not writable"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(key)
+            marshal.dump(ast, f)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load_ast(source_file, code):
+    """AST of a script, from the cache when its source is unchanged
+
+    Programs with lexer or syntax errors are never cached, so their error
+    messages are reported on every run.
+    """
+    path = cache_path(source_file)
+    key = cache_key(code)
+    ast = read_entry(path, key)
+    if ast is not None:
+        return ast
+    ast, clean = parse(code)
+    if ast is not None and clean:
+        write_entry(path, key, ast)
+    return ast
@@ -0,0 +1,182 @@
+# tracelang_batch.py
+"""Run many TraceLang programs in parallel
+
+    python tracelang_batch.py [--jobs N] [--trace-dir DIR] [compiler options]
+        FILE_OR_GLOB...
+
+Programs run on a pool of worker processes, one per available core by
+default, each with tracelang_compiler.py's options.  Every job writes its
+trace to its own file in --trace-dir, named after the script (demo.tl ->
+demo.txt, or demo.bin for binary traces), so jobs never overwrite each
+other.  Each job's output is printed under a header in the order the
+files were given, as soon as it and every job before it have finished,
+and the batch ends with a summary of each job's wall time and status on
+stderr.  The exit status is 1 if any job failed.
+"""
+import argparse
+import contextlib
+import copy
+import glob
+import io
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from tracelang_compiler import add_run_options, check_run_options, run_file
+
+
+class JobResult:
+    """What a worker sends back for one job"""
+
+    __slots__ = ("source_file", "status", "stdout", "stderr", "seconds")
+
+    def __init__(self, source_file, status, stdout, stderr, seconds):
+        self.source_file = source_file
+        self.status = status
+        self.stdout = stdout
+        self.stderr = stderr
+        self.seconds = seconds
+
+
+def available_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not on Linux
+        return os.cpu_count() or 1
+
+
+def expand(patterns):
+    """Files matching each pattern in turn, without repeats
+
+    A pattern that matches nothing is kept as it is, so that its job
+    fails with the usual "not found" error instead of vanishing.
+    """
+    files = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        for path in matches or [pattern]:
+            if path not in seen:
+                seen.add(path)
+                files.append(path)
+    return files
+
+
+def trace_paths(source_files, trace_dir, extension):
+    """A distinct trace file in trace_dir for each source file"""
+    paths = []
+    used = set()
+    for source_file in source_files:
+        stem = os.path.splitext(os.path.basename(source_file))[0]
+        name = stem + extension
+        suffix = 1
+        while name in used:
+            suffix += 1
+            name = f"{stem}-{suffix}{extension}"
+        used.add(name)
+        paths.append(os.path.join(trace_dir, name))
+    return paths
+
+
+def run_one(job):
+    """Run one program in a worker, capturing its output"""
+    source_file, args = job
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            status = run_file(args)
+        except Exception:
+            traceback.print_exc()
+            status = 1
+    seconds = time.perf_counter() - start
+    return JobResult(source_file, status, stdout.getvalue(), stderr.getvalue(), seconds)
+
+
+def run_batch(source_files, args, trace_dir, workers):
+    """Yield a JobResult per source file, in order, as they become ready
+
+    args holds the run options shared by every job.
+    """
+    extension = ".bin" if args.trace_format == "binary" else ".txt"
+    jobs = []
+    for source_file, trace_file in zip(
+        source_files, trace_paths(source_files, trace_dir, extension)
+    ):
+        job_args = copy.copy(args)
+        job_args.sourcefile = source_file
+        job_args.trace_file = trace_file
+        jobs.append((source_file, job_args))
+    # Hand tiny jobs to workers a few at a time, but keep every worker busy
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(run_one, jobs, chunksize=chunksize)
+
+
+def print_summary(results, seconds, workers, file=None):
+    file = file or sys.stderr
+    failed = [result for result in results if result.status]
+    plural = "" if workers == 1 else "s"
+    print(
+        f"\nBatch: {len(results)} jobs, {len(results) - len(failed)} ok, "
+        f"{len(failed)} failed in {seconds:.3f} s on {workers} worker{plural}",
+        file=file,
+    )
+    print(f"{'seconds':>10}  {'status':<6}  file", file=file)
+    for result in results:
+        status = "FAILED" if result.status else "ok"
+        print(f"{result.seconds:>10.3f}  {status:<6}  {result.source_file}", file=file)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="tracelang_batch.py",
+        description="Run TraceLang programs in parallel",
+        epilog="The other options are tracelang_compiler.py's, for every job.",
+    )
+    arg_parser.add_argument("patterns", nargs="+", metavar="FILE_OR_GLOB")
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=available_cores(),
+        metavar="N",
+        help="worker processes (default: the available cores)",
+    )
+    arg_parser.add_argument(
+        "--trace-dir",
+        default="traces",
+        metavar="DIR",
+        help="directory for the per-job trace files (default: traces)",
+    )
+    add_run_options(arg_parser)
+    args = arg_parser.parse_args(argv)
+    if args.trace_file is not None:
+        arg_parser.error("--trace-file cannot be used; see --trace-dir")
+    if args.profile_collapsed is not None:
+        arg_parser.error("--profile-collapsed would be shared by every job")
+    if args.jobs < 1:
+        arg_parser.error("--jobs must be at least 1")
+    check_run_options(arg_parser, args)
+
+    source_files = expand(args.patterns)
+    os.makedirs(args.trace_dir, exist_ok=True)
+    workers = min(args.jobs, len(source_files))
+    start = time.perf_counter()
+    results = []
+    for result in run_batch(source_files, args, args.trace_dir, workers):
+        print(f"==> {result.source_file} <==")
+        sys.stdout.write(result.stdout)
+        sys.stdout.flush()
+        sys.stderr.write(result.stderr)
+        sys.stderr.flush()
+        results.append(result)
+    print_summary(results, time.perf_counter() - start, workers)
+    return 1 if any(result.status for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
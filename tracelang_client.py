@@ -0,0 +1,121 @@
+# tracelang_client.py
+"""Run TraceLang programs on a running tracelang_server.py
+
+Takes the same arguments as tracelang_compiler.py and prints the same
+output, and writes the job's trace files into the current directory:
+
+    python tracelang_server.py &
+    python tracelang_client.py [--socket PATH] [compiler options] file.tl
+    python tracelang_client.py --stdin [compiler options] < file.tl
+    python tracelang_client.py --stop
+
+Only the standard library modules needed to talk to the server are
+imported, so starting the client costs little more than starting Python.
+Programs that run many jobs can call submit() instead and skip even that.
+"""
+import binascii
+import json
+import os
+import socket
+import sys
+
+# Name given to a program read with --stdin
+STDIN_NAME = "<stdin>"
+
+
+def default_socket_path():
+    """$TRACELANG_SOCKET, else a per-user socket in the temp directory"""
+    path = os.environ.get("TRACELANG_SOCKET")
+    if path:
+        return path
+    directory = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(directory, f"tracelang-{os.getuid()}.sock")
+
+
+def send(request, socket_path=None):
+    """Send one request to the server and return its reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path or default_socket_path())
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        with connection.makefile("rb") as replies:
+            line = replies.readline()
+    if not line:
+        raise ConnectionError("The server closed the connection without replying")
+    return json.loads(line)
+
+
+def submit(argv, source=None, cwd=None, socket_path=None):
+    """Run a job: argv as for tracelang_compiler.py, or source named by argv
+
+    Returns {"status", "stdout", "stderr", "files"}; files maps each file
+    the job wrote to its base64 contents (see write_files).
+    """
+    request = {"argv": list(argv), "cwd": cwd or os.getcwd()}
+    if source is not None:
+        request["source"] = source
+    return send(request, socket_path)
+
+
+def write_files(files, directory="."):
+    """Write the files of a job's reply, as the job would have"""
+    for name, data in files.items():
+        path = os.path.join(directory, name)
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(binascii.a2b_base64(data))
+
+
+def _pop_option(argv, option, takes_value=False):
+    """Remove a client option from argv; its value, True, or None if absent"""
+    if option not in argv:
+        return None
+    position = argv.index(option)
+    if not takes_value:
+        del argv[position]
+        return True
+    if position + 1 >= len(argv):
+        raise ValueError(f"{option} needs a value")
+    value = argv[position + 1]
+    del argv[position : position + 2]
+    return value
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    try:
+        socket_path = _pop_option(argv, "--socket", takes_value=True)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    socket_path = socket_path or default_socket_path()
+    stop = _pop_option(argv, "--stop")
+    source = None
+    if _pop_option(argv, "--stdin"):
+        source = sys.stdin.read()
+        argv.append(STDIN_NAME)
+    if not argv and not stop:
+        print("Usage: python tracelang_client.py [--socket PATH] <sourcefile>")
+        print("Example: python tracelang_client.py examples/demo.tl")
+        return 2
+
+    try:
+        if stop:
+            send({"command": "stop"}, socket_path)
+            return 0
+        reply = submit(argv, source, socket_path=socket_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot reach the server at {socket_path}: {e}", file=sys.stderr)
+        print("Start it with: python tracelang_server.py", file=sys.stderr)
+        return 1
+
+    sys.stdout.write(reply["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(reply["stderr"])
+    write_files(reply["files"])
+    return reply["status"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
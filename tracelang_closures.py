@@ -0,0 +1,919 @@
+# tracelang_closures.py
+import operator
+
+from tracelang_arrays import (
+    ARRAY_CLASSES,
+    BUILTINS,
+    MUTATING_BUILTINS,
+    array_typecode,
+    arity_error,
+    declared_array,
+    load_element,
+    retyped,
+    store_element,
+    typed_array,
+)
+from tracelang_interpreter import (
+    HISTORY_BUILTINS,
+    ReturnException,
+    get_default_value,
+    history_builtin_target,
+)
+from tracelang_memo import MISSING, memo_key
+from tracelang_policy import trace_policy
+from tracelang_resolver import (
+    UNSET,
+    Frame,
+    Scope,
+    assign,
+    collect_bindings,
+    lookup,
+    store,
+)
+
+
+def _add(l, r):
+    if isinstance(l, str) or isinstance(r, str):
+        return str(l) + str(r)
+    return l + r
+
+
+def _divide(l, r):
+    if r == 0:
+        raise ZeroDivisionError("Division by zero")
+    return l / r
+
+
+def _and(l, r):
+    return l and r
+
+
+def _or(l, r):
+    return l or r
+
+
+# Operators are resolved once at compile time instead of on every visit
+BINARY_OPS = {
+    "+": _add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide,
+    "%": operator.mod,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "&&": _and,
+    "||": _or,
+}
+
+UNARY_OPS = {
+    "!": operator.not_,
+    "-": operator.neg,
+}
+
+COMPOUND_OPS = {
+    "+=": operator.add,
+    "-=": operator.sub,
+    "*=": operator.mul,
+    "/=": operator.truediv,
+}
+
+
+def _nothing(frame):
+    return None
+
+
+# Statement closures return RETURN once a return statement has run; the
+# value waits in the compiler's return cell until the call collects it.
+# Nothing else can run in between, so one cell serves every call.
+RETURN = object()
+
+
+def may_return(node):
+    """Whether executing a statement can run a return statement"""
+    if not node:
+        return False
+    nodetype = node[0]
+    if nodetype == "return":
+        return True
+    if nodetype == "program" or nodetype == "block":
+        return any(may_return(stmt) for stmt in node[1])
+    if nodetype == "if":
+        return may_return(node[2]) or may_return(node[3])
+    if nodetype == "while":
+        return may_return(node[2])
+    if nodetype == "for":
+        return may_return(node[4])
+    return False
+
+
+class ClosureCompiler:
+    """Compile the tuple AST into pre-bound Python closures
+
+    Every closure takes the current Frame and returns the value of its
+    node, so executing a program never walks the node type chain in run().
+    Variables are resolved to frame slots while compiling.  Output and
+    trace behaviour match the tree interpreter exactly.
+    """
+
+    def __init__(self, trace_system, functions, memoizer=None, profiler=None):
+        self.trace_system = trace_system
+        self.functions = functions
+        self.memoizer = memoizer  # Caches results of pure functions
+        self.profiler = profiler  # Compile profiled statements and calls instead
+        self.scope = None
+        self.returned = [None]  # Value of the last return statement
+        self.return_type = None  # Of the function being compiled
+        self.lineno = None  # Of the statement being compiled, when profiling
+        self.handlers = {
+            "program": self.compile_block,
+            "block": self.compile_block,
+            "declare": self.compile_declare,
+            "assign": self.compile_assign,
+            "array_assign": self.compile_array_assign,
+            "compound_assign": self.compile_compound_assign,
+            "inc_dec": self.compile_inc_dec,
+            "if": self.compile_if,
+            "while": self.compile_while,
+            "for": self.compile_for,
+            "function": self.compile_function,
+            "return": self.compile_return,
+            "print": self.compile_print,
+            "binop": self.compile_binop,
+            "unop": self.compile_unop,
+            "num": self.compile_literal,
+            "float": self.compile_literal,
+            "string": self.compile_literal,
+            "bool": self.compile_literal,
+            "var": self.compile_var,
+            "trace_access": self.compile_trace_access,
+            "array": self.compile_array,
+            "array_access": self.compile_array_access,
+            "call": self.compile_call,
+        }
+
+    def compile_program(self, node):
+        scope = Scope()
+        collect_bindings(node, scope)
+        self.scope = scope
+        body = self.compile(node)
+        returned = self.returned
+        profiler = self.profiler
+
+        if profiler is not None:
+
+            def profiled_program():
+                profiler.enter("Main")
+                try:
+                    if body(Frame(scope)) is RETURN:
+                        raise ReturnException(returned[0])
+                finally:
+                    profiler.leave()
+
+            return profiled_program
+
+        def program():
+            if body(Frame(scope)) is RETURN:
+                raise ReturnException(returned[0])
+
+        return program
+
+    def compile_incremental(self):
+        """Return a function that compiles and runs one program after another
+
+        The programs run as the consecutive statements of a single one: in
+        one top-level frame, which grows as they bind new names.
+        """
+        scope = self.scope = Scope()
+        frame = Frame(scope)
+        returned = self.returned
+
+        def run_program(node):
+            collect_bindings(node, scope)
+            body = self.compile(node)
+            frame.extend((UNSET,) * (len(scope.slots) - len(frame)))
+            if body(frame) is RETURN:
+                raise ReturnException(returned[0])
+
+        return run_program
+
+    def compile(self, node, lineno=None):
+        """Closure for node
+
+        With a profiler, a statement compiled with its lineno counts a hit
+        on that line each time it runs.  Statements outside a block (an
+        unbraced body, a for loop's init and update) have no line of their
+        own and count on the line of the statement they belong to.
+        """
+        if node is None:
+            return _nothing
+        handler = self.handlers.get(node[0])
+        if handler is None:
+            return self.compile_unknown(node)
+        if lineno is None or self.profiler is None or node[0] == "block":
+            return handler(node)
+        outer_lineno = self.lineno
+        self.lineno = lineno
+        try:
+            return self.compile_counted(handler(node), lineno)
+        finally:
+            self.lineno = outer_lineno
+
+    def compile_counted(self, stmt, lineno):
+        """Statement that counts a hit on its line before it runs"""
+        line_hits = self.profiler.line_hits
+
+        def counted(frame):
+            line_hits[lineno] = line_hits.get(lineno, 0) + 1
+            return stmt(frame)
+
+        return counted
+
+    def compile_unknown(self, node):
+        nodetype = node[0]
+
+        def unknown(frame):
+            print(f"Unknown node type: {nodetype}")
+            return None
+
+        return unknown
+
+    # Variable access
+
+    def compile_load(self, name):
+        resolved = self.scope.resolve(name)
+        if resolved is None:
+
+            def load(frame):
+                return lookup(frame, name)
+
+            return load
+
+        depth, slot = resolved
+        if depth == 0:
+
+            def load(frame):
+                return frame[slot]
+
+        elif depth == 1:
+
+            def load(frame):
+                return frame.parent[slot]
+
+        else:
+
+            def load(frame):
+                for _ in range(depth):
+                    frame = frame.parent
+                return frame[slot]
+
+        return load
+
+    def compile_store(self, name, create=False):
+        """Build a setter for name; create binds it locally if not found"""
+        resolved = self.scope.resolve(name)
+        if resolved is None:
+            fallback = assign if create else store
+
+            def set_(frame, value):
+                fallback(frame, name, value)
+
+            return set_
+
+        depth, slot = resolved
+        if depth == 0:
+
+            def set_(frame, value):
+                frame[slot] = value
+
+        else:
+
+            def set_(frame, value):
+                for _ in range(depth):
+                    frame = frame.parent
+                frame[slot] = value
+
+        return set_
+
+    # Statements
+
+    def compile_block(self, node):
+        stmts = tuple(
+            self.compile(stmt, lineno) for stmt, lineno in zip(node[1], node[2])
+        )
+
+        if not may_return(node):
+
+            def block(frame):
+                for stmt in stmts:
+                    stmt(frame)
+
+            return block
+
+        def returning_block(frame):
+            for stmt in stmts:
+                if stmt(frame) is RETURN:
+                    return RETURN
+
+        return returning_block
+
+    def compile_declare(self, node):
+        _, var_type, name, init_value, is_traced, trace_options = node
+        history = trace_options.get("history")
+        trace_system = self.trace_system
+        policy = None
+        if is_traced:
+            policy = trace_policy(name, trace_options, compile_predicate)
+
+        typecode = array_typecode(var_type)
+        if typecode:
+            initial = self.compile(init_value) if init_value else None
+
+            def init(frame):
+                return typed_array([] if initial is None else initial(frame), typecode)
+
+        elif init_value:
+            init = self.compile(init_value)
+        elif isinstance(var_type, tuple):
+            # Arrays need a fresh list on every execution
+            def init(frame):
+                return get_default_value(var_type)
+
+        else:
+            default = get_default_value(var_type)
+
+            def init(frame):
+                return default
+
+        slot = self.scope.add(name)
+        self.scope.bound.add(name)
+
+        if is_traced:
+
+            def declare(frame):
+                value = init(frame)
+                frame[slot] = value
+                trace_system.mark_traced(name, history, var_type, policy)
+                trace_system.update(name, value)
+
+        else:
+
+            def declare(frame):
+                frame[slot] = init(frame)
+
+        return declare
+
+    def compile_assign(self, node):
+        _, name, expr = node
+        value_fn = self.compile(expr)
+        trace_system = self.trace_system
+        trace_vars = trace_system.trace_vars
+
+        load = self.compile_load(name)
+        set_ = self.compile_store(name, create=True)
+
+        def assign(frame):
+            value = value_fn(frame)
+            if type(value) in ARRAY_CLASSES:
+                try:
+                    value = retyped(load(frame), value)
+                except NameError:
+                    pass  # A new variable
+            set_(frame, value)
+            if name in trace_vars:
+                trace_system.update(name, value)
+
+        return assign
+
+    def compile_array_assign(self, node):
+        _, name, index_expr, value_expr = node
+        load = self.compile_load(name)
+        index_fn = self.compile(index_expr)
+        value_fn = self.compile(value_expr)
+        trace_vars = self.trace_system.trace_vars
+        update_element = self.trace_system.update_element
+        live_arrays = self.trace_system.live_arrays
+        write_through = self.trace_system.write_through
+
+        def array_assign(frame):
+            array = load(frame)
+            index = index_fn(frame)
+            value = value_fn(frame)
+            # Native indexing does the bounds and element checks; anything
+            # it rejects takes the slow path for TraceLang's error
+            if type(index) is int and index >= 0 and type(array) in ARRAY_CLASSES:
+                try:
+                    array[index] = value
+                except (IndexError, TypeError, OverflowError):
+                    store_element(name, array, index, value)
+            else:
+                store_element(name, array, index, value)
+            if name in trace_vars:
+                update_element(name, array, index)
+            elif live_arrays:
+                # Perhaps a traced array under another name
+                write_through(array, index)
+
+        return array_assign
+
+    def compile_compound_assign(self, node):
+        _, name, op, expr = node
+        op_fn = COMPOUND_OPS[op]
+        load = self.compile_load(name)
+        value_fn = self.compile(expr)
+        set_ = self.compile_store(name)
+        trace_system = self.trace_system
+        trace_vars = trace_system.trace_vars
+
+        def compound_assign(frame):
+            current = load(frame)
+            result = op_fn(current, value_fn(frame))
+            if type(result) in ARRAY_CLASSES:
+                result = retyped(current, result)
+            set_(frame, result)
+            if name in trace_vars:
+                trace_system.update(name, result)
+
+        return compound_assign
+
+    def compile_inc_dec(self, node):
+        _, name, op = node
+        op_fn = operator.add if op == "++" else operator.sub
+        load = self.compile_load(name)
+        set_ = self.compile_store(name)
+        trace_system = self.trace_system
+        trace_vars = trace_system.trace_vars
+
+        def inc_dec(frame):
+            result = op_fn(load(frame), 1)
+            set_(frame, result)
+            if name in trace_vars:
+                trace_system.update(name, result)
+
+        return inc_dec
+
+    def compile_if(self, node):
+        _, condition, then_stmt, else_stmt = node
+        scope = self.scope
+        cond_fn = self.compile(condition)
+        before = scope.bound
+        scope.bound = set(before)
+        then_fn = self.compile(then_stmt, self.lineno)
+
+        if not else_stmt:
+            scope.bound = before
+
+            def if_(frame):
+                if cond_fn(frame):
+                    return then_fn(frame)
+
+            return if_
+
+        # Only names bound on both branches are certain afterwards
+        then_bound = scope.bound
+        scope.bound = set(before)
+        else_fn = self.compile(else_stmt, self.lineno)
+        scope.bound &= then_bound
+
+        def if_else(frame):
+            if cond_fn(frame):
+                return then_fn(frame)
+            return else_fn(frame)
+
+        return if_else
+
+    def compile_while(self, node):
+        _, condition, body = node
+        scope = self.scope
+        cond_fn = self.compile(condition)
+        before = scope.bound
+        scope.bound = set(before)
+        body_fn = self.compile(body, self.lineno)
+        scope.bound = before
+
+        if not may_return(body):
+
+            def while_(frame):
+                while cond_fn(frame):
+                    body_fn(frame)
+
+            return while_
+
+        def returning_while(frame):
+            while cond_fn(frame):
+                if body_fn(frame) is RETURN:
+                    return RETURN
+
+        return returning_while
+
+    def compile_for(self, node):
+        _, init, condition, update, body = node
+        outer = self.scope
+        scope = Scope(outer)
+        for stmt in (init, update, body):
+            collect_bindings(stmt, scope)
+
+        self.scope = scope
+        lineno = self.lineno
+        init_fn = self.compile(init, lineno)
+        cond_fn = self.compile(condition)
+        body_fn = self.compile(body, lineno)
+        update_fn = self.compile(update, lineno)
+        self.scope = outer
+
+        if not may_return(body):
+
+            def for_(frame):
+                loop_frame = Frame(scope, frame)
+                init_fn(loop_frame)
+                while cond_fn(loop_frame):
+                    body_fn(loop_frame)
+                    update_fn(loop_frame)
+
+            return for_
+
+        def returning_for(frame):
+            loop_frame = Frame(scope, frame)
+            init_fn(loop_frame)
+            while cond_fn(loop_frame):
+                if body_fn(loop_frame) is RETURN:
+                    return RETURN
+                update_fn(loop_frame)
+
+        return returning_for
+
+    def compile_function(self, node):
+        _, return_type, name, params, body = node
+        # The caller's frame is the parent at runtime, so nothing outside
+        # the function resolves statically
+        outer = self.scope
+        scope = Scope()
+        for param_type, param_name in params:
+            scope.add(param_name)
+            scope.bound.add(param_name)
+        collect_bindings(body, scope)
+
+        outer_return_type = self.return_type
+        self.scope = scope
+        self.return_type = return_type
+        body_fn = self.compile(body)
+        self.scope = outer
+        self.return_type = outer_return_type
+        functions = self.functions
+
+        def function(frame):
+            functions[name] = (return_type, params, body_fn, scope)
+
+        return function
+
+    def compile_return(self, node):
+        value_fn = self.compile(node[1])
+        returned = self.returned
+        if array_typecode(self.return_type):
+            result_fn = value_fn
+            return_type = self.return_type
+
+            def value_fn(frame):
+                return declared_array(return_type, result_fn(frame))
+
+        def return_(frame):
+            returned[0] = value_fn(frame)
+            return RETURN
+
+        return return_
+
+    def compile_print(self, node):
+        value_fn = self.compile(node[1])
+
+        def print_(frame):
+            print(value_fn(frame))
+
+        return print_
+
+    def compile_binop(self, node):
+        _, op, left, right = node
+        op_fn = BINARY_OPS[op]
+        left_fn = self.compile(left)
+        right_fn = self.compile(right)
+
+        def binop(frame):
+            return op_fn(left_fn(frame), right_fn(frame))
+
+        return binop
+
+    def compile_unop(self, node):
+        _, op, expr = node
+        op_fn = UNARY_OPS[op]
+        value_fn = self.compile(expr)
+
+        def unop(frame):
+            return op_fn(value_fn(frame))
+
+        return unop
+
+    def compile_literal(self, node):
+        value = node[1]
+
+        def literal(frame):
+            return value
+
+        return literal
+
+    def compile_var(self, node):
+        return self.compile_load(node[1])
+
+    def compile_trace_access(self, node):
+        _, name, index_expr = node
+        history_at = self.trace_system.history_at
+
+        if index_expr[0] == "num":
+            index = index_expr[1]
+
+            def trace_access(frame):
+                return history_at(name, index)
+
+            return trace_access
+
+        index_fn = self.compile(index_expr)
+
+        def dynamic_trace_access(frame):
+            return history_at(name, index_fn(frame))
+
+        return dynamic_trace_access
+
+    def compile_array(self, node):
+        element_fns = tuple(self.compile(elem) for elem in node[1])
+
+        def array(frame):
+            return [elem(frame) for elem in element_fns]
+
+        return array
+
+    def compile_array_access(self, node):
+        _, name, index_expr = node
+        load = self.compile_load(name)
+        index_fn = self.compile(index_expr)
+
+        def array_access(frame):
+            array = load(frame)
+            index = index_fn(frame)
+            if type(index) is int and index >= 0 and type(array) in ARRAY_CLASSES:
+                try:
+                    return array[index]
+                except IndexError:
+                    pass
+            return load_element(name, array, index)
+
+        return array_access
+
+    def compile_call(self, node):
+        _, func_name, args = node
+        arg_fns = tuple(self.compile(arg) for arg in args)
+        call = self.compile_function_call(func_name, arg_fns)
+
+        if func_name in HISTORY_BUILTINS:
+            return self.compile_shadowed(
+                func_name, call, self.compile_history_builtin(func_name, args)
+            )
+        if func_name in BUILTINS:
+            return self.compile_shadowed(
+                func_name, call, self.compile_builtin(func_name, arg_fns)
+            )
+        return call
+
+    def compile_shadowed(self, func_name, call, builtin):
+        """Call of a built-in, or of a function the program defines instead"""
+        functions = self.functions
+
+        def shadowed_call(frame):
+            if func_name in functions:
+                return call(frame)
+            return builtin(frame)
+
+        return shadowed_call
+
+    def compile_function_call(self, func_name, arg_fns):
+        functions = self.functions
+        trace_system = self.trace_system
+        context = func_name.capitalize()
+        returned = self.returned
+
+        cache = self.memoizer.cache(func_name) if self.memoizer else None
+        if self.profiler is not None:
+            return self.compile_profiled_call(func_name, arg_fns, cache)
+        if cache is not None:
+            return self.compile_memo_call(func_name, arg_fns, cache)
+
+        def call(frame):
+            if func_name not in functions:
+                raise NameError(f"Function '{func_name}' is not defined")
+
+            return_type, params, body_fn, scope = functions[func_name]
+
+            if len(arg_fns) != len(params):
+                raise TypeError(
+                    f"Function '{func_name}' takes {len(params)} arguments ({len(arg_fns)} given)"
+                )
+
+            func_frame = Frame(scope, frame)
+            slots = scope.slots
+            for (param_type, param_name), arg in zip(params, arg_fns):
+                value = arg(frame)
+                if type(value) in ARRAY_CLASSES:
+                    value = declared_array(param_type, value)
+                func_frame[slots[param_name]] = value
+
+            trace_system.push_context(context)
+
+            try:
+                if body_fn(func_frame) is RETURN:
+                    result = returned[0]
+                else:
+                    result = None
+            finally:
+                trace_system.pop_context()
+
+            return result
+
+        return call
+
+    def compile_memo_call(self, func_name, arg_fns, cache):
+        """Call of a pure function, answered from its cache when possible"""
+        functions = self.functions
+        trace_system = self.trace_system
+        context = func_name.capitalize()
+        returned = self.returned
+
+        def memo_call(frame):
+            if func_name not in functions:
+                raise NameError(f"Function '{func_name}' is not defined")
+
+            return_type, params, body_fn, scope = functions[func_name]
+
+            if len(arg_fns) != len(params):
+                raise TypeError(
+                    f"Function '{func_name}' takes {len(params)} arguments ({len(arg_fns)} given)"
+                )
+
+            values = [arg(frame) for arg in arg_fns]
+            key = memo_key(values)
+            if key is not None:
+                result = cache.get(key)
+                if result is not MISSING:
+                    return result
+
+            func_frame = Frame(scope, frame)
+            slots = scope.slots
+            for (param_type, param_name), value in zip(params, values):
+                if type(value) in ARRAY_CLASSES:
+                    value = declared_array(param_type, value)
+                func_frame[slots[param_name]] = value
+
+            trace_system.push_context(context)
+
+            try:
+                if body_fn(func_frame) is RETURN:
+                    result = returned[0]
+                else:
+                    result = None
+            finally:
+                trace_system.pop_context()
+
+            if key is not None:
+                cache.put(key, result)
+            return result
+
+        return memo_call
+
+    def compile_profiled_call(self, func_name, arg_fns, cache):
+        """Call that reports to the profiler, memoized if cache is given"""
+        functions = self.functions
+        trace_system = self.trace_system
+        context = func_name.capitalize()
+        returned = self.returned
+        enter = self.profiler.enter
+        leave = self.profiler.leave
+
+        def profiled_call(frame):
+            if func_name not in functions:
+                raise NameError(f"Function '{func_name}' is not defined")
+
+            return_type, params, body_fn, scope = functions[func_name]
+
+            if len(arg_fns) != len(params):
+                raise TypeError(
+                    f"Function '{func_name}' takes {len(params)} arguments ({len(arg_fns)} given)"
+                )
+
+            values = [arg(frame) for arg in arg_fns]
+            key = memo_key(values) if cache is not None else None
+
+            enter(func_name)
+            try:
+                if key is not None:
+                    result = cache.get(key)
+                    if result is not MISSING:
+                        return result
+
+                func_frame = Frame(scope, frame)
+                slots = scope.slots
+                for (param_type, param_name), value in zip(params, values):
+                    if type(value) in ARRAY_CLASSES:
+                        value = declared_array(param_type, value)
+                    func_frame[slots[param_name]] = value
+
+                trace_system.push_context(context)
+
+                try:
+                    if body_fn(func_frame) is RETURN:
+                        result = returned[0]
+                    else:
+                        result = None
+                finally:
+                    trace_system.pop_context()
+
+                if key is not None:
+                    cache.put(key, result)
+                return result
+            finally:
+                leave()
+
+        return profiled_call
+
+    def compile_history_builtin(self, func_name, args):
+        method = HISTORY_BUILTINS[func_name]
+        trace_system = self.trace_system
+        try:
+            var_name = history_builtin_target(func_name, args)
+        except TypeError as error:
+            message = str(error)
+
+            def bad_call(frame):
+                raise TypeError(message)
+
+            return bad_call
+
+        def history_builtin(frame):
+            return method(trace_system, var_name)
+
+        return history_builtin
+
+    def compile_builtin(self, func_name, arg_fns):
+        argc, function = BUILTINS[func_name]
+
+        if len(arg_fns) != argc:
+            given = len(arg_fns)
+
+            def wrong_arity(frame):
+                raise arity_error(func_name, given)
+
+            return wrong_arity
+
+        if func_name in MUTATING_BUILTINS:
+            array_changed = self.trace_system.array_changed
+
+            def mutating_builtin(frame):
+                args = [arg(frame) for arg in arg_fns]
+                result = function(*args)
+                array_changed(args[0])
+                return result
+
+            return mutating_builtin
+
+        if argc == 1:
+            arg_fn = arg_fns[0]
+
+            def builtin(frame):
+                return function(arg_fn(frame))
+
+        else:
+
+            def builtin(frame):
+                return function(*[arg(frame) for arg in arg_fns])
+
+        return builtin
+
+
+def compile_predicate(expr, var_name):
+    """A trace(when=...) expression as a function of var_name's new value"""
+    compiler = ClosureCompiler(None, {})
+    scope = compiler.scope = Scope()
+    slot = scope.add(var_name)
+    scope.bound.add(var_name)
+    test = compiler.compile(expr)
+    frame = Frame(scope)
+
+    def predicate(value):
+        frame[slot] = value
+        return test(frame)
+
+    return predicate
+
+
+def compile_program(node, trace_system, functions, memoizer=None, profiler=None):
+    """Compile a program AST into a closure that runs it in a fresh frame"""
+    compiler = ClosureCompiler(trace_system, functions, memoizer, profiler)
+    return compiler.compile_program(node)
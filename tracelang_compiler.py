@@ -1,56 +1,380 @@
 # tracelang_compiler.py
+import argparse
 import sys
 
-from tracelang_interpreter import Environment, TraceSystem, run
-from tracelang_lexer import lexer
-from tracelang_parser import parser
+from tracelang_astcache import load_ast, parse
+from tracelang_closures import ClosureCompiler, compile_program
+from tracelang_interpreter import (
+    Environment,
+    TraceSystem,
+    TraceWriter,
+    read_histories,
+    run,
+)
+from tracelang_memo import DEFAULT_MEMO_SIZE, Memoizer
+from tracelang_optimizer import ConstantFolder, optimize
+from tracelang_profiler import Profiler
+from tracelang_tracefile import BinaryTraceWriter
+from tracelang_vm import MAX_DEPTH, VirtualMachine, compile_bytecode
 
+ENGINES = ("closure", "tree", "vm")
+TRACE_FORMATS = ("text", "binary")
 
-def main():
-    if len(sys.argv) < 2:
+
+def add_run_options(arg_parser):
+    """Add the options that control how a program runs"""
+    arg_parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="closure",
+        help="execution engine (default: closure); vm runs calls on a heap "
+        "frame stack and supports deep recursion",
+    )
+    arg_parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=MAX_DEPTH,
+        metavar="N",
+        help=f"maximum call depth for the vm engine (default: {MAX_DEPTH})",
+    )
+    arg_parser.add_argument(
+        "--stream-trace",
+        action="store_true",
+        help="write trace lines to Trace.txt while the program runs; traced "
+        "variables the program never reads with x@i or hist_* keep only their "
+        "last value (with --stream every value is kept unless declared with "
+        "trace(N))",
+    )
+    arg_parser.add_argument(
+        "--trace-flush-lines",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="lines buffered between writes when streaming (default: 1000)",
+    )
+    arg_parser.add_argument(
+        "--trace-format",
+        choices=TRACE_FORMATS,
+        default="text",
+        help="text writes Trace.txt, binary streams compact records to Trace.bin "
+        "(render it with tracelang_tracefile.py)",
+    )
+    arg_parser.add_argument(
+        "--trace-file",
+        metavar="PATH",
+        help="write the trace here instead of Trace.txt (Trace.bin for binary)",
+    )
+    arg_parser.add_argument(
+        "-O",
+        "--optimize",
+        action="store_true",
+        help="fold constant expressions and drop dead branches before running",
+    )
+    arg_parser.add_argument(
+        "--no-memo",
+        dest="memo",
+        action="store_false",
+        help="do not cache the results of pure functions (closure engine)",
+    )
+    arg_parser.add_argument(
+        "--memo-size",
+        type=int,
+        default=DEFAULT_MEMO_SIZE,
+        metavar="N",
+        help=f"results kept per pure function (default: {DEFAULT_MEMO_SIZE})",
+    )
+    arg_parser.add_argument(
+        "--memo-stats",
+        action="store_true",
+        help="report memoization hit rates on stderr",
+    )
+    arg_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report per-function times and per-line hits on stderr "
+        "(closure engine)",
+    )
+    arg_parser.add_argument(
+        "--profile-collapsed",
+        metavar="FILE",
+        help="also write the profile as collapsed stacks for flamegraph tools",
+    )
+    arg_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="parse and run one top-level statement at a time, so memory does "
+        "not grow with the source (no memoization or AST cache)",
+    )
+    arg_parser.add_argument(
+        "--no-ast-cache",
+        dest="ast_cache",
+        action="store_false",
+        help="always parse the source instead of using __tlcache__",
+    )
+
+
+def check_run_options(arg_parser, args):
+    """Fill in defaults that depend on other options, and reject conflicts"""
+    if args.trace_file is None:
+        args.trace_file = "Trace.bin" if args.trace_format == "binary" else "Trace.txt"
+    if args.profile_collapsed:
+        args.profile = True
+    if args.profile and args.engine != "closure":
+        arg_parser.error("--profile is only supported by the closure engine")
+
+
+def parse_args(argv):
+    arg_parser = argparse.ArgumentParser(
+        prog="tracelang_compiler.py", description="Run a TraceLang program"
+    )
+    arg_parser.add_argument("sourcefile", help="program to run, or - for stdin")
+    add_run_options(arg_parser)
+    args = arg_parser.parse_args(argv)
+    check_run_options(arg_parser, args)
+    return args
+
+
+def execute(
+    ast,
+    trace_system,
+    functions,
+    engine="closure",
+    max_depth=MAX_DEPTH,
+    memoizer=None,
+    profiler=None,
+):
+    """Run a parsed program with the selected execution engine
+
+    Only the closure engine memoizes pure functions and can be profiled.
+    """
+    if engine == "vm":
+        vm = VirtualMachine(trace_system, functions, max_depth)
+        vm.execute(compile_bytecode(ast), Environment())
+    elif engine == "tree":
+        run(ast, Environment(), trace_system, functions)
+    else:
+        program = compile_program(ast, trace_system, functions, memoizer, profiler)
+        program()
+
+
+def execute_stream(
+    programs,
+    trace_system,
+    functions,
+    engine="closure",
+    max_depth=MAX_DEPTH,
+    profiler=None,
+):
+    """Run parsed programs in turn as the statements of a single program
+
+    Each program is compiled as it comes and dropped once it has run.
+    """
+    if engine == "vm":
+        vm = VirtualMachine(trace_system, functions, max_depth)
+        env = Environment()
+        for ast in programs:
+            vm.execute(compile_bytecode(ast), env)
+    elif engine == "tree":
+        env = Environment()
+        for ast in programs:
+            run(ast, env, trace_system, functions)
+    else:
+        compiler = ClosureCompiler(trace_system, functions, profiler=profiler)
+        run_program = compiler.compile_incremental()
+        if profiler is not None:
+            profiler.enter("Main")  # Left by profiler.finish()
+        for ast in programs:
+            run_program(ast)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
         print("Usage: python tracelang_compiler.py <sourcefile>")
         print("Example: python tracelang_compiler.py examples/demo.tl")
         return
 
-    source_file = sys.argv[1]
-    try:
-        with open(source_file, "r", encoding="utf-8") as f:
-            code = f.read()
-    except FileNotFoundError:
-        print(f"Error: File '{source_file}' not found")
-        return
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return
+    run_file(parse_args(argv))
+
+
+def run_file(args, code=None):
+    """Run the program named by parsed arguments, as the command line does
+
+    With code, that is the program's source and sourcefile only names it;
+    a sourcefile of "-" is read from stdin.  Output goes to sys.stdout and
+    sys.stderr and relative trace paths are in the current directory, so
+    the server and batch runner can run jobs through here too.  Returns 0,
+    or 1 if the program could not be read, parsed or run to completion.
+    """
+    if args.stream:
+        return run_stream(args, code)
+    source_file = args.sourcefile
+    if code is None:
+        try:
+            if source_file == "-":
+                code = sys.stdin.read()
+            else:
+                with open(source_file, "r", encoding="utf-8") as f:
+                    code = f.read()
+        except FileNotFoundError:
+            print(f"Error: File '{source_file}' not found")
+            return 1
+        except Exception as e:
+            print(f"Error reading file: {e}")
+            return 1
 
     # Parse the code
     try:
-        ast = parser.parse(code, lexer=lexer)
+        if args.ast_cache and source_file != "-":
+            ast = load_ast(source_file, code)
+        else:
+            ast, _ = parse(code)
         if ast is None:
             print("Error: Failed to parse code")
-            return
+            return 1
     except Exception as e:
         print(f"Parse error: {e}")
-        return
+        return 1
+
+    if args.optimize:
+        ast, report = optimize(ast)
+        print(report, file=sys.stderr)
+
+    memoizer = None
+    if args.memo and args.engine == "closure":
+        memoizer = Memoizer(ast, args.memo_size)
+
+    def run_program(trace_system, functions, profiler):
+        execute(
+            ast,
+            trace_system,
+            functions,
+            args.engine,
+            args.max_depth,
+            memoizer,
+            profiler,
+        )
+
+    return run_traced(
+        args, run_program, memoizer, code.splitlines(), read_histories(ast)
+    )
+
+
+def run_stream(args, code=None):
+    """Run a program a top-level statement at a time, as run_file would
+
+    Reads the source a line at a time, and parses and runs each statement
+    before reading on, so the program can still be arriving on stdin.
+    Constant folding is reported once at the end.
+    """
+    # Imported here since it loads the lexer, which an AST cache hit
+    # does not need
+    from tracelang_stream import StreamParseError, parse_statements
+
+    source_file = args.sourcefile
+    if code is not None:
+        lines = code.splitlines(keepends=True)
+    elif source_file == "-":
+        lines = sys.stdin
+    else:
+        try:
+            lines = open(source_file, "r", encoding="utf-8")
+        except FileNotFoundError:
+            print(f"Error: File '{source_file}' not found")
+            return 1
+        except Exception as e:
+            print(f"Error reading file: {e}")
+            return 1
+
+    programs = parse_statements(lines)
+    folder = None
+    if args.optimize:
+        folder = ConstantFolder()
+        programs = map(folder.optimize, programs)
+
+    def run_program(trace_system, functions, profiler):
+        execute_stream(
+            programs,
+            trace_system,
+            functions,
+            args.engine,
+            args.max_depth,
+            profiler,
+        )
+
+    try:
+        return run_traced(args, run_program, quiet_errors=(StreamParseError,))
+    finally:
+        if folder is not None:
+            print(folder.report(), file=sys.stderr)
+        if lines is not sys.stdin and hasattr(lines, "close"):
+            lines.close()
+
+
+def run_traced(
+    args,
+    run_program,
+    memoizer=None,
+    source_lines=None,
+    history_reads=None,
+    quiet_errors=(),
+):
+    """Call run_program(trace_system, functions, profiler) as args ask
+
+    Sets up the trace writer and profiler, writes the trace file after a
+    successful run and prints the requested reports whatever happens.
+    When trace lines are streamed, traced variables outside history_reads
+    (the names the program reads history of, if known) keep only their
+    last value.  Exceptions of the quiet_errors types are printed without
+    a traceback.
+    """
+    writer = None
+    if args.trace_format == "binary":
+        writer = BinaryTraceWriter(args.trace_file, args.trace_flush_lines)
+    elif args.stream_trace:
+        writer = TraceWriter(args.trace_file, args.trace_flush_lines)
+    if writer is None:
+        history_reads = None  # Every value is in memory with its trace line
+    trace_system = TraceSystem(writer, history_reads)
+    profiler = Profiler() if args.profile else None
 
-    # Execute the code
     try:
-        env = Environment()
-        trace_system = TraceSystem()
         functions = {}
 
-        run(ast, env, trace_system, functions)
+        run_program(trace_system, functions, profiler)
 
         # Write trace output if any traced variables exist
         if trace_system.trace_vars:
-            trace_system.write_trace_file()
+            trace_system.write_trace_file(args.trace_file)
+
+    except quiet_errors as e:
+        # Such as a statement that did not parse, when the parser has said
+        # why; statements before it have run
+        print(e)
+        if writer is not None:
+            writer.close()
+        return 1
 
     except Exception as e:
         print(f"Runtime error: {e}")
+        # Keep whatever a streaming trace had written before the failure
+        if writer is not None:
+            writer.close()
         import traceback
 
         traceback.print_exc()
-        return
+        return 1
+
+    finally:
+        if args.memo_stats and memoizer is not None:
+            memoizer.report()
+        if profiler is not None:
+            profiler.finish()
+            profiler.report(source_lines)
+            if args.profile_collapsed:
+                profiler.write_collapsed(args.profile_collapsed)
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,257 @@
+# tracelang_fastlex.py
+"""Fast lexer for the parser
+
+Produces exactly the tokens tracelang_lexer's PLY lexer does: the same
+types, values, line numbers and positions, and the same messages for
+illegal characters.  PLY matches its master regex once per token from
+Python and passes a LexToken through a rule function; this scans the
+source with one compiled pattern through re.finditer and dispatches on
+the name of the group that matched.  Keywords and string escapes come
+from tracelang_lexer, so the two lexers cannot drift apart there.
+
+    python tracelang_fastlex.py [FILE...]
+
+checks that both lexers agree on every token of the given files, every
+example by default, and exits with status 1 if they do not.
+"""
+import contextlib
+import glob
+import io
+import os
+import re
+import sys
+from functools import partial
+
+from tracelang_lexer import decode_escapes, reserved
+
+# Operator tokens by text
+OPERATORS = {
+    "+=": "PLUSASSIGN",
+    "-=": "MINUSASSIGN",
+    "*=": "TIMESASSIGN",
+    "/=": "DIVIDEASSIGN",
+    "++": "INCREMENT",
+    "--": "DECREMENT",
+    "==": "EQ",
+    "!=": "NE",
+    "<=": "LE",
+    ">=": "GE",
+    "&&": "AND",
+    "||": "OR",
+    "+": "PLUS",
+    "-": "MINUS",
+    "*": "TIMES",
+    "/": "DIVIDE",
+    "%": "MODULO",
+    "=": "ASSIGN",
+    "<": "LT",
+    ">": "GT",
+    "!": "NOT",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    "{": "LBRACE",
+    "}": "RBRACE",
+    "[": "LBRACKET",
+    "]": "RBRACKET",
+    ";": "SEMICOLON",
+    ",": "COMMA",
+    "@": "AT",
+}
+
+# The token rules of tracelang_lexer as one pattern.  A match starts with
+# the t_ignore characters PLY skips before a token; the end of the source
+# matches "ignore" so trailing ones never need backtracking.  Where two
+# rules can match at the same place, the one PLY tries first comes first:
+# comments before "/", floats before integers, "++" and "--" before "+"
+# and "-".  Otherwise the common tokens come first, and the operators are
+# a few character classes rather than a group each, since the regex
+# engine tries alternatives one by one.  The last group takes any other
+# character, so finditer never skips one.
+TOKEN_PATTERN = re.compile(
+    r"[ \t\r]*(?:"
+    r"(?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)"
+    r"|(?P<COMMENT>//.*)"
+    r"|(?P<OP>\+\+|--|&&|\|\||[-+*/=!<>]=?|[%(){}\[\];,@])"
+    r"|(?P<FLOAT>\d+\.\d+)"
+    r"|(?P<NUMBER>\d+)"
+    r'|(?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*")'
+    r"|(?P<newline>\n+)"
+    r"|(?P<ignore>\Z)"
+    r"|(?P<error>.))"
+)
+
+
+class Token:
+    """A token with the attributes the parser uses of PLY's LexToken
+
+    Made with object.__new__ and filled in by the lexer, which is quicker
+    than calling an __init__ for each token.
+    """
+
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class FastLexer:
+    """Stands in for the PLY lexer object that parser.parse() drives
+
+    Like PLY's, lineno is not reset by input() and counts the newlines
+    consumed so far, and lexpos is the end of the last token returned.
+    """
+
+    def __init__(self):
+        self.lineno = 1
+        self.lexpos = 0
+        self.error_count = 0
+        self.held = 0  # Where tokens() stopped in source not read in full
+        self.token = partial(next, iter(()), None)
+
+    def input(self, data):
+        self.lexpos = 0
+        self.token = partial(next, self.tokens(data), None)
+
+    def feed(self, tokens):
+        """Hand the parser tokens that have already been lexed"""
+        self.token = partial(next, iter(tokens), None)
+
+    def tokens(self, data, offset=0, final=True):
+        """Generate the tokens of data
+
+        Lazily, so that messages for illegal characters come out between
+        the parser's as they do with PLY.  Positions are counted from
+        offset.  Unless final, data is only as much of the source as has
+        been read, and lexing stops at a quote whose string literal may
+        end further on, setting held to its position.
+        """
+        lineno = self.lineno
+        keyword = reserved.get
+        operator = OPERATORS.__getitem__
+        new = object.__new__
+        for match in TOKEN_PATTERN.finditer(data):
+            kind = token_type = match.lastgroup
+            if kind == "ID":
+                value = match.group(kind)
+                token_type = keyword(value, kind)
+            elif kind == "OP":
+                value = match.group(kind)
+                token_type = operator(value)
+            elif kind == "newline":
+                lineno += len(match.group(kind))
+                self.lineno = lineno
+                continue
+            elif kind == "NUMBER":
+                value = int(match.group(kind))
+            elif kind == "STRING":
+                value = decode_escapes(match.group(kind)[1:-1])
+            elif kind == "FLOAT":
+                value = float(match.group(kind))
+            elif kind == "error":
+                if not final and match.group(kind) == '"':
+                    self.held = match.start(kind)
+                    return
+                print(f"Illegal character '{match.group(kind)}' at line {lineno}")
+                self.error_count += 1
+                continue
+            else:  # Comments and the end of the source
+                continue
+            token = new(Token)
+            token.type = token_type
+            token.value = value
+            token.lineno = lineno
+            start, end = match.span(kind)
+            token.lexpos = start + offset
+            self.lexpos = end + offset
+            yield token
+        self.held = len(data)
+        if final:
+            self.lexpos = offset + len(data) + 1
+
+    def stream(self, lines):
+        """Generate the tokens of a source read a line at a time
+
+        Every line but the last must end with its line break, as lines
+        from a file do.  Only a string literal can span lines, so only
+        the text from an unclosed quote on is kept between them (all the
+        rest of the source, for a quote that is never closed).
+        """
+        offset = 0
+        held = []
+        for line in lines:
+            if held and '"' not in line:
+                held.append(line)  # Still no closing quote
+                continue
+            held.append(line)
+            data = "".join(held)
+            yield from self.tokens(data, offset, final=False)
+            offset += self.held
+            held = [data[self.held :]] if self.held < len(data) else []
+        yield from self.tokens("".join(held), offset)
+
+
+lexer = FastLexer()
+
+
+# Differential check against the PLY lexer
+
+
+def token_stream(lex, code):
+    """Everything observable of lexing code: tokens, messages and state"""
+    lex.lineno = 1
+    lex.error_count = 0
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        lex.input(code)
+        stream = [
+            (token.type, type(token.value), token.value, token.lineno, token.lexpos)
+            for token in iter(lex.token, None)
+        ]
+    return stream, output.getvalue(), lex.lineno, lex.error_count
+
+
+def first_difference(code):
+    """None if both lexers agree on code, else a description of where not"""
+    from tracelang_lexer import lexer as ply_lexer
+
+    expected, expected_output, expected_lines, expected_errors = token_stream(
+        ply_lexer, code
+    )
+    actual, actual_output, actual_lines, actual_errors = token_stream(lexer, code)
+    for position, (want, got) in enumerate(zip(expected, actual)):
+        if want != got:
+            return f"token {position}: PLY {want}, fast {got}"
+    if len(expected) != len(actual):
+        return f"PLY gives {len(expected)} tokens, fast {len(actual)}"
+    if expected_output != actual_output:
+        return f"messages differ: PLY {expected_output!r}, fast {actual_output!r}"
+    if (expected_lines, expected_errors) != (actual_lines, actual_errors):
+        return (
+            f"final state differs: PLY line {expected_lines} with "
+            f"{expected_errors} errors, fast line {actual_lines} with "
+            f"{actual_errors} errors"
+        )
+    return None
+
+
+def main(argv=None):
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples")
+        paths = sorted(glob.glob(os.path.join(examples, "*.tl")))
+    failed = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            code = f.read()
+        difference = first_difference(code)
+        if difference:
+            failed += 1
+            print(f"{path}: {difference}")
+        else:
+            print(f"{path}: ok")
+    print(f"{len(paths) - failed} of {len(paths)} files lex identically")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+# tracelang_history.py
+from array import array
+from bisect import bisect_right
+from itertools import chain, islice
+
+# Declared types whose histories are stored unboxed
+TYPECODES = {"int": "q", "float": "d"}
+
+# Only values of exactly this type round-trip through the typed array
+# unchanged (a bool stored in array('q') would read back as 1)
+EXACT_TYPES = {"q": int, "d": float}
+
+
+class HistoryEvicted(IndexError):
+    """Raised for a history index that a bounded history no longer keeps"""
+
+
+class ArrayHistory:
+    """Unbounded history of a numeric traced variable in a typed array
+
+    Falls back to a plain list the first time a value does not fit, so
+    reading the history back always returns the values that were stored.
+    """
+
+    __slots__ = ("values", "exact_type")
+
+    def __init__(self, typecode):
+        self.values = array(typecode)
+        self.exact_type = EXACT_TYPES[typecode]
+
+    def append(self, value):
+        if self.exact_type is not None and type(value) is not self.exact_type:
+            self.promote()
+        try:
+            self.values.append(value)
+        except OverflowError:
+            self.promote()
+            self.values.append(value)
+
+    def promote(self):
+        """Switch to list storage"""
+        if self.exact_type is not None:
+            self.values = list(self.values)
+            self.exact_type = None
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def export(self):
+        """Zero-copy view of the values, None once promoted to a list"""
+        if self.exact_type is None:
+            return None
+        return memoryview(self.values)
+
+
+class RingHistory:
+    """Fixed-size history of a traced variable
+
+    Indices stay absolute: len() is the number of values ever recorded and
+    history[i] is the i-th of them, as with a plain list.  Only the last
+    capacity values are kept; older indices raise HistoryEvicted.  With a
+    typecode the ring is a typed array, promoted like ArrayHistory.
+    """
+
+    __slots__ = ("values", "capacity", "count", "exact_type")
+
+    def __init__(self, capacity, typecode=None):
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        if typecode:
+            self.values = array(typecode, [0]) * capacity
+            self.exact_type = EXACT_TYPES[typecode]
+        else:
+            self.values = [None] * capacity
+            self.exact_type = None
+        self.capacity = capacity
+        self.count = 0
+
+    def append(self, value):
+        slot = self.count % self.capacity
+        if self.exact_type is not None and type(value) is not self.exact_type:
+            self.promote()
+        try:
+            self.values[slot] = value
+        except OverflowError:
+            self.promote()
+            self.values[slot] = value
+        self.count += 1
+
+    def promote(self):
+        """Switch to list storage"""
+        if self.exact_type is not None:
+            self.values = list(self.values)
+            self.exact_type = None
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def first_index(self):
+        """Oldest index still retained"""
+        return max(0, self.count - self.capacity)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError(f"History index {index} out of range")
+        if index < self.first_index:
+            raise HistoryEvicted(
+                f"History index {index} has been evicted "
+                f"(keeping {self.first_index}-{self.count - 1})"
+            )
+        return self.values[index % self.capacity]
+
+    def __iter__(self):
+        # Oldest first, by slices of the ring rather than index by index
+        if self.count <= self.capacity:
+            return islice(self.values, self.count)
+        start = self.count % self.capacity
+        return chain(islice(self.values, start, None), islice(self.values, start))
+
+    def export(self):
+        """View of the retained values in order, None once promoted
+
+        The ring wraps around, so unlike ArrayHistory this is a copy.
+        """
+        if self.exact_type is None:
+            return None
+        return memoryview(array(self.values.typecode, self))
+
+
+def snapshot(value):
+    """Copy of an array value, so later writes to it cannot alter history"""
+    if isinstance(value, array):
+        return type(value)(value.typecode, value)  # Keeps a TypedArray's type
+    if isinstance(value, list):
+        return value[:]
+    return value
+
+
+class ArrayVersions:
+    """History of a traced array variable
+
+    Assigning the variable records a copy of the array; writing one
+    element records only (index, value).  A version is rebuilt from the
+    nearest copy at or before it.  Another copy is taken once as many
+    writes as the array has elements follow the last, so writes cost
+    amortised O(1) and rebuilding copies at most about twice the array.
+    With a capacity only the last capacity versions are kept, indexed
+    like RingHistory.
+    """
+
+    __slots__ = ("entries", "bases", "start", "count", "capacity", "writes", "live")
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        self.entries = []  # Version start + i: a copy, or an (index, value) write
+        self.bases = []  # Versions whose entry is a copy, ascending
+        self.start = 0
+        self.count = 0
+        self.capacity = capacity
+        self.writes = 0  # Element writes since the last copy
+        self.live = None  # The array the last copy was taken from
+
+    def append(self, value):
+        self.entries.append(snapshot(value))
+        self.bases.append(self.count)
+        self.count += 1
+        self.writes = 0
+        self.live = value
+        self.trim()
+
+    def write(self, values, index):
+        """Record that values[index] has just been written"""
+        if values is not self.live or self.writes >= len(values):
+            # A different array under the same name, or time for a copy
+            self.append(values)
+            return
+        self.entries.append((index, values[index]))
+        self.count += 1
+        self.writes += 1
+        self.trim()
+
+    def trim(self):
+        """Drop entries no retained version is rebuilt from"""
+        if self.capacity is None:
+            return
+        needed = bisect_right(self.bases, self.first_index) - 1
+        if needed > 0:
+            base = self.bases[needed]
+            del self.entries[: base - self.start]
+            del self.bases[:needed]
+            self.start = base
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def first_index(self):
+        """Oldest index still retained"""
+        if self.capacity is None:
+            return 0
+        return max(0, self.count - self.capacity)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError(f"History index {index} out of range")
+        if index < self.first_index:
+            raise HistoryEvicted(
+                f"History index {index} has been evicted "
+                f"(keeping {self.first_index}-{self.count - 1})"
+            )
+        base = self.bases[bisect_right(self.bases, index) - 1]
+        # Always a fresh copy: the caller may write to it
+        value = snapshot(self.entries[base - self.start])
+        for position, element in self.entries[
+            base - self.start + 1 : index - self.start + 1
+        ]:
+            value[position] = element
+        return value
+
+    def __iter__(self):
+        for index in range(self.first_index, self.count):
+            yield self[index]
+
+    def export(self):
+        return None
+
+
+def retained_count(history):
+    """Number of values a history still holds"""
+    return len(history) - getattr(history, "first_index", 0)
+
+
+def new_history(capacity=None, var_type=None):
+    """Storage for a traced variable's values
+
+    Bounded when capacity is set, unboxed for int and float variables,
+    and versioned for arrays.
+    """
+    if isinstance(var_type, tuple) and var_type[0] == "array_type":
+        return ArrayVersions(capacity)
+    typecode = TYPECODES.get(var_type) if isinstance(var_type, str) else None
+    if capacity is not None:
+        return RingHistory(capacity, typecode)
+    if typecode:
+        return ArrayHistory(typecode)
+    return []
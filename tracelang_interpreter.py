@@ -1,85 +1,503 @@
+from tracelang_arrays import (
+    ARRAY_CLASSES,
+    BUILTINS,
+    MUTATING_BUILTINS,
+    TypedArray,
+    array_typecode,
+    arity_error,
+    declared_array,
+    load_element,
+    retyped,
+    store_element,
+)
+from tracelang_history import (
+    ArrayHistory,
+    ArrayVersions,
+    HistoryEvicted,
+    RingHistory,
+    new_history,
+    retained_count,
+)
+from tracelang_memo import walk
+from tracelang_policy import trace_policy
+
+TRACE_HEADER = "=" * 38 + "\n" + "Trace.txt:\n\n"
+
+
+def format_trace_line(context, var_name, iteration, value):
+    """Render one traced update the way Trace.txt shows it"""
+    if iteration > 0:
+        return f"{context}@{iteration} {var_name} {value}"
+    return f"{context} -> {var_name} {value}"
+
+
+# Values that cannot change after they are recorded; anything else (arrays)
+# is rendered when traced so later mutation does not alter the trace
+SNAPSHOT_FREE_TYPES = frozenset((int, float, bool, str, type(None)))
+
+
+class TraceWriter:
+    """Buffered writer that streams trace lines to a file as they happen
+
+    Only the lines are streamed: the TraceSystem still keeps each traced
+    variable's history, bounded only for trace(N) declarations.
+    """
+
+    def __init__(self, filename="Trace.txt", flush_lines=1000):
+        self.filename = filename
+        self.flush_lines = max(1, flush_lines)
+        self.pending = []  # Records not yet formatted and handed to the file
+        self.record_count = 0
+        self.file = None
+
+    def write_record(self, context, var_name, iteration, value):
+        self.pending.append((context, var_name, iteration, value))
+        self.record_count += 1
+        if len(self.pending) >= self.flush_lines:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        if self.file is None:
+            # Opened lazily so a run without trace lines leaves no file
+            self.file = open(self.filename, "w", encoding="utf-8")
+            self.file.write(TRACE_HEADER)
+        self.file.write(
+            "".join(format_trace_line(*record) + "\n" for record in self.pending)
+        )
+        self.file.flush()
+        self.pending.clear()
+
+    def finish(self, final_values):
+        """Append the final-values footer and close the file"""
+        self.flush()
+        if self.file is not None:
+            self.file.write("\n")
+            for var_name, value in final_values:
+                self.file.write(f"{var_name}: {value}\n")
+        self.close()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+# Interned call contexts kept after their calls return.  Beyond this many,
+# returning calls release theirs, so a deep recursion does not leave one
+# context per level behind.
+MAX_CONTEXTS = 10_000
+
+
+class CallContext:
+    """A call path: a function called in its parent's context
+
+    Contexts are interned in their parent's children, so that repeated
+    calls along one path share one context.  The " -> " joined name is
+    only built, and kept, for a context that trace lines need.
+    """
+
+    __slots__ = ("parent", "func_name", "children", "name", "traced", "within")
+
+    def __init__(self, parent, func_name, name=None):
+        self.parent = parent
+        self.func_name = func_name
+        # None, the only interned child, or {func_name: CallContext}
+        self.children = None
+        self.name = name  # Such as "Main -> Fact -> Fact", once built
+        self.traced = False  # Whether a trace record refers to it
+        # {function names: whether one is on the call path}, for within=
+        self.within = None
+
+
 class TraceSystem:
 
-    def __init__(self):
+    def __init__(self, writer=None, history_reads=None):
         self.traces = {}  # {var_name: [history of values]}
+        # Names the program reads the history of, when known; other traced
+        # variables declared without trace(N) keep only their last value
+        self.history_reads = history_reads
         self.trace_vars = set()  # Set of variables marked for tracing
-        self.call_stack = ["Main"]  # Track function calls
-        self.trace_output = []  # Store trace output lines
-
-    def mark_traced(self, var_name):
-        """Mark a variable for tracing"""
+        self.policies = {}  # {var_name: TracePolicy} where not every update is kept
+        # {id(array): names of the traced arrays whose history it is live
+        # in}, to find one that is changed under another name
+        self.live_arrays = {}
+        # Labels of trace lines by id: traced variable names, and
+        # name[index] for writes to elements of traced arrays
+        self.var_names = []
+        self.var_ids = {}  # {label: id}
+        self.context_stack = [CallContext(None, "Main", "Main")]  # Active calls
+        self.context_count = 1  # Interned contexts
+        self.trace_output = []  # (CallContext, var id, iteration, value) records
+        self.writer = writer  # Stream records to a TraceWriter instead
+
+    def mark_traced(self, var_name, history=None, var_type=None, policy=None):
+        """Mark a variable for tracing, keeping at most history values
+
+        Only the updates that policy keeps are recorded, if one is given.
+        As with history, the first declaration of a name decides.
+        """
         self.trace_vars.add(var_name)
         if var_name not in self.traces:
-            self.traces[var_name] = []
+            if (
+                history is None
+                and self.history_reads is not None
+                and var_name not in self.history_reads
+            ):
+                history = 1  # For the final values
+            self.traces[var_name] = new_history(history, var_type)
+            self.var_ids[var_name] = len(self.var_names)
+            self.var_names.append(var_name)
+            if policy is not None:
+                self.policies[var_name] = policy
 
     def update(self, var_name, value):
         """Update trace history for a variable"""
         if var_name in self.trace_vars:
-            self.traces[var_name].append(value)
-            # Format trace output
-            context = " -> ".join(self.call_stack)
-            iteration = len(self.traces[var_name]) - 1
-            if iteration > 0:
-                line = f"{context}@{iteration} {var_name} {value}"
+            policy = self.policies.get(var_name)
+            if policy is not None and not policy.keep(value, self):
+                return
+            history = self.traces[var_name]
+            if history.__class__ is ArrayVersions and value is not history.live:
+                self.relive(var_name, history, value)
+            history.append(value)
+            iteration = len(history) - 1
+            if type(value) not in SNAPSHOT_FREE_TYPES:
+                value = f"{value}"
+            context = self.context_stack[-1]
+            context.traced = True
+            if self.writer is not None:
+                self.writer.write_record(
+                    self.context_name(context), var_name, iteration, value
+                )
             else:
-                line = f"{context} -> {var_name} {value}"
-            self.trace_output.append(line)
+                self.trace_output.append(
+                    (context, self.var_ids[var_name], iteration, value)
+                )
+
+    def update_element(self, var_name, values, index):
+        """Record a write to values[index], an element of a traced array"""
+        history = self.traces[var_name]
+        if not isinstance(history, ArrayVersions):
+            # Not declared as an array: record the whole value
+            self.update(var_name, values)
+            return
+        policy = self.policies.get(var_name)
+        if policy is not None and not policy.keep(values, self):
+            return
+        if values is not history.live:
+            self.relive(var_name, history, values)
+        history.write(values, index)
+        iteration = len(history) - 1
+        label = f"{var_name}[{index}]"
+        value = values[index]
+        if type(value) not in SNAPSHOT_FREE_TYPES:
+            value = f"{value}"
+        context = self.context_stack[-1]
+        context.traced = True
+        if self.writer is not None:
+            self.writer.write_record(self.context_name(context), label, iteration, value)
+        else:
+            label_id = self.var_ids.get(label)
+            if label_id is None:
+                label_id = self.var_ids[label] = len(self.var_names)
+                self.var_names.append(label)
+            self.trace_output.append((context, label_id, iteration, value))
+
+    def write_through(self, values, index):
+        """Record a write to values[index] made under an untraced name
+
+        Such as a function's parameter: if values is the array of traced
+        variables, the write is recorded for them.
+        """
+        names = self.live_arrays.get(id(values))
+        if names:
+            for var_name in tuple(names):
+                self.update_element(var_name, values, index)
+
+    def array_changed(self, values):
+        """Record a new version of the traced arrays that values is
+
+        For a built-in such as fill() that changes a whole array in place.
+        """
+        names = self.live_arrays.get(id(values))
+        if names:
+            for var_name in tuple(names):
+                self.update(var_name, values)
+
+    def relive(self, var_name, history, value):
+        """Note that value is about to be the live array of var_name"""
+        live_arrays = self.live_arrays
+        names = live_arrays.get(id(history.live))
+        if names is not None and var_name in names:
+            names.remove(var_name)
+            if not names:
+                del live_arrays[id(history.live)]
+        if type(value) in ARRAY_CLASSES:
+            live_arrays.setdefault(id(value), []).append(var_name)
+
+    def history(self, var_name):
+        """History of a traced variable, checking it has one"""
+        if var_name not in self.trace_vars:
+            raise NameError(f"Variable '{var_name}' is not traced")
+        if var_name not in self.traces or not self.traces[var_name]:
+            raise ValueError(
+                f"No history available for traced variable '{var_name}'"
+            )
+        return self.traces[var_name]
+
+    def history_at(self, var_name, index):
+        """Value of a traced variable after its index-th update
+
+        A negative index counts back from the latest update, so x@-1 is
+        the value before the current one.
+        """
+        history = self.history(var_name)
+        if not isinstance(index, int):
+            raise TypeError("History index must be an integer")
+        position = index + len(history) - 1 if index < 0 else index
+        if position < 0 or position >= len(history):
+            raise IndexError(
+                f"History index {index} out of range for variable '{var_name}' (0-{len(history)-1})"
+            )
+        if (
+            isinstance(history, (RingHistory, ArrayVersions))
+            and position < history.first_index
+        ):
+            raise HistoryEvicted(
+                f"History index {index} for variable '{var_name}' has been evicted "
+                f"(keeping {history.first_index}-{len(history)-1})"
+            )
+        return history[position]
+
+    # The hist_* built-ins.  Sums run over the history store in place.
+    # All three see only the values a history still keeps, so that for a
+    # bounded one hist_avg(x) is still hist_sum(x) / hist_len(x).
+
+    def history_length(self, var_name):
+        """Number of values kept, so x@(1 - hist_len(x)) is the oldest"""
+        return retained_count(self.history(var_name))
+
+    def history_sum(self, var_name):
+        return self.numeric_history_sum("hist_sum", var_name)[0]
+
+    def history_avg(self, var_name):
+        total, history = self.numeric_history_sum("hist_avg", var_name)
+        return total / retained_count(history)
+
+    def numeric_history_sum(self, func_name, var_name):
+        """(sum of the retained values, history), oldest value first"""
+        history = self.history(var_name)
+        if not isinstance(history, ArrayVersions):
+            try:
+                return sum(history), history
+            except TypeError:
+                pass
+        raise TypeError(f"{func_name}() needs a numeric history, '{var_name}' has none")
+
+    def export_history(self, var_name):
+        """Buffer-protocol view of a numeric variable's history, or None"""
+        history = self.traces.get(var_name)
+        if isinstance(history, (ArrayHistory, RingHistory)):
+            return history.export()
+        return None
 
     def push_context(self, func_name):
         """Push a new function context"""
-        self.call_stack.append(func_name)
+        parent = self.context_stack[-1]
+        children = parent.children
+        if children.__class__ is CallContext:
+            # Most contexts are only ever called from in one way
+            context = children if children.func_name == func_name else None
+        elif children is None:
+            context = None
+        else:
+            context = children.get(func_name)
+        if context is None:
+            context = self.new_context(parent, func_name)
+        self.context_stack.append(context)
+
+    def new_context(self, parent, func_name):
+        """Intern the context of a call of func_name from parent's"""
+        context = CallContext(parent, func_name)
+        children = parent.children
+        if children is None:
+            parent.children = context
+        elif children.__class__ is CallContext:
+            parent.children = {children.func_name: children, func_name: context}
+        else:
+            children[func_name] = context
+        self.context_count += 1
+        return context
 
     def pop_context(self):
         """Pop function context"""
-        if len(self.call_stack) > 1:
-            self.call_stack.pop()
+        if len(self.context_stack) > 1:
+            context = self.context_stack.pop()
+            if self.context_count > MAX_CONTEXTS and not context.children:
+                self.release_context(context)
+
+    def release_context(self, context):
+        """Stop interning a context whose call has returned
+
+        Trace records that refer to it keep it, with its name built now,
+        but no longer its ancestors.
+        """
+        if context.traced:
+            self.context_name(context)
+        parent = context.parent
+        if parent.children is context:
+            parent.children = None
+        else:
+            del parent.children[context.func_name]
+        context.parent = None
+        self.context_count -= 1
+
+    def context_name(self, context):
+        """Call path of a context, such as Main -> Fact -> Fact
+
+        Kept on the context, which only records refer to once its call
+        has returned; ancestors are walked, not named, so naming the
+        deepest of many nested contexts takes space for one name.
+        """
+        name = context.name
+        if name is None:
+            func_names = []
+            ancestor = context
+            while ancestor.name is None:
+                func_names.append(ancestor.func_name)
+                ancestor = ancestor.parent
+            func_names.append(ancestor.name)
+            func_names.reverse()
+            name = context.name = " -> ".join(func_names)
+        return name
+
+    def trace_lines(self):
+        """Format the recorded trace lines"""
+        var_names = self.var_names
+        for context, var_id, iteration, value in self.trace_output:
+            yield format_trace_line(
+                self.context_name(context), var_names[var_id], iteration, value
+            )
+
+    def final_values(self):
+        """(var_name, last value) for every traced variable, by name
+
+        An array shows the elements it holds, should it have been changed
+        in a way that was not recorded, unless its policy drops updates.
+        """
+        for var_name in sorted(self.trace_vars):
+            history = self.traces[var_name]
+            if not history:
+                continue
+            if isinstance(history, ArrayVersions) and var_name not in self.policies:
+                yield var_name, history.live
+            else:
+                yield var_name, history[-1]
 
     def write_trace_file(self, filename="Trace.txt"):
-        """Write trace output to file"""
+        """Write trace output to file
+
+        A streaming TraceSystem has written its lines already and only
+        appends the footer to the writer's file.
+        """
+        if self.writer is not None:
+            self.writer.finish(self.final_values())
+            if self.writer.record_count:
+                print(f"\nTrace output written to {self.writer.filename}")
+            return
         if self.trace_output:
             with open(filename, "w", encoding="utf-8") as f:
-                f.write("=" * 38 + "\n")
-                f.write("Trace.txt:\n\n")
-                for line in self.trace_output:
+                f.write(TRACE_HEADER)
+                for line in self.trace_lines():
                     f.write(line + "\n")
                 f.write("\n")
                 # Write final values
-                for var_name in sorted(self.trace_vars):
-                    if self.traces[var_name]:
-                        final_value = self.traces[var_name][-1]
-                        f.write(f"{var_name}: {final_value}\n")
+                for var_name, final_value in self.final_values():
+                    f.write(f"{var_name}: {final_value}\n")
             print(f"\nTrace output written to {filename}")
 
 
+# Built-ins that take a traced variable's name rather than a value
+HISTORY_BUILTINS = {
+    "hist_len": TraceSystem.history_length,
+    "hist_sum": TraceSystem.history_sum,
+    "hist_avg": TraceSystem.history_avg,
+}
+
+
+def history_builtin_target(func_name, args):
+    """Name of the traced variable a hist_* call reads, from its argument nodes"""
+    if len(args) != 1:
+        raise TypeError(f"{func_name}() takes exactly 1 argument ({len(args)} given)")
+    if args[0][0] != "var":
+        raise TypeError(f"{func_name}() argument must be a traced variable")
+    return args[0][1]
+
+
+def read_histories(ast):
+    """Names whose history a program reads, through x@i or a hist_* call"""
+    names = set()
+    for node in walk(ast):
+        nodetype = node[0]
+        if nodetype == "trace_access":
+            names.add(node[1])
+        elif nodetype == "call" and node[1] in HISTORY_BUILTINS:
+            args = node[2]
+            if len(args) == 1 and args[0][0] == "var":
+                names.add(args[0][1])
+    return names
+
+
 class Environment:
     """Environment for variable storage"""
 
+    __slots__ = ("vars", "parent")
+
     def __init__(self, parent=None):
         self.vars = {}
         self.parent = parent
 
     def get(self, name):
-        if name in self.vars:
-            return self.vars[name]
-        elif self.parent:
-            return self.parent.get(name)
-        else:
-            raise NameError(f"Variable '{name}' is not defined")
+        env = self
+        while env is not None:
+            if name in env.vars:
+                return env.vars[name]
+            env = env.parent
+        raise NameError(f"Variable '{name}' is not defined")
 
     def set(self, name, value):
         self.vars[name] = value
 
     def update(self, name, value):
         """Update existing variable"""
-        if name in self.vars:
-            self.vars[name] = value
-        elif self.parent:
-            self.parent.update(name, value)
-        else:
-            raise NameError(f"Variable '{name}' is not defined")
+        env = self
+        while env is not None:
+            if name in env.vars:
+                env.vars[name] = value
+                return
+            env = env.parent
+        raise NameError(f"Variable '{name}' is not defined")
+
+    def assign(self, name, value):
+        """Update existing variable, or define it here if it does not exist"""
+        env = self
+        while env is not None:
+            if name in env.vars:
+                env.vars[name] = value
+                return
+            env = env.parent
+        self.vars[name] = value
 
     def exists(self, name):
-        return name in self.vars or (self.parent and self.parent.exists(name))
+        env = self
+        while env is not None:
+            if name in env.vars:
+                return True
+            env = env.parent
+        return False
 
 
 class ReturnException(Exception):
@@ -89,6 +507,17 @@ class ReturnException(Exception):
         self.value = value
 
 
+def tree_predicate(expr, var_name):
+    """A trace(when=...) expression as a function of var_name's new value"""
+
+    def predicate(value):
+        env = Environment()
+        env.set(var_name, value)
+        return run(expr, env, None)
+
+    return predicate
+
+
 def run(node, env, trace_system, functions=None):
     if functions is None:
         functions = {}
@@ -107,24 +536,28 @@ def run(node, env, trace_system, functions=None):
             run(stmt, env, trace_system, functions)
 
     elif nodetype == "declare":
-        _, var_type, name, init_value, is_traced = node
+        _, var_type, name, init_value, is_traced, trace_options = node
         value = (
             run(init_value, env, trace_system, functions)
             if init_value
             else get_default_value(var_type)
         )
+        if isinstance(var_type, tuple):
+            value = declared_array(var_type, value)
         env.set(name, value)
         if is_traced:
-            trace_system.mark_traced(name)
+            policy = trace_policy(name, trace_options, tree_predicate)
+            trace_system.mark_traced(
+                name, trace_options.get("history"), var_type, policy
+            )
             trace_system.update(name, value)
 
     elif nodetype == "assign":
         _, name, expr = node
         value = run(expr, env, trace_system, functions)
-        if env.exists(name):
-            env.update(name, value)
-        else:
-            env.set(name, value)
+        if type(value) in ARRAY_CLASSES and env.exists(name):
+            value = retyped(env.get(name), value)
+        env.assign(name, value)
         # Update trace if variable is traced
         if name in trace_system.trace_vars:
             trace_system.update(name, value)
@@ -134,13 +567,12 @@ def run(node, env, trace_system, functions=None):
         array = env.get(name)
         index = run(index_expr, env, trace_system, functions)
         value = run(value_expr, env, trace_system, functions)
-        if not isinstance(array, list):
-            raise TypeError(f"'{name}' is not an array")
-        if not isinstance(index, int):
-            raise TypeError(f"Array index must be an integer")
-        if index < 0 or index >= len(array):
-            raise IndexError(f"Array index {index} out of range")
-        array[index] = value
+        store_element(name, array, index, value)
+        if name in trace_system.trace_vars:
+            trace_system.update_element(name, array, index)
+        elif trace_system.live_arrays:
+            # Perhaps a traced array under another name
+            trace_system.write_through(array, index)
 
     elif nodetype == "compound_assign":
         _, name, op, expr = node
@@ -154,6 +586,8 @@ def run(node, env, trace_system, functions=None):
             result = current * value
         elif op == "/=":
             result = current / value
+        if type(result) in ARRAY_CLASSES:
+            result = retyped(current, result)
         env.update(name, result)
         if name in trace_system.trace_vars:
             trace_system.update(name, result)
@@ -261,17 +695,9 @@ def run(node, env, trace_system, functions=None):
         return env.get(node[1])
 
     elif nodetype == "trace_access":
-        _, name, index = node
-        if name not in trace_system.trace_vars:
-            raise NameError(f"Variable '{name}' is not traced")
-        if name not in trace_system.traces or not trace_system.traces[name]:
-            raise ValueError(f"No history available for traced variable '{name}'")
-        history = trace_system.traces[name]
-        if index < 0 or index >= len(history):
-            raise IndexError(
-                f"History index {index} out of range for variable '{name}' (0-{len(history)-1})"
-            )
-        return history[index]
+        _, name, index_expr = node
+        index = run(index_expr, env, trace_system, functions)
+        return trace_system.history_at(name, index)
 
     elif nodetype == "array":
         _, elements = node
@@ -281,28 +707,25 @@ def run(node, env, trace_system, functions=None):
         _, name, index_expr = node
         array = env.get(name)
         index = run(index_expr, env, trace_system, functions)
-        if not isinstance(array, list):
-            raise TypeError(f"'{name}' is not an array")
-        if not isinstance(index, int):
-            raise TypeError(f"Array index must be an integer")
-        if index < 0 or index >= len(array):
-            raise IndexError(f"Array index {index} out of range")
-        return array[index]
+        return load_element(name, array, index)
 
     elif nodetype == "call":
         _, func_name, args = node
 
-        if func_name == "length":
-            if len(args) != 1:
-                raise TypeError(
-                    f"length() takes exactly 1 argument ({len(args)} given)"
-                )
-            arr = run(args[0], env, trace_system, functions)
-            if not isinstance(arr, list):
-                raise TypeError("length() argument must be an array")
-            return len(arr)
-
         if func_name not in functions:
+            # A function the program defines shadows the built-in
+            if func_name in HISTORY_BUILTINS:
+                var_name = history_builtin_target(func_name, args)
+                return HISTORY_BUILTINS[func_name](trace_system, var_name)
+            if func_name in BUILTINS:
+                argc, builtin = BUILTINS[func_name]
+                if len(args) != argc:
+                    raise arity_error(func_name, len(args))
+                values = [run(arg, env, trace_system, functions) for arg in args]
+                result = builtin(*values)
+                if func_name in MUTATING_BUILTINS:
+                    trace_system.array_changed(values[0])
+                return result
             raise NameError(f"Function '{func_name}' is not defined")
 
         return_type, params, body = functions[func_name]
@@ -316,6 +739,8 @@ def run(node, env, trace_system, functions=None):
         func_env = Environment(env)
         for (param_type, param_name), arg in zip(params, args):
             arg_value = run(arg, env, trace_system, functions)
+            if type(arg_value) in ARRAY_CLASSES:
+                arg_value = declared_array(param_type, arg_value)
             func_env.set(param_name, arg_value)
 
         # Push function context for tracing
@@ -329,6 +754,8 @@ def run(node, env, trace_system, functions=None):
         finally:
             trace_system.pop_context()
 
+        if type(result) in ARRAY_CLASSES:
+            result = declared_array(return_type, result)
         return result
 
     else:
@@ -346,6 +773,7 @@ def get_default_value(var_type):
     elif var_type == "bool":
         return False
     elif isinstance(var_type, tuple) and var_type[0] == "array_type":
-        return []
+        typecode = array_typecode(var_type)
+        return TypedArray(typecode) if typecode else []
     else:
         return None
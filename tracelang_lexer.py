@@ -1,4 +1,6 @@
 # tracelang_lexer.py
+import re
+
 import ply.lex as lex
 
 tokens = (
@@ -115,6 +117,26 @@ reserved = {
 }
 
 
+# Escape sequences in string literals; other backslashes are kept as written
+ESCAPES = {"n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+def _escape(match):
+    return ESCAPES.get(match.group(1), match.group(0))
+
+
+def decode_escapes(text):
+    r"""Decode the escape sequences in a string literal's text in one pass
+
+    An escaped backslash never starts another escape: "\\n" is a
+    backslash and an n.
+    """
+    if "\\" not in text:
+        return text
+    return ESCAPE_PATTERN.sub(_escape, text)
+
+
 def t_COMMENT(t):
     r"//.*"
     pass  # No return value. Token discarded
@@ -134,12 +156,7 @@ def t_NUMBER(t):
 
 def t_STRING(t):
     r'"([^"\\]|\\.)*"'
-    t.value = t.value[1:-1]  # Remove quotes
-    # Handle escape sequences
-    t.value = t.value.replace("\\n", "\n")
-    t.value = t.value.replace("\\t", "\t")
-    t.value = t.value.replace('\\"', '"')
-    t.value = t.value.replace("\\\\", "\\")
+    t.value = decode_escapes(t.value[1:-1])  # Without the quotes
     return t
 
 
@@ -159,7 +176,12 @@ t_ignore = " \t\r"
 
 def t_error(t):
     print(f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}")
+    t.lexer.error_count += 1
     t.lexer.skip(1)
 
 
-lexer = lex.lex()
+# Optimized mode skips re-validating the rules and loads the master regex
+# from the prebuilt tracelang_lextab module.  Regenerate it with
+# `python tracelang_parser.py` after changing any token rule.
+lexer = lex.lex(optimize=True, lextab="tracelang_lextab")
+lexer.error_count = 0  # Illegal characters skipped so far
@@ -0,0 +1,10 @@
+# tracelang_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ARRAY', 'ASSIGN', 'AT', 'BOOL', 'COMMA', 'DECREMENT', 'DIVIDE', 'DIVIDEASSIGN', 'ELSE', 'EQ', 'FALSE', 'FLOAT', 'FLOAT_TYPE', 'FOR', 'FUNCTION', 'GE', 'GT', 'ID', 'IF', 'INCREMENT', 'INT', 'LBRACE', 'LBRACKET', 'LE', 'LPAREN', 'LT', 'MINUS', 'MINUSASSIGN', 'MODULO', 'NE', 'NOT', 'NUMBER', 'OR', 'PLUS', 'PLUSASSIGN', 'PRINT', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'STRING_TYPE', 'TIMES', 'TIMESASSIGN', 'TRACE', 'TRUE', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_COMMENT>//.*)|(?P<t_FLOAT>\\d+\\.\\d+)|(?P<t_NUMBER>\\d+)|(?P<t_STRING>"([^"\\\\]|\\\\.)*")|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_INCREMENT>\\+\\+)|(?P<t_OR>\\|\\|)|(?P<t_PLUSASSIGN>\\+=)|(?P<t_TIMESASSIGN>\\*=)|(?P<t_AND>&&)|(?P<t_DECREMENT>--)|(?P<t_DIVIDEASSIGN>/=)|(?P<t_EQ>==)|(?P<t_GE>>=)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_MINUSASSIGN>-=)|(?P<t_NE>!=)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_ASSIGN>=)|(?P<t_AT>@)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_MODULO>%)|(?P<t_NOT>!)|(?P<t_SEMICOLON>;)', [None, ('t_COMMENT', 'COMMENT'), ('t_FLOAT', 'FLOAT'), ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), None, ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'INCREMENT'), (None, 'OR'), (None, 'PLUSASSIGN'), (None, 'TIMESASSIGN'), (None, 'AND'), (None, 'DECREMENT'), (None, 'DIVIDEASSIGN'), (None, 'EQ'), (None, 'GE'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LE'), (None, 'LPAREN'), (None, 'MINUSASSIGN'), (None, 'NE'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'ASSIGN'), (None, 'AT'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'MODULO'), (None, 'NOT'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t\r'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,264 @@
+# tracelang_memo.py
+"""Purity analysis and call memoization for TraceLang functions
+
+Variables are dynamically scoped, so a function is only pure if every name
+it touches is one of its parameters or a local it has definitely declared
+by that point; anything else could reach into a caller.  It must also not
+print, declare traced variables, assign to any name traced anywhere in the
+program (trace_vars is keyed by name), read trace history, define
+functions, or call anything that is not itself pure.
+"""
+import sys
+from collections import OrderedDict
+
+from tracelang_arrays import BUILTINS
+
+# Results and arguments of these types cannot be changed through an alias,
+# so sharing them between calls is safe
+IMMUTABLE_TYPES = frozenset((int, float, bool, str, type(None)))
+
+DEFAULT_MEMO_SIZE = 4096
+
+MISSING = object()  # Returned by MemoCache.get for keys it does not hold
+
+
+def walk(node):
+    """Yield every node of an AST"""
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+        elif isinstance(node, tuple) and node and isinstance(node[0], str):
+            yield node
+            pending.extend(
+                child for child in node[1:] if isinstance(child, (tuple, list))
+            )
+
+
+class Impure(Exception):
+    """Raised inside PurityChecker at the first impure construct"""
+
+
+class PurityChecker:
+    """Check one function body, collecting the functions it calls"""
+
+    def __init__(self, traced_names):
+        self.traced_names = traced_names
+        self.calls = set()
+
+    def check(self, node):
+        _, return_type, name, params, body = node
+        try:
+            self.statement(body, {param_name for _, param_name in params})
+        except Impure:
+            return False
+        return True
+
+    def local(self, name, bound):
+        if name not in bound:
+            raise Impure(name)
+
+    def store(self, name, bound):
+        self.local(name, bound)
+        if name in self.traced_names:
+            raise Impure(name)
+
+    def statement(self, node, bound):
+        """Check a statement, adding the names it definitely declares"""
+        if node is None:
+            return
+        nodetype = node[0]
+        if nodetype == "block":
+            for stmt in node[1]:
+                self.statement(stmt, bound)
+        elif nodetype == "declare":
+            _, var_type, name, init_value, is_traced, trace_options = node
+            if is_traced:
+                raise Impure(name)
+            self.expression(init_value, bound)
+            bound.add(name)
+        elif nodetype == "assign":
+            self.expression(node[2], bound)
+            self.store(node[1], bound)
+        elif nodetype == "array_assign":
+            _, name, index_expr, value_expr = node
+            self.store(name, bound)
+            self.expression(index_expr, bound)
+            self.expression(value_expr, bound)
+        elif nodetype == "compound_assign":
+            self.expression(node[3], bound)
+            self.store(node[1], bound)
+        elif nodetype == "inc_dec":
+            self.store(node[1], bound)
+        elif nodetype == "if":
+            _, condition, then_stmt, else_stmt = node
+            self.expression(condition, bound)
+            then_bound = set(bound)
+            self.statement(then_stmt, then_bound)
+            else_bound = set(bound)
+            self.statement(else_stmt, else_bound)
+            # Blocks share the function's scope: only names declared on
+            # both branches are certain afterwards
+            bound |= then_bound & else_bound
+        elif nodetype == "while":
+            self.expression(node[1], bound)
+            self.statement(node[2], set(bound))
+        elif nodetype == "for":
+            _, init, condition, update, body = node
+            loop_bound = set(bound)
+            self.statement(init, loop_bound)
+            self.expression(condition, loop_bound)
+            self.statement(body, set(loop_bound))
+            self.statement(update, set(loop_bound))
+        elif nodetype == "return":
+            self.expression(node[1], bound)
+        elif nodetype in ("print", "function"):
+            raise Impure(nodetype)
+        else:
+            self.expression(node, bound)
+
+    def expression(self, node, bound):
+        if node is None:
+            return
+        nodetype = node[0]
+        if nodetype in ("num", "float", "string", "bool"):
+            return
+        if nodetype == "var":
+            self.local(node[1], bound)
+        elif nodetype == "binop":
+            self.expression(node[2], bound)
+            self.expression(node[3], bound)
+        elif nodetype == "unop":
+            self.expression(node[2], bound)
+        elif nodetype == "array":
+            for elem in node[1]:
+                self.expression(elem, bound)
+        elif nodetype == "array_access":
+            self.local(node[1], bound)
+            self.expression(node[2], bound)
+        elif nodetype == "call":
+            _, func_name, args = node
+            self.calls.add(func_name)
+            for arg in args:
+                self.expression(arg, bound)
+        else:
+            raise Impure(nodetype)  # trace_access and unknown nodes
+
+
+def pure_functions(program):
+    """Names of the functions in a program that are safe to memoize"""
+    traced_names = set()
+    definitions = {}
+    for node in walk(program):
+        if node[0] == "declare" and node[4]:
+            traced_names.add(node[2])
+        elif node[0] == "function":
+            definitions.setdefault(node[2], []).append(node)
+
+    calls = {}
+    for name, nodes in definitions.items():
+        # A redefined function may not be the body that was analysed
+        if len(nodes) != 1:
+            continue
+        checker = PurityChecker(traced_names)
+        if checker.check(nodes[0]):
+            calls[name] = checker.calls
+
+    # Drop functions that call anything impure until nothing changes.  A
+    # function the program defines shadows the built-in of that name, and
+    # the hist_* built-ins, which read trace history, are never pure.
+    builtins = BUILTINS.keys() - definitions.keys()
+    pure = set(calls)
+    changed = True
+    while changed:
+        changed = False
+        for name in list(pure):
+            if not calls[name] <= pure | builtins:
+                pure.discard(name)
+                changed = True
+    return pure
+
+
+def memo_key(values):
+    """Cache key for argument values, or None if the call is not cacheable
+
+    Types are part of the key because 1, 1.0 and true compare equal but
+    behave differently (1 + "" is "1", 1.0 + "" is "1.0").
+    """
+    for value in values:
+        value_type = type(value)
+        if value_type not in IMMUTABLE_TYPES:
+            return None
+        if value_type is float and value == 0.0:
+            return None  # 0.0 and -0.0 are equal keys but print differently
+    return (*values, *map(type, values))
+
+
+class MemoCache:
+    """Bounded LRU cache of one function's results"""
+
+    __slots__ = ("entries", "maxsize", "hits", "misses", "evictions")
+
+    def __init__(self, maxsize):
+        self.entries = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        result = self.entries.get(key, MISSING)
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        if type(result) not in IMMUTABLE_TYPES:
+            return
+        entries = self.entries
+        entries[key] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+
+class Memoizer:
+    """Memo caches for the pure functions of one program"""
+
+    def __init__(self, program, maxsize=DEFAULT_MEMO_SIZE):
+        self.pure = pure_functions(program)
+        self.maxsize = maxsize
+        self.caches = {}
+
+    def cache(self, func_name):
+        """The cache for func_name, or None if it is not memoized"""
+        if func_name not in self.pure or self.maxsize < 1:
+            return None
+        if func_name not in self.caches:
+            self.caches[func_name] = MemoCache(self.maxsize)
+        return self.caches[func_name]
+
+    def report(self, file=None):
+        """Print hit rates for every memoized function"""
+        file = file or sys.stderr
+        print(f"Memoization (pure: {', '.join(sorted(self.pure)) or 'none'})", file=file)
+        if not self.caches:
+            return
+        print(
+            f"{'function':<20} {'lookups':>10} {'hits':>10} {'hit rate':>9} "
+            f"{'entries':>8} {'evicted':>8}",
+            file=file,
+        )
+        for name in sorted(self.caches):
+            cache = self.caches[name]
+            lookups = cache.hits + cache.misses
+            rate = cache.hits / lookups if lookups else 0.0
+            print(
+                f"{name:<20} {lookups:>10} {cache.hits:>10} {rate:>9.1%} "
+                f"{len(cache.entries):>8} {cache.evictions:>8}",
+                file=file,
+            )
@@ -0,0 +1,235 @@
+# tracelang_optimizer.py
+"""Constant folding and dead-branch elimination over the tuple AST
+
+Operators are applied with the same functions the closure compiler uses,
+so folding cannot change a result.  An operation that raises (division by
+zero, subtracting strings, ...) is left in place to fail at run time
+exactly as before.
+"""
+from tracelang_closures import BINARY_OPS, UNARY_OPS
+
+# Node type for each Python type a folded value can have
+LITERAL_NODES = {int: "num", float: "float", str: "string", bool: "bool"}
+LITERALS = frozenset(LITERAL_NODES.values())
+
+# Folding "ab" * 100000 would only move a large string into the AST
+MAX_FOLDED_STRING = 4096
+
+EMPTY_BLOCK = ("block", [], [])
+
+
+def count_nodes(node):
+    """Number of nodes in an AST, statement lists included"""
+    if isinstance(node, list):
+        return sum(count_nodes(child) for child in node)
+    if isinstance(node, tuple) and node and isinstance(node[0], str):
+        return 1 + sum(
+            count_nodes(child) for child in node[1:] if isinstance(child, (tuple, list))
+        )
+    return 0
+
+
+class ConstantFolder:
+    """Return an optimized copy of the AST; the input is not modified"""
+
+    def __init__(self):
+        self.folded = 0  # Operator nodes replaced by a literal
+        self.removed = 0  # Branches and loops that can never run
+        self.nodes_before = 0  # Nodes in the programs given to optimize()
+        self.nodes_after = 0
+        self.handlers = {
+            "program": self.fold_block,
+            "block": self.fold_block,
+            "declare": self.fold_declare,
+            "assign": self.fold_assign,
+            "array_assign": self.fold_array_assign,
+            "compound_assign": self.fold_compound_assign,
+            "if": self.fold_if,
+            "while": self.fold_while,
+            "for": self.fold_for,
+            "function": self.fold_function,
+            "return": self.fold_return,
+            "print": self.fold_print,
+            "binop": self.fold_binop,
+            "unop": self.fold_unop,
+            "array": self.fold_array,
+            "array_access": self.fold_array_access,
+            "trace_access": self.fold_trace_access,
+            "call": self.fold_call,
+        }
+
+    def optimize(self, node):
+        """Fold a program, adding up its size before and after"""
+        self.nodes_before += count_nodes(node)
+        node = self.fold(node)
+        self.nodes_after += count_nodes(node)
+        return node
+
+    def report(self):
+        """One line on what the programs optimized so far lost"""
+        return (
+            f"Optimizer: eliminated {self.nodes_before - self.nodes_after} of "
+            f"{self.nodes_before} AST nodes ({self.folded} constant expressions "
+            f"folded, {self.removed} dead branches removed)"
+        )
+
+    def fold(self, node):
+        if node is None:
+            return None
+        handler = self.handlers.get(node[0])
+        if handler is None:
+            return node  # Literals, variables and anything unknown
+        return handler(node)
+
+    def fold_statement(self, node):
+        """Fold a statement in a position that needs one, never None"""
+        node = self.fold(node)
+        if node is None:
+            return EMPTY_BLOCK
+        return node
+
+    # Statements
+
+    def fold_block(self, node):
+        statements = []
+        linenos = []
+        for stmt, lineno in zip(node[1], node[2]):
+            stmt = self.fold(stmt)
+            if stmt is None:
+                continue
+            if stmt[0] in LITERALS:
+                # An expression statement that folded to a constant
+                continue
+            statements.append(stmt)
+            linenos.append(lineno)
+        return (node[0], statements, linenos)
+
+    def fold_declare(self, node):
+        _, var_type, name, init_value, is_traced, trace_options = node
+        if "when" in trace_options:
+            trace_options = dict(trace_options, when=self.fold(trace_options["when"]))
+        return ("declare", var_type, name, self.fold(init_value), is_traced, trace_options)
+
+    def fold_assign(self, node):
+        _, name, expr = node
+        return ("assign", name, self.fold(expr))
+
+    def fold_array_assign(self, node):
+        _, name, index_expr, value_expr = node
+        return ("array_assign", name, self.fold(index_expr), self.fold(value_expr))
+
+    def fold_compound_assign(self, node):
+        _, name, op, expr = node
+        return ("compound_assign", name, op, self.fold(expr))
+
+    def fold_if(self, node):
+        _, condition, then_stmt, else_stmt = node
+        condition = self.fold(condition)
+        if condition[0] in LITERALS:
+            # Blocks share their enclosing scope, so the surviving branch
+            # can stand in for the whole statement
+            self.removed += 1
+            if condition[1]:
+                return self.fold_statement(then_stmt)
+            if else_stmt:
+                return self.fold_statement(else_stmt)
+            return None
+        then_stmt = self.fold_statement(then_stmt)
+        if else_stmt:
+            else_stmt = self.fold_statement(else_stmt)
+        return ("if", condition, then_stmt, else_stmt)
+
+    def fold_while(self, node):
+        _, condition, body = node
+        condition = self.fold(condition)
+        if condition[0] in LITERALS and not condition[1]:
+            self.removed += 1
+            return None
+        return ("while", condition, self.fold_statement(body))
+
+    def fold_for(self, node):
+        # The loop is kept even with a false condition: its init still runs
+        _, init, condition, update, body = node
+        return (
+            "for",
+            self.fold(init),
+            self.fold(condition),
+            self.fold(update),
+            self.fold_statement(body),
+        )
+
+    def fold_function(self, node):
+        _, return_type, name, params, body = node
+        return ("function", return_type, name, params, self.fold_statement(body))
+
+    def fold_return(self, node):
+        return ("return", self.fold(node[1]))
+
+    def fold_print(self, node):
+        return ("print", self.fold(node[1]))
+
+    # Expressions
+
+    def literal(self, value):
+        """Literal node for a folded value, or None if it cannot be one"""
+        node_type = LITERAL_NODES.get(type(value))
+        if node_type is None:
+            return None
+        if node_type == "string" and len(value) > MAX_FOLDED_STRING:
+            return None
+        self.folded += 1
+        return (node_type, value)
+
+    def fold_binop(self, node):
+        _, op, left, right = node
+        left = self.fold(left)
+        right = self.fold(right)
+        if left[0] in LITERALS and right[0] in LITERALS and op in BINARY_OPS:
+            try:
+                value = BINARY_OPS[op](left[1], right[1])
+            except Exception:
+                pass  # Raise when the program reaches it, not now
+            else:
+                folded = self.literal(value)
+                if folded is not None:
+                    return folded
+        return ("binop", op, left, right)
+
+    def fold_unop(self, node):
+        _, op, expr = node
+        expr = self.fold(expr)
+        if expr[0] in LITERALS and op in UNARY_OPS:
+            try:
+                value = UNARY_OPS[op](expr[1])
+            except Exception:
+                pass
+            else:
+                folded = self.literal(value)
+                if folded is not None:
+                    return folded
+        return ("unop", op, expr)
+
+    def fold_array(self, node):
+        return ("array", [self.fold(elem) for elem in node[1]])
+
+    def fold_array_access(self, node):
+        _, name, index_expr = node
+        return ("array_access", name, self.fold(index_expr))
+
+    def fold_trace_access(self, node):
+        _, name, index_expr = node
+        return ("trace_access", name, self.fold(index_expr))
+
+    def fold_call(self, node):
+        _, func_name, args = node
+        return ("call", func_name, [self.fold(arg) for arg in args])
+
+
+def optimize(node):
+    """Fold constants in a program
+
+    Returns the optimized AST and a one-line report of what was removed.
+    """
+    folder = ConstantFolder()
+    node = folder.optimize(node)
+    return node, folder.report()
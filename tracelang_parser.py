@@ -13,21 +13,27 @@ precedence = (
     ("left", "TIMES", "DIVIDE", "MODULO"),
     ("right", "NOT"),
     ("right", "UMINUS"),
+    ("right", "AT"),
 )
 
 
 def p_program(p):
     """program : statement_list"""
-    p[0] = ("program", p[1])
+    p[0] = ("program", p[1][0], p[1][1])
 
 
+# Blocks carry the line of each statement in a list parallel to the
+# statements: ("block", statements, linenos)
 def p_statement_list(p):
     """statement_list : statement_list statement
     | statement"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        # Extend in place; rebuilding the lists each time is quadratic
+        p[1][0].append(p[2])
+        p[1][1].append(p.lineno(2))
+        p[0] = p[1]
     else:
-        p[0] = [p[1]]
+        p[0] = ([p[1]], [p.lineno(1)])
 
 
 def p_statement(p):
@@ -50,25 +56,57 @@ def p_block(p):
     """block : LBRACE statement_list RBRACE
     | LBRACE RBRACE"""
     if len(p) == 4:
-        p[0] = ("block", p[2])
+        p[0] = ("block", p[2][0], p[2][1])
     else:
-        p[0] = ("block", [])
+        p[0] = ("block", [], [])
 
 
 # Variable declarations
 def p_declaration(p):
     """declaration : type ID ASSIGN expression SEMICOLON
     | type ID SEMICOLON
-    | TRACE type ID ASSIGN expression SEMICOLON
-    | TRACE type ID SEMICOLON"""
+    | trace_spec type ID ASSIGN expression SEMICOLON
+    | trace_spec type ID SEMICOLON"""
     if len(p) == 6:
-        p[0] = ("declare", p[1], p[2], p[4], False)
+        p[0] = ("declare", p[1], p[2], p[4], False, {})
     elif len(p) == 4:
-        p[0] = ("declare", p[1], p[2], None, False)
+        p[0] = ("declare", p[1], p[2], None, False, {})
     elif len(p) == 7:
-        p[0] = ("declare", p[2], p[3], p[5], True)  # traced variable
+        p[0] = ("declare", p[2], p[3], p[5], True, p[1])  # traced variable
+    else:
+        p[0] = ("declare", p[2], p[3], None, True, p[1])  # traced variable
+
+
+def p_trace_spec(p):
+    """trace_spec : TRACE
+    | TRACE LPAREN trace_options RPAREN"""
+    if len(p) == 5:
+        p[0] = dict(p[3])
     else:
-        p[0] = ("declare", p[2], p[3], None, True)  # traced variable
+        p[0] = {}
+
+
+# Options are checked where the declaration is compiled or run, see
+# tracelang_policy.trace_policy
+def p_trace_options(p):
+    """trace_options : trace_options COMMA trace_option
+    | trace_option"""
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
+
+
+def p_trace_option(p):
+    """trace_option : NUMBER
+    | ID ASSIGN expression"""
+    if len(p) == 2:
+        p[0] = ("history", p[1])  # keep only the last N values
+    elif p[1] in ("history", "every") and p[3][0] == "num":
+        p[0] = (p[1], p[3][1])
+    else:
+        p[0] = (p[1], p[3])
 
 
 def p_type(p):
@@ -135,7 +173,7 @@ def p_for_init(p):
     |"""
     if len(p) == 5:
         # Type declaration in for loop: int i = 0
-        p[0] = ("declare", p[1], p[2], p[4], False)
+        p[0] = ("declare", p[1], p[2], p[4], False, {})
     elif len(p) == 4:
         # Assignment in for loop: i = 0
         p[0] = ("assign", p[1], p[3])
@@ -179,7 +217,8 @@ def p_parameter_list(p):
     """parameter_list : parameter_list COMMA parameter
     | parameter"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -258,8 +297,10 @@ def p_expression_id(p):
     p[0] = ("var", p[1])
 
 
+# x@i binds tighter than any operator: x@i + 1 is (x@i) + 1 and x@-1 is
+# x@(-1), the value one update before the latest
 def p_expression_trace_access(p):
-    """expression : ID AT NUMBER"""
+    """expression : ID AT expression"""
     p[0] = ("trace_access", p[1], p[3])
 
 
@@ -290,16 +331,56 @@ def p_argument_list(p):
     """argument_list : argument_list COMMA expression
     | expression"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
 
 def p_error(p):
+    parser.error_count += 1
     if p:
         print(f"Syntax error at token {p.type} ('{p.value}') at line {p.lineno}")
     else:
         print("Syntax error at EOF")
 
 
-parser = yacc.yacc()
+# Parse tables are prebuilt in the tracelang_parsetab module and never
+# written at run time.  PLY checks them against the grammar's signature and
+# rebuilds them in memory if they are stale, so a grammar change still
+# works before `python tracelang_parser.py` regenerates the module.
+TABLE_MODULE = "tracelang_parsetab"
+LEXER_TABLE_MODULE = "tracelang_lextab"
+
+parser = yacc.yacc(tabmodule=TABLE_MODULE, write_tables=False, debug=False)
+parser.error_count = 0  # Syntax errors reported so far
+
+
+def build_tables():
+    """Regenerate the lexer and parser table modules next to this file"""
+    import os
+    import sys
+
+    import ply.lex as lex
+
+    import tracelang_lexer
+
+    outputdir = os.path.dirname(os.path.abspath(__file__))
+    for name in (TABLE_MODULE, LEXER_TABLE_MODULE):
+        path = os.path.join(outputdir, name + ".py")
+        if os.path.exists(path):
+            os.remove(path)
+        # Already imported by the parser built above; PLY must not reuse it
+        sys.modules.pop(name, None)
+    lex.lex(
+        module=tracelang_lexer,
+        optimize=True,
+        lextab=LEXER_TABLE_MODULE,
+        outputdir=outputdir,
+    )
+    yacc.yacc(tabmodule=TABLE_MODULE, outputdir=outputdir, debug=False)
+    print(f"Wrote {TABLE_MODULE}.py and {LEXER_TABLE_MODULE}.py to {outputdir}")
+
+
+if __name__ == "__main__":
+    build_tables()
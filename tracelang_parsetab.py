@@ -0,0 +1,124 @@
+
+# tracelang_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDleftEQNEleftLTGTLEGEleftPLUSMINUSleftTIMESDIVIDEMODULOrightNOTrightUMINUSrightATAND ARRAY ASSIGN AT BOOL COMMA DECREMENT DIVIDE DIVIDEASSIGN ELSE EQ FALSE FLOAT FLOAT_TYPE FOR FUNCTION GE GT ID IF INCREMENT INT LBRACE LBRACKET LE LPAREN LT MINUS MINUSASSIGN MODULO NE NOT NUMBER OR PLUS PLUSASSIGN PRINT RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING STRING_TYPE TIMES TIMESASSIGN TRACE TRUE WHILEprogram : statement_liststatement_list : statement_list statement\n    | statementstatement : declaration\n    | assignment\n    | compound_assignment\n    | increment_decrement\n    | if_statement\n    | while_statement\n    | for_statement\n    | return_statement\n    | print_statement\n    | function_declaration\n    | expression SEMICOLON\n    | blockblock : LBRACE statement_list RBRACE\n    | LBRACE RBRACEdeclaration : type ID ASSIGN expression SEMICOLON\n    | type ID SEMICOLON\n    | trace_spec type ID ASSIGN expression SEMICOLON\n    | trace_spec type ID SEMICOLONtrace_spec : TRACE\n    | TRACE LPAREN trace_options RPARENtrace_options : trace_options COMMA trace_option\n    | trace_optiontrace_option : NUMBER\n    | ID ASSIGN expressiontype : INT\n    | FLOAT_TYPE\n    | STRING_TYPE\n    | BOOL\n    | array_typearray_type : ARRAY LT type GTassignment : ID ASSIGN expression SEMICOLON\n    | ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLONcompound_assignment : ID PLUSASSIGN expression SEMICOLON\n    | ID MINUSASSIGN expression SEMICOLON\n    | ID TIMESASSIGN expression SEMICOLON\n    | ID DIVIDEASSIGN expression SEMICOLONincrement_decrement : ID INCREMENT SEMICOLON\n    | ID DECREMENT SEMICOLONif_statement : IF LPAREN expression RPAREN statement\n    | IF LPAREN expression RPAREN statement ELSE statementwhile_statement : WHILE LPAREN expression RPAREN statementfor_statement : FOR LPAREN for_init SEMICOLON expression SEMICOLON for_update RPAREN statementfor_init : type ID ASSIGN expression\n    | ID ASSIGN expression\n    |for_update : ID ASSIGN expression\n    | ID PLUSASSIGN expression\n    | ID MINUSASSIGN expression\n    | ID TIMESASSIGN expression\n    | ID DIVIDEASSIGN expression\n    | ID INCREMENT\n    | ID DECREMENT\n    |function_declaration : FUNCTION type ID LPAREN parameter_list RPAREN block\n    | FUNCTION type ID LPAREN RPAREN blockparameter_list : parameter_list COMMA parameter\n    | parameterparameter : type IDreturn_statement : RETURN expression SEMICOLON\n    | RETURN SEMICOLONprint_statement : PRINT LPAREN expression RPAREN SEMICOLONexpression : expression PLUS expression\n    | expression MINUS expression\n    | expression TIMES expression\n    | expression DIVIDE expression\n    | expression MODULO expression\n    | expression EQ expression\n    | expression NE expression\n    | expression LT expression\n    | expression GT expression\n    | expression LE expression\n    | expression GE expression\n    | expression AND expression\n    | expression OR expressionexpression : NOT expression\n    | MINUS expression %prec UMINUSexpression : LPAREN expression RPARENexpression : NUMBERexpression : FLOATexpression : STRINGexpression : TRUE\n    | FALSEexpression : IDexpression : ID AT expressionexpression : LBRACKET argument_list RBRACKET\n    | LBRACKET RBRACKETexpression : ID LBRACKET expression RBRACKETexpression : ID LPAREN argument_list RPAREN\n    | ID LPAREN RPARENargument_list : argument_list COMMA expression\n    | expression'
+    
+_lr_action_items = {'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,16,19,21,24,27,28,34,35,36,37,38,39,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,68,73,75,76,78,79,80,83,84,85,100,101,108,109,115,116,121,123,126,133,135,136,137,138,140,141,144,145,146,148,152,153,154,155,156,159,160,162,164,165,172,173,174,179,180,181,184,186,187,188,189,190,191,194,],[17,17,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,57,72,72,72,72,72,17,-28,-29,-30,-31,-32,-2,-14,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,113,72,72,122,-63,72,125,17,-17,130,72,-19,-40,-41,72,72,147,-62,-16,-34,-36,-37,-38,-39,72,-21,17,17,72,72,130,72,-33,-18,72,-42,-44,72,-64,176,-20,17,183,-58,-35,-43,-57,17,72,72,72,72,72,-45,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[20,20,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,20,-2,-14,-63,20,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,20,20,-18,-42,-44,-64,-20,20,-58,-35,-43,-57,20,-45,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[22,22,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,22,-2,-14,-63,22,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,22,22,-18,-42,-44,-64,-20,22,-58,-35,-43,-57,22,-45,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[23,23,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,23,-2,-14,-63,23,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,23,23,-18,-42,-44,-64,-20,23,-58,-35,-43,-57,23,-45,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[24,24,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,24,-2,-14,-63,24,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,24,24,-18,-42,-44,-64,-20,24,-58,-35,-43,-57,24,-45,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[25,25,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,25,-2,-14,-63,25,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,25,25,-18,-42,-44,-64,-20,25,-58,-35,-43,-57,25,-45,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[26,26,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,26,-2,-14,-63,26,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,26,26,-18,-42,-44,-64,-20,26,-58,-35,-43,-57,26,-45,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,78,79,83,84,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[28,28,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,28,28,28,28,28,28,-2,-14,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-63,28,28,-17,28,-19,-40,-41,28,28,-62,-16,-34,-36,-37,-38,-39,28,-21,28,28,28,28,28,-18,28,-42,-44,28,-64,-20,28,-58,-35,-43,-57,28,28,28,28,28,28,-45,]),'MINUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,17,19,21,24,27,28,29,30,31,32,33,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,70,71,72,73,74,75,77,78,79,81,82,83,84,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,114,115,116,117,118,119,123,124,126,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,155,156,157,158,159,160,161,162,163,164,170,171,172,173,175,179,180,181,184,186,187,188,189,190,191,194,195,196,197,198,199,],[27,27,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,45,-15,-86,27,27,27,27,27,-81,-82,-83,-84,-85,27,-2,-14,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-89,45,-86,27,45,27,45,-63,27,-79,-78,27,-17,-65,-66,-67,-68,-69,45,45,45,45,45,45,45,45,27,-19,45,45,45,45,45,45,-40,-41,-87,-92,-88,27,27,45,-80,45,-62,45,-16,45,-34,-90,-36,-37,-38,-39,-91,27,-21,45,45,27,27,27,27,27,-18,27,45,-90,-42,-44,45,27,45,-64,45,45,-20,27,45,-58,-35,-43,-57,27,27,27,27,27,27,-45,45,45,45,45,45,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,17,19,20,21,22,23,24,25,27,28,34,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,72,73,75,78,79,83,84,100,101,108,109,115,116,123,125,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[21,21,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,67,21,73,21,75,76,21,79,21,21,21,85,-2,-14,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,67,21,21,-63,21,21,-17,21,-19,-40,-41,21,21,-62,150,-16,-34,-36,-37,-38,-39,21,-21,21,21,21,21,21,-18,21,-42,-44,21,-64,-20,21,-58,-35,-43,-57,21,21,21,21,21,21,-45,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,78,79,83,84,85,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,152,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[29,29,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,29,29,29,29,29,29,-2,-14,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-63,29,29,-17,129,29,-19,-40,-41,29,29,-62,-16,-34,-36,-37,-38,-39,29,-21,29,29,29,29,129,29,-18,29,-42,-44,29,-64,-20,29,-58,-35,-43,-57,29,29,29,29,29,29,-45,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,78,79,83,84,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[30,30,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,30,30,30,30,30,30,-2,-14,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-63,30,30,-17,30,-19,-40,-41,30,30,-62,-16,-34,-36,-37,-38,-39,30,-21,30,30,30,30,30,-18,30,-42,-44,30,-64,-20,30,-58,-35,-43,-57,30,30,30,30,30,30,-45,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,78,79,83,84,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[31,31,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,31,31,31,31,31,31,-2,-14,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-63,31,31,-17,31,-19,-40,-41,31,31,-62,-16,-34,-36,-37,-38,-39,31,-21,31,31,31,31,31,-18,31,-42,-44,31,-64,-20,31,-58,-35,-43,-57,31,31,31,31,31,31,-45,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,78,79,83,84,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[32,32,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,32,32,32,32,32,32,-2,-14,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-63,32,32,-17,32,-19,-40,-41,32,32,-62,-16,-34,-36,-37,-38,-39,32,-21,32,32,32,32,32,-18,32,-42,-44,32,-64,-20,32,-58,-35,-43,-57,32,32,32,32,32,32,-45,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,78,79,83,84,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[33,33,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,33,33,33,33,33,33,-2,-14,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-63,33,33,-17,33,-19,-40,-41,33,33,-62,-16,-34,-36,-37,-38,-39,33,-21,33,33,33,33,33,-18,33,-42,-44,33,-64,-20,33,-58,-35,-43,-57,33,33,33,33,33,33,-45,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,17,19,21,24,27,28,34,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,72,73,75,78,79,83,84,100,101,108,109,115,116,123,126,133,135,136,137,138,140,141,144,145,146,148,153,155,156,159,160,162,164,172,173,179,180,181,184,186,187,188,189,190,191,194,],[19,19,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,59,19,19,19,19,19,19,-2,-14,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,116,19,19,-63,19,19,-17,19,-19,-40,-41,19,19,-62,-16,-34,-36,-37,-38,-39,19,-21,19,19,19,19,19,-18,19,-42,-44,19,-64,-20,19,-58,-35,-43,-57,19,19,19,19,19,19,-45,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,167,172,173,177,179,180,181,184,186,194,],[34,34,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,34,-2,-14,-63,34,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,34,34,-18,-42,-44,-64,34,-20,34,34,-58,-35,-43,-57,34,-45,]),'INT':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,40,42,43,76,78,83,84,86,101,108,109,123,126,133,135,136,137,138,141,144,145,150,151,155,159,160,164,172,173,178,179,180,181,184,186,194,],[35,35,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,35,35,35,-22,-2,-14,35,-63,35,-17,35,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,35,35,35,-23,-18,-42,-44,-64,-20,35,35,-58,-35,-43,-57,35,-45,]),'FLOAT_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,40,42,43,76,78,83,84,86,101,108,109,123,126,133,135,136,137,138,141,144,145,150,151,155,159,160,164,172,173,178,179,180,181,184,186,194,],[36,36,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,36,36,36,-22,-2,-14,36,-63,36,-17,36,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,36,36,36,-23,-18,-42,-44,-64,-20,36,36,-58,-35,-43,-57,36,-45,]),'STRING_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,40,42,43,76,78,83,84,86,101,108,109,123,126,133,135,136,137,138,141,144,145,150,151,155,159,160,164,172,173,178,179,180,181,184,186,194,],[37,37,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,37,37,37,-22,-2,-14,37,-63,37,-17,37,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,37,37,37,-23,-18,-42,-44,-64,-20,37,37,-58,-35,-43,-57,37,-45,]),'BOOL':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,40,42,43,76,78,83,84,86,101,108,109,123,126,133,135,136,137,138,141,144,145,150,151,155,159,160,164,172,173,178,179,180,181,184,186,194,],[38,38,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,38,38,38,-22,-2,-14,38,-63,38,-17,38,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,38,38,38,-23,-18,-42,-44,-64,-20,38,38,-58,-35,-43,-57,38,-45,]),'TRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,144,145,155,159,160,164,172,173,179,180,181,184,186,194,],[40,40,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,40,-2,-14,-63,40,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,40,40,-18,-42,-44,-64,-20,40,-58,-35,-43,-57,40,-45,]),'ARRAY':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,18,26,34,40,42,43,76,78,83,84,86,101,108,109,123,126,133,135,136,137,138,141,144,145,150,151,155,159,160,164,172,173,178,179,180,181,184,186,194,],[41,41,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,41,41,41,-22,-2,-14,41,-63,41,-17,41,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,41,41,41,-23,-18,-42,-44,-64,-20,41,41,-58,-35,-43,-57,41,-45,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,15,42,43,78,84,101,108,109,123,126,133,135,136,137,138,141,155,159,160,164,172,179,180,181,184,194,],[0,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,-2,-14,-63,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,-18,-42,-44,-64,-20,-58,-35,-43,-57,-45,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,15,34,42,43,78,83,84,101,108,109,123,126,133,135,136,137,138,141,155,159,160,164,172,179,180,181,184,194,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,84,-2,-14,-63,126,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,-18,-42,-44,-64,-20,-58,-35,-43,-57,-45,]),'ELSE':([4,5,6,7,8,9,10,11,12,13,15,43,78,84,101,108,109,123,126,133,135,136,137,138,141,155,159,160,164,172,179,180,181,184,194,],[-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-15,-14,-63,-17,-19,-40,-41,-62,-16,-34,-36,-37,-38,-39,-21,-18,173,-44,-64,-20,-58,-35,-43,-57,-45,]),'SEMICOLON':([14,17,24,29,30,31,32,33,57,64,65,70,72,76,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,104,105,106,107,110,112,113,114,118,120,132,134,139,149,157,158,161,163,171,175,],[43,-86,78,-81,-82,-83,-84,-85,101,108,109,-89,-86,-48,123,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,133,135,136,137,138,-87,-92,141,-88,-80,146,155,-90,-91,164,172,-90,174,-47,180,-46,]),'PLUS':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[44,-86,-81,-82,-83,-84,-85,-89,44,-86,44,44,-79,-78,-65,-66,-67,-68,-69,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-87,-92,-88,44,-80,44,44,44,-90,-91,44,44,44,-90,44,44,44,44,44,44,44,44,44,44,]),'TIMES':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[46,-86,-81,-82,-83,-84,-85,-89,46,-86,46,46,-79,-78,46,46,-67,-68,-69,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-87,-92,-88,46,-80,46,46,46,-90,-91,46,46,46,-90,46,46,46,46,46,46,46,46,46,46,]),'DIVIDE':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[47,-86,-81,-82,-83,-84,-85,-89,47,-86,47,47,-79,-78,47,47,-67,-68,-69,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-87,-92,-88,47,-80,47,47,47,-90,-91,47,47,47,-90,47,47,47,47,47,47,47,47,47,47,]),'MODULO':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[48,-86,-81,-82,-83,-84,-85,-89,48,-86,48,48,-79,-78,48,48,-67,-68,-69,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-87,-92,-88,48,-80,48,48,48,-90,-91,48,48,48,-90,48,48,48,48,48,48,48,48,48,48,]),'EQ':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[49,-86,-81,-82,-83,-84,-85,-89,49,-86,49,49,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,49,49,49,49,49,49,49,49,-87,-92,-88,49,-80,49,49,49,-90,-91,49,49,49,-90,49,49,49,49,49,49,49,49,49,49,]),'NE':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[50,-86,-81,-82,-83,-84,-85,-89,50,-86,50,50,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,50,50,50,50,50,50,50,50,-87,-92,-88,50,-80,50,50,50,-90,-91,50,50,50,-90,50,50,50,50,50,50,50,50,50,50,]),'LT':([14,17,29,30,31,32,33,41,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[51,-86,-81,-82,-83,-84,-85,86,-89,51,-86,51,51,-79,-78,-65,-66,-67,-68,-69,51,51,-72,-73,-74,-75,51,51,51,51,51,51,51,51,-87,-92,-88,51,-80,51,51,51,-90,-91,51,51,51,-90,51,51,51,51,51,51,51,51,51,51,]),'GT':([14,17,29,30,31,32,33,35,36,37,38,39,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,131,132,134,139,142,143,154,157,158,161,163,170,171,175,195,196,197,198,199,],[52,-86,-81,-82,-83,-84,-85,-28,-29,-30,-31,-32,-89,52,-86,52,52,-79,-78,-65,-66,-67,-68,-69,52,52,-72,-73,-74,-75,52,52,52,52,52,52,52,52,-87,-92,-88,52,-80,52,52,154,52,-90,-91,52,52,-33,52,-90,52,52,52,52,52,52,52,52,52,52,]),'LE':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[53,-86,-81,-82,-83,-84,-85,-89,53,-86,53,53,-79,-78,-65,-66,-67,-68,-69,53,53,-72,-73,-74,-75,53,53,53,53,53,53,53,53,-87,-92,-88,53,-80,53,53,53,-90,-91,53,53,53,-90,53,53,53,53,53,53,53,53,53,53,]),'GE':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[54,-86,-81,-82,-83,-84,-85,-89,54,-86,54,54,-79,-78,-65,-66,-67,-68,-69,54,54,-72,-73,-74,-75,54,54,54,54,54,54,54,54,-87,-92,-88,54,-80,54,54,54,-90,-91,54,54,54,-90,54,54,54,54,54,54,54,54,54,54,]),'AND':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[55,-86,-81,-82,-83,-84,-85,-89,55,-86,55,55,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,55,55,55,55,55,55,55,-87,-92,-88,55,-80,55,55,55,-90,-91,55,55,55,-90,55,55,55,55,55,55,55,55,55,55,]),'OR':([14,17,29,30,31,32,33,70,71,72,74,77,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,112,114,117,118,119,124,132,134,139,142,143,157,158,161,163,170,171,175,195,196,197,198,199,],[56,-86,-81,-82,-83,-84,-85,-89,56,-86,56,56,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,56,56,56,56,56,56,-87,-92,-88,56,-80,56,56,56,-90,-91,56,56,56,-90,56,56,56,56,56,56,56,56,56,56,]),'ASSIGN':([17,57,113,122,130,134,147,183,],[58,100,140,148,153,156,162,187,]),'PLUSASSIGN':([17,183,],[60,188,]),'MINUSASSIGN':([17,183,],[61,189,]),'TIMESASSIGN':([17,183,],[62,190,]),'DIVIDEASSIGN':([17,183,],[63,191,]),'INCREMENT':([17,183,],[64,192,]),'DECREMENT':([17,183,],[65,193,]),'AT':([17,72,],[66,66,]),'RBRACKET':([19,29,30,31,32,33,69,70,71,72,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,103,110,112,114,118,139,142,143,158,],[70,-81,-82,-83,-84,-85,114,-89,-94,-86,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,134,-87,-92,-88,-80,-91,-93,158,-90,]),'COMMA':([29,30,31,32,33,69,70,71,72,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,110,111,112,114,118,127,128,129,139,142,158,166,168,169,170,176,185,],[-81,-82,-83,-84,-85,115,-89,-94,-86,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-87,115,-92,-88,-80,152,-25,-26,-91,-93,-90,178,-60,-24,-27,-61,-59,]),'RPAREN':([29,30,31,32,33,67,70,71,72,74,81,82,87,88,89,90,91,92,93,94,95,96,97,98,99,110,111,112,114,117,118,119,124,127,128,129,139,142,150,158,166,168,169,170,174,176,182,185,192,193,195,196,197,198,199,],[-81,-82,-83,-84,-85,112,-89,-94,-86,118,-79,-78,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-87,139,-92,-88,144,-80,145,149,151,-25,-26,-91,-93,167,-90,177,-60,-24,-27,-56,-61,186,-59,-54,-55,-49,-50,-51,-52,-53,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,34,],[2,83,]),'statement':([0,2,34,83,144,145,173,186,],[3,42,3,42,159,160,181,194,]),'declaration':([0,2,34,83,144,145,173,186,],[4,4,4,4,4,4,4,4,]),'assignment':([0,2,34,83,144,145,173,186,],[5,5,5,5,5,5,5,5,]),'compound_assignment':([0,2,34,83,144,145,173,186,],[6,6,6,6,6,6,6,6,]),'increment_decrement':([0,2,34,83,144,145,173,186,],[7,7,7,7,7,7,7,7,]),'if_statement':([0,2,34,83,144,145,173,186,],[8,8,8,8,8,8,8,8,]),'while_statement':([0,2,34,83,144,145,173,186,],[9,9,9,9,9,9,9,9,]),'for_statement':([0,2,34,83,144,145,173,186,],[10,10,10,10,10,10,10,10,]),'return_statement':([0,2,34,83,144,145,173,186,],[11,11,11,11,11,11,11,11,]),'print_statement':([0,2,34,83,144,145,173,186,],[12,12,12,12,12,12,12,12,]),'function_declaration':([0,2,34,83,144,145,173,186,],[13,13,13,13,13,13,13,13,]),'expression':([0,2,19,21,24,27,28,34,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,62,63,66,67,73,75,79,83,100,115,116,140,144,145,146,148,153,156,162,173,186,187,188,189,190,191,],[14,14,71,74,77,81,82,14,87,88,89,90,91,92,93,94,95,96,97,98,99,102,103,104,105,106,107,110,71,117,119,124,14,132,142,143,157,14,14,161,163,170,171,175,14,14,195,196,197,198,199,]),'block':([0,2,34,83,144,145,167,173,177,186,],[15,15,15,15,15,15,179,15,184,15,]),'type':([0,2,18,26,34,76,83,86,144,145,150,173,178,186,],[16,16,68,80,16,121,16,131,16,16,165,16,165,16,]),'trace_spec':([0,2,34,83,144,145,173,186,],[18,18,18,18,18,18,18,18,]),'array_type':([0,2,18,26,34,76,83,86,144,145,150,173,178,186,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'argument_list':([19,67,],[69,111,]),'for_init':([76,],[120,]),'trace_options':([85,],[127,]),'trace_option':([85,152,],[128,169,]),'parameter_list':([150,],[166,]),'parameter':([150,178,],[168,185,]),'for_update':([174,],[182,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> statement_list','program',1,'p_program','tracelang_parser.py',21),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','tracelang_parser.py',28),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','tracelang_parser.py',29),
+  ('statement -> declaration','statement',1,'p_statement','tracelang_parser.py',40),
+  ('statement -> assignment','statement',1,'p_statement','tracelang_parser.py',41),
+  ('statement -> compound_assignment','statement',1,'p_statement','tracelang_parser.py',42),
+  ('statement -> increment_decrement','statement',1,'p_statement','tracelang_parser.py',43),
+  ('statement -> if_statement','statement',1,'p_statement','tracelang_parser.py',44),
+  ('statement -> while_statement','statement',1,'p_statement','tracelang_parser.py',45),
+  ('statement -> for_statement','statement',1,'p_statement','tracelang_parser.py',46),
+  ('statement -> return_statement','statement',1,'p_statement','tracelang_parser.py',47),
+  ('statement -> print_statement','statement',1,'p_statement','tracelang_parser.py',48),
+  ('statement -> function_declaration','statement',1,'p_statement','tracelang_parser.py',49),
+  ('statement -> expression SEMICOLON','statement',2,'p_statement','tracelang_parser.py',50),
+  ('statement -> block','statement',1,'p_statement','tracelang_parser.py',51),
+  ('block -> LBRACE statement_list RBRACE','block',3,'p_block','tracelang_parser.py',56),
+  ('block -> LBRACE RBRACE','block',2,'p_block','tracelang_parser.py',57),
+  ('declaration -> type ID ASSIGN expression SEMICOLON','declaration',5,'p_declaration','tracelang_parser.py',66),
+  ('declaration -> type ID SEMICOLON','declaration',3,'p_declaration','tracelang_parser.py',67),
+  ('declaration -> trace_spec type ID ASSIGN expression SEMICOLON','declaration',6,'p_declaration','tracelang_parser.py',68),
+  ('declaration -> trace_spec type ID SEMICOLON','declaration',4,'p_declaration','tracelang_parser.py',69),
+  ('trace_spec -> TRACE','trace_spec',1,'p_trace_spec','tracelang_parser.py',81),
+  ('trace_spec -> TRACE LPAREN trace_options RPAREN','trace_spec',4,'p_trace_spec','tracelang_parser.py',82),
+  ('trace_options -> trace_options COMMA trace_option','trace_options',3,'p_trace_options','tracelang_parser.py',92),
+  ('trace_options -> trace_option','trace_options',1,'p_trace_options','tracelang_parser.py',93),
+  ('trace_option -> NUMBER','trace_option',1,'p_trace_option','tracelang_parser.py',102),
+  ('trace_option -> ID ASSIGN expression','trace_option',3,'p_trace_option','tracelang_parser.py',103),
+  ('type -> INT','type',1,'p_type','tracelang_parser.py',113),
+  ('type -> FLOAT_TYPE','type',1,'p_type','tracelang_parser.py',114),
+  ('type -> STRING_TYPE','type',1,'p_type','tracelang_parser.py',115),
+  ('type -> BOOL','type',1,'p_type','tracelang_parser.py',116),
+  ('type -> array_type','type',1,'p_type','tracelang_parser.py',117),
+  ('array_type -> ARRAY LT type GT','array_type',4,'p_array_type','tracelang_parser.py',122),
+  ('assignment -> ID ASSIGN expression SEMICOLON','assignment',4,'p_assignment','tracelang_parser.py',128),
+  ('assignment -> ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLON','assignment',7,'p_assignment','tracelang_parser.py',129),
+  ('compound_assignment -> ID PLUSASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',137),
+  ('compound_assignment -> ID MINUSASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',138),
+  ('compound_assignment -> ID TIMESASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',139),
+  ('compound_assignment -> ID DIVIDEASSIGN expression SEMICOLON','compound_assignment',4,'p_compound_assignment','tracelang_parser.py',140),
+  ('increment_decrement -> ID INCREMENT SEMICOLON','increment_decrement',3,'p_increment_decrement','tracelang_parser.py',145),
+  ('increment_decrement -> ID DECREMENT SEMICOLON','increment_decrement',3,'p_increment_decrement','tracelang_parser.py',146),
+  ('if_statement -> IF LPAREN expression RPAREN statement','if_statement',5,'p_if_statement','tracelang_parser.py',152),
+  ('if_statement -> IF LPAREN expression RPAREN statement ELSE statement','if_statement',7,'p_if_statement','tracelang_parser.py',153),
+  ('while_statement -> WHILE LPAREN expression RPAREN statement','while_statement',5,'p_while_statement','tracelang_parser.py',161),
+  ('for_statement -> FOR LPAREN for_init SEMICOLON expression SEMICOLON for_update RPAREN statement','for_statement',9,'p_for_statement','tracelang_parser.py',166),
+  ('for_init -> type ID ASSIGN expression','for_init',4,'p_for_init','tracelang_parser.py',171),
+  ('for_init -> ID ASSIGN expression','for_init',3,'p_for_init','tracelang_parser.py',172),
+  ('for_init -> <empty>','for_init',0,'p_for_init','tracelang_parser.py',173),
+  ('for_update -> ID ASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',185),
+  ('for_update -> ID PLUSASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',186),
+  ('for_update -> ID MINUSASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',187),
+  ('for_update -> ID TIMESASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',188),
+  ('for_update -> ID DIVIDEASSIGN expression','for_update',3,'p_for_update','tracelang_parser.py',189),
+  ('for_update -> ID INCREMENT','for_update',2,'p_for_update','tracelang_parser.py',190),
+  ('for_update -> ID DECREMENT','for_update',2,'p_for_update','tracelang_parser.py',191),
+  ('for_update -> <empty>','for_update',0,'p_for_update','tracelang_parser.py',192),
+  ('function_declaration -> FUNCTION type ID LPAREN parameter_list RPAREN block','function_declaration',7,'p_function_declaration','tracelang_parser.py',208),
+  ('function_declaration -> FUNCTION type ID LPAREN RPAREN block','function_declaration',6,'p_function_declaration','tracelang_parser.py',209),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','tracelang_parser.py',217),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','tracelang_parser.py',218),
+  ('parameter -> type ID','parameter',2,'p_parameter','tracelang_parser.py',227),
+  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','tracelang_parser.py',232),
+  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','tracelang_parser.py',233),
+  ('print_statement -> PRINT LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','tracelang_parser.py',241),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','tracelang_parser.py',247),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','tracelang_parser.py',248),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','tracelang_parser.py',249),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','tracelang_parser.py',250),
+  ('expression -> expression MODULO expression','expression',3,'p_expression_binop','tracelang_parser.py',251),
+  ('expression -> expression EQ expression','expression',3,'p_expression_binop','tracelang_parser.py',252),
+  ('expression -> expression NE expression','expression',3,'p_expression_binop','tracelang_parser.py',253),
+  ('expression -> expression LT expression','expression',3,'p_expression_binop','tracelang_parser.py',254),
+  ('expression -> expression GT expression','expression',3,'p_expression_binop','tracelang_parser.py',255),
+  ('expression -> expression LE expression','expression',3,'p_expression_binop','tracelang_parser.py',256),
+  ('expression -> expression GE expression','expression',3,'p_expression_binop','tracelang_parser.py',257),
+  ('expression -> expression AND expression','expression',3,'p_expression_binop','tracelang_parser.py',258),
+  ('expression -> expression OR expression','expression',3,'p_expression_binop','tracelang_parser.py',259),
+  ('expression -> NOT expression','expression',2,'p_expression_unary','tracelang_parser.py',264),
+  ('expression -> MINUS expression','expression',2,'p_expression_unary','tracelang_parser.py',265),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','tracelang_parser.py',270),
+  ('expression -> NUMBER','expression',1,'p_expression_number','tracelang_parser.py',275),
+  ('expression -> FLOAT','expression',1,'p_expression_float','tracelang_parser.py',280),
+  ('expression -> STRING','expression',1,'p_expression_string','tracelang_parser.py',285),
+  ('expression -> TRUE','expression',1,'p_expression_bool','tracelang_parser.py',290),
+  ('expression -> FALSE','expression',1,'p_expression_bool','tracelang_parser.py',291),
+  ('expression -> ID','expression',1,'p_expression_id','tracelang_parser.py',296),
+  ('expression -> ID AT expression','expression',3,'p_expression_trace_access','tracelang_parser.py',303),
+  ('expression -> LBRACKET argument_list RBRACKET','expression',3,'p_expression_array_literal','tracelang_parser.py',308),
+  ('expression -> LBRACKET RBRACKET','expression',2,'p_expression_array_literal','tracelang_parser.py',309),
+  ('expression -> ID LBRACKET expression RBRACKET','expression',4,'p_expression_array_access','tracelang_parser.py',317),
+  ('expression -> ID LPAREN argument_list RPAREN','expression',4,'p_expression_function_call','tracelang_parser.py',322),
+  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_function_call','tracelang_parser.py',323),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','tracelang_parser.py',331),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','tracelang_parser.py',332),
+]
@@ -0,0 +1,169 @@
+# tracelang_policy.py
+"""Trace policies: which updates of a traced variable are kept
+
+    trace(every=100) int i;              // the 1st, 101st, 201st, ... update
+    trace(when=x >= 0 && x < 10) int x;  // updates to a value in [0, 10)
+    trace(within=solve) int steps;       // updates while solve() is running
+    trace(50, every=10, within=[f, g]) float t;
+
+TraceSystem checks a variable's policy before an update is formatted or
+stored, so an update it drops costs only the check.  A dropped update is
+in neither the trace nor the history that x@i and the hist_* built-ins
+read, and the final value shown is the last one kept.  The filters apply
+in the order within, when, every, so every counts the updates that the
+other two keep.
+
+A when= expression sees the variable bound to its new value.  It may use
+that variable, literals, operators and the array built-ins; anything
+else would depend on where the assignment happens.
+"""
+from tracelang_arrays import BUILTINS, MUTATING_BUILTINS
+
+OPTIONS = frozenset(("history", "every", "when", "within"))
+
+# Nodes a when= expression may contain besides variables and calls
+PREDICATE_NODES = frozenset(
+    ("num", "float", "string", "bool", "binop", "unop", "array", "array_access")
+)
+
+
+class TracePolicy:
+    """Decides which updates of one traced variable are kept
+
+    Holds the count for every=, so each traced variable needs its own.
+    """
+
+    __slots__ = ("every", "predicate", "within", "count")
+
+    def __init__(self, every=1, predicate=None, within=None):
+        self.every = every
+        self.predicate = predicate  # Function of the new value, or None
+        self.within = within  # Context names of which one must be calling
+        self.count = 0  # Updates that reached the every= check
+
+    def keep(self, value, trace_system):
+        """Whether to record an update of the variable to value"""
+        if self.within is not None:
+            context = trace_system.context_stack[-1]
+            answers = context.within
+            inside = answers.get(self.within) if answers is not None else None
+            if inside is None:
+                inside = self.is_within(context)
+            if not inside:
+                return False
+        if self.predicate is not None and not self.predicate(value):
+            return False
+        if self.every > 1:
+            count = self.count
+            self.count = count + 1
+            return count % self.every == 0
+        return True
+
+    def is_within(self, context):
+        """Whether a within= function is on the call path of a context
+
+        The answer is cached on the context, and on the callers up to the
+        nearest with one cached already, so each context works it out
+        once from its parent's.  It goes when the context does.
+        """
+        within = self.within
+        unknown = []  # Contexts up the call path without an answer
+        inside = False
+        while context is not None:
+            if context.within is None:
+                context.within = {}
+            else:
+                known = context.within.get(within)
+                if known is not None:
+                    inside = known
+                    break
+            unknown.append(context)
+            if context.func_name in within:
+                inside = True
+                break
+            context = context.parent
+        for context in unknown:
+            context.within[within] = inside
+        return inside
+
+
+def trace_policy(var_name, trace_options, compile_predicate):
+    """The TracePolicy of a traced declaration, or None to keep every update
+
+    Checks all the options, history= included.  compile_predicate(expr,
+    var_name) turns the when= expression into a function of the new
+    value, evaluated the way the calling engine evaluates expressions.
+    """
+    for option in trace_options:
+        if option not in OPTIONS:
+            raise ValueError(f"Unknown trace option '{option}' for '{var_name}'")
+    history = trace_options.get("history")
+    if history is not None and (not isinstance(history, int) or history < 1):
+        raise TypeError(
+            f"Trace option history of '{var_name}' must be a positive integer"
+        )
+
+    every = trace_options.get("every", 1)
+    if not isinstance(every, int) or every < 1:
+        raise TypeError(
+            f"Trace option every of '{var_name}' must be a positive integer"
+        )
+
+    predicate = None
+    when = trace_options.get("when")
+    if when is not None:
+        check_predicate(when, var_name)
+        predicate = compile_predicate(when, var_name)
+
+    within = trace_options.get("within")
+    if within is not None:
+        within = frozenset(
+            # Contexts are named as push_context is given them
+            name.capitalize()
+            for name in function_names(within, var_name)
+        )
+
+    if every == 1 and predicate is None and within is None:
+        return None
+    return TracePolicy(every, predicate, within)
+
+
+def check_predicate(node, var_name):
+    """Reject a when= expression that uses more than the variable itself"""
+    nodetype = node[0]
+    if nodetype == "var" or nodetype == "array_access":
+        if node[1] != var_name:
+            raise NameError(
+                f"Trace option when of '{var_name}' can only read '{var_name}', "
+                f"not '{node[1]}'"
+            )
+    elif nodetype == "call":
+        if node[1] not in BUILTINS or node[1] in MUTATING_BUILTINS:
+            raise NameError(
+                f"Trace option when of '{var_name}' cannot call '{node[1]}'"
+            )
+    elif nodetype == "trace_access":
+        raise TypeError(
+            f"Trace option when of '{var_name}' cannot read trace history"
+        )
+    elif nodetype not in PREDICATE_NODES:
+        raise TypeError(
+            f"Trace option when of '{var_name}' cannot contain a {nodetype} node"
+        )
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            check_predicate(child, var_name)
+        elif isinstance(child, list):
+            for item in child:
+                check_predicate(item, var_name)
+
+
+def function_names(node, var_name):
+    """The names given to within=: one function name, or an array of them"""
+    items = node[1] if node[0] == "array" else [node]
+    for item in items:
+        if item[0] != "var":
+            raise TypeError(
+                f"Trace option within of '{var_name}' must name functions"
+            )
+        yield item[1]
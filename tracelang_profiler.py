@@ -0,0 +1,96 @@
+# tracelang_profiler.py
+"""Function and line profiling for the closure engine
+
+Times are wall-clock.  Inclusive time counts each function once however
+deeply it recurses (only the outermost active call adds to it); exclusive
+time leaves out the time spent in the functions it calls.  Line hits
+count executions of statements, attributed to the line they start on;
+a statement outside a block counts on the line of the one containing it.
+"""
+import sys
+import time
+
+
+class FunctionStats:
+    __slots__ = ("calls", "inclusive", "exclusive", "active")
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+        self.active = 0  # Calls currently on the stack
+
+
+class Profiler:
+    """Collects what the closure compiler's profiled closures report"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.functions = {}  # {name: FunctionStats}
+        self.line_hits = {}  # {lineno: hits}
+        self.stacks = {}  # {"Main;f;g": exclusive seconds}
+        # One entry per active call: [stats, path, start, time in callees]
+        self.stack = []
+
+    def enter(self, name):
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = FunctionStats()
+        stats.calls += 1
+        stats.active += 1
+        path = self.stack[-1][1] + ";" + name if self.stack else name
+        self.stack.append([stats, path, self.clock(), 0.0])
+
+    def leave(self):
+        stats, path, start, callees = self.stack.pop()
+        elapsed = self.clock() - start
+        stats.active -= 1
+        if not stats.active:
+            stats.inclusive += elapsed
+        stats.exclusive += elapsed - callees
+        self.stacks[path] = self.stacks.get(path, 0.0) + elapsed - callees
+        if self.stack:
+            self.stack[-1][3] += elapsed
+
+    def finish(self):
+        """Close calls still open, e.g. after a runtime error"""
+        while self.stack:
+            self.leave()
+
+    def report(self, source_lines=None, max_lines=20, file=None):
+        """Print the function table by exclusive time, then the busiest lines"""
+        file = file or sys.stderr
+        print("Profile (wall time)", file=file)
+        print(
+            f"{'function':<20} {'calls':>10} {'incl ms':>10} {'excl ms':>10} "
+            f"{'excl us/call':>13}",
+            file=file,
+        )
+        ranked = sorted(
+            self.functions.items(), key=lambda item: item[1].exclusive, reverse=True
+        )
+        for name, stats in ranked:
+            per_call = stats.exclusive / stats.calls * 1e6 if stats.calls else 0.0
+            print(
+                f"{name:<20} {stats.calls:>10} {stats.inclusive * 1e3:>10.3f} "
+                f"{stats.exclusive * 1e3:>10.3f} {per_call:>13.2f}",
+                file=file,
+            )
+
+        if not self.line_hits:
+            return
+        print(f"\n{'line':>6} {'hits':>10}  source", file=file)
+        lines = sorted(self.line_hits.items(), key=lambda item: (-item[1], item[0]))
+        for lineno, hits in lines[:max_lines]:
+            text = ""
+            if source_lines and 0 < lineno <= len(source_lines):
+                text = source_lines[lineno - 1].strip()
+            print(f"{lineno:>6} {hits:>10}  {text}", file=file)
+
+    def write_collapsed(self, filename):
+        """Write "Main;f;g microseconds" lines for flamegraph tools"""
+        with open(filename, "w", encoding="utf-8") as f:
+            for path, seconds in sorted(self.stacks.items()):
+                micros = round(seconds * 1e6)
+                if micros > 0:
+                    f.write(f"{path} {micros}\n")
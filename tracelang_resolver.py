@@ -0,0 +1,108 @@
+# tracelang_resolver.py
+"""Compile-time slot resolution for variable storage
+
+Each program, function call and for loop gets a Frame: a list with one
+slot per name that can be bound in that scope.  Scoping is dynamic and
+declarations may be conditional, so an access is only bound to a
+(depth, slot) pair when the variable is certain to be found there; every
+other access walks the frame chain by name, in Environment's order.
+"""
+
+UNSET = object()  # Slot whose variable has not been bound yet
+
+
+class Scope:
+    """Compile-time layout of a Frame"""
+
+    def __init__(self, parent=None):
+        self.slots = {}  # {var_name: slot index}
+        self.parent = parent  # Lexically enclosing scope, None at a call boundary
+        self.bound = set()  # Names certainly bound at the point being compiled
+
+    def add(self, name):
+        if name not in self.slots:
+            self.slots[name] = len(self.slots)
+        return self.slots[name]
+
+    def resolve(self, name):
+        """Return (depth, slot) if name is certain to be found there, else None"""
+        scope = self
+        depth = 0
+        while scope is not None:
+            if name in scope.bound:
+                return depth, scope.slots[name]
+            if name in scope.slots:
+                # Possibly bound here, possibly further out
+                return None
+            scope = scope.parent
+            depth += 1
+        return None
+
+
+class Frame(list):
+    """Runtime storage for one Scope"""
+
+    __slots__ = ("parent", "slots")
+
+    def __init__(self, scope, parent=None):
+        list.__init__(self, (UNSET,) * len(scope.slots))
+        self.parent = parent
+        self.slots = scope.slots
+
+
+def lookup(frame, name):
+    """Read a variable by name, nearest frame first"""
+    while frame is not None:
+        slot = frame.slots.get(name)
+        if slot is not None:
+            value = frame[slot]
+            if value is not UNSET:
+                return value
+        frame = frame.parent
+    raise NameError(f"Variable '{name}' is not defined")
+
+
+def store(frame, name, value):
+    """Update an existing variable by name"""
+    while frame is not None:
+        slot = frame.slots.get(name)
+        if slot is not None and frame[slot] is not UNSET:
+            frame[slot] = value
+            return
+        frame = frame.parent
+    raise NameError(f"Variable '{name}' is not defined")
+
+
+def assign(frame, name, value):
+    """Update an existing variable, or bind it in the innermost frame"""
+    current = frame
+    while current is not None:
+        slot = current.slots.get(name)
+        if slot is not None and current[slot] is not UNSET:
+            current[slot] = value
+            return
+        current = current.parent
+    frame[frame.slots[name]] = value
+
+
+def collect_bindings(node, scope):
+    """Add every name the statement can bind in its own scope to scope"""
+    if node is None:
+        return
+    nodetype = node[0]
+    if nodetype == "program" or nodetype == "block":
+        for stmt in node[1]:
+            collect_bindings(stmt, scope)
+    elif nodetype == "declare":
+        scope.add(node[2])
+    elif nodetype == "assign":
+        # Assigning to a variable visible from an enclosing scope updates
+        # it there and never binds it here
+        if scope.parent is None or scope.parent.resolve(node[1]) is None:
+            scope.add(node[1])
+    elif nodetype == "if":
+        collect_bindings(node[2], scope)
+        collect_bindings(node[3], scope)
+    elif nodetype == "while":
+        collect_bindings(node[2], scope)
+    # for loops and function bodies get scopes of their own
@@ -0,0 +1,231 @@
+# tracelang_server.py
+"""Long-running TraceLang server
+
+Starting Python and importing the lexer, parser and engines takes far
+longer than most TraceLang programs take to run.  The server pays for that
+once, then runs jobs sent over a Unix socket one at a time, each with its
+own TraceSystem, Environment and function table:
+
+    python tracelang_server.py [--socket PATH] [--job-timeout SECONDS]
+    python tracelang_client.py [compiler options] file.tl
+
+A job is one line of JSON, and so is its reply:
+
+    {"argv": ["--engine", "vm", "job.tl"], "cwd": "/home/me/jobs"}
+    {"argv": ["job.tl"], "source": "trace int x = 1;"}
+    {"status": 0, "stdout": "...", "stderr": "...", "files": {"Trace.txt": "..."}}
+
+argv takes the arguments of tracelang_compiler.py.  A relative source
+path is resolved against cwd; with source, that text is the program and
+the path only names it.  Each job runs in a fresh temporary directory and
+whatever it writes there (Trace.txt, Trace.bin, a relative
+--profile-collapsed file) comes back base64-encoded under files, for the
+client to write where it was run.
+
+Jobs run serially: the parser and sys.stdout are shared by the whole
+process.  The socket is created readable and writable by its owner only.
+"""
+import argparse
+import base64
+import contextlib
+import io
+import json
+import os
+import shutil
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+
+from tracelang_client import default_socket_path
+from tracelang_compiler import parse_args, run_file
+
+
+class JobTimeout(BaseException):
+    """Raised in a job that runs past the server's job timeout
+
+    Not an Exception, so the job cannot report it as its own runtime error.
+    """
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """Raise JobTimeout in the main thread after seconds, if set"""
+    if not seconds:
+        yield
+        return
+
+    def expire(signum, frame):
+        raise JobTimeout
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_job(request, timeout=None):
+    """Run one job request and return its reply"""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    directory = tempfile.mkdtemp(prefix="tracelang-job-")
+    previous = os.getcwd()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                status = _run(request, directory, timeout)
+            except SystemExit as e:
+                # From argparse, on bad arguments
+                status = e.code if isinstance(e.code, int) else 1
+            except JobTimeout:
+                print(f"Error: job timed out after {timeout} seconds", file=sys.stderr)
+                status = 1
+            except Exception:
+                traceback.print_exc()
+                status = 1
+        files = _collect(directory)
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(directory, ignore_errors=True)
+    return {
+        "status": status,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "files": files,
+    }
+
+
+def _run(request, directory, timeout):
+    argv = request.get("argv")
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        raise ValueError("argv must be a list of strings")
+    source = request.get("source")
+    if source is not None and not isinstance(source, str):
+        raise ValueError("source must be a string")
+    args = parse_args(argv)
+    if source is None:
+        if args.sourcefile == "-":
+            raise ValueError("send the program as source to read it from stdin")
+        cwd = request.get("cwd") or os.getcwd()
+        args.sourcefile = os.path.join(cwd, args.sourcefile)
+    else:
+        args.ast_cache = False  # Nowhere to keep it
+    os.chdir(directory)
+    with time_limit(timeout):
+        return run_file(args, source)
+
+
+def _collect(directory):
+    """{relative path: base64 contents} of the files a job wrote"""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            files[os.path.relpath(path, directory)] = base64.b64encode(data).decode()
+    return files
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return  # Connected and closed, as a liveness check does
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+        except ValueError as e:
+            reply = {
+                "status": 2,
+                "stdout": "",
+                "stderr": f"Error: bad request: {e}\n",
+                "files": {},
+            }
+        else:
+            if request.get("command") == "stop":
+                self.server.stopping = True
+                reply = {"status": 0}
+            else:
+                reply = run_job(request, self.server.job_timeout)
+        # The client may have given up waiting
+        with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class JobServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path, job_timeout=None):
+        self.job_timeout = job_timeout
+        self.stopping = False
+        _remove_stale_socket(socket_path)
+        mask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, JobHandler)
+        finally:
+            os.umask(mask)
+
+    def serve_until_stopped(self):
+        while not self.stopping:
+            self.handle_request()
+
+
+def _remove_stale_socket(socket_path):
+    """Delete a socket left by a server that is no longer running"""
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+    raise OSError(f"A server is already running on {socket_path}")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="tracelang_server.py",
+        description="Run TraceLang jobs sent over a Unix socket",
+    )
+    arg_parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        metavar="PATH",
+        help="socket to listen on (default: $TRACELANG_SOCKET or "
+        "tracelang-<uid>.sock in the temp directory)",
+    )
+    arg_parser.add_argument(
+        "--job-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="stop any job that runs longer than this",
+    )
+    args = arg_parser.parse_args(argv)
+
+    try:
+        server = JobServer(args.socket, args.job_timeout)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    # Stop cleanly on SIGTERM as on Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    print(f"Serving TraceLang jobs on {args.socket}", file=sys.stderr)
+    try:
+        server.serve_until_stopped()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# tracelang_stream.py
+"""Statement-at-a-time parsing of sources too large to hold
+
+A source is lexed a line at a time and cut into its top-level statements
+as their tokens arrive, and each statement is parsed on its own into a
+one-statement program.  Only the statement being parsed is ever held, so
+a generated program can be piped in and run while it is being written.
+
+A top-level statement ends at a semicolon or closing brace outside any
+brackets, except that an if statement may still be followed by an else:
+there the next token decides.  Statements are kept whole, so the parser
+sees exactly what it would in the full program and line numbers are
+those of the source.
+"""
+from tracelang_fastlex import FastLexer
+
+OPENING = frozenset(("LPAREN", "LBRACKET", "LBRACE"))
+CLOSING = frozenset(("RPAREN", "RBRACKET", "RBRACE"))
+
+
+class StreamParseError(Exception):
+    """A top-level statement did not parse; the message is for the user"""
+
+
+def split_statements(tokens):
+    """Group tokens into lists of the tokens of each top-level statement
+
+    Tokens left over at the end, such as an unfinished statement, come
+    last so that the parser can report them.
+    """
+    statement = []
+    depth = 0
+    open_ifs = 0  # if statements outside brackets still without an else
+    may_end = False  # statement is complete unless an else comes next
+    for token in tokens:
+        token_type = token.type
+        if may_end:
+            may_end = False
+            if token_type != "ELSE":
+                yield statement
+                statement = []
+                open_ifs = 0
+        statement.append(token)
+        ends = False
+        if token_type in OPENING:
+            depth += 1
+        elif token_type in CLOSING:
+            depth -= 1
+            if depth <= 0:
+                # A stray closing bracket ends the statement, as an error
+                ends = depth < 0 or token_type == "RBRACE"
+                depth = 0
+        elif depth == 0:
+            if token_type == "SEMICOLON":
+                ends = True
+            elif token_type == "IF":
+                open_ifs += 1
+            elif token_type == "ELSE":
+                open_ifs -= 1
+        if ends:
+            if open_ifs > 0:
+                may_end = True
+            else:
+                yield statement
+                statement = []
+                open_ifs = 0
+    if statement:
+        yield statement
+
+
+def parse_statements(lines):
+    """Generate a program AST for each top-level statement in lines
+
+    lines is any iterable of source lines with their line breaks, such as
+    an open file.  Raises StreamParseError at a statement that does not
+    parse, after the parser has reported why; the statements before it
+    have been generated by then.
+    """
+    from tracelang_parser import parser
+
+    lexer = FastLexer()
+    for statement in split_statements(lexer.stream(lines)):
+        parser.error_count = 0
+        lexer.feed(statement)
+        try:
+            # Tracking gives statements the line of their first token
+            ast = parser.parse(lexer=lexer, tracking=True)
+        except Exception as e:
+            raise StreamParseError(f"Parse error: {e}") from e
+        if ast is None:
+            raise StreamParseError("Error: Failed to parse code")
+        yield ast
@@ -0,0 +1,251 @@
+# tracelang_tracefile.py
+"""Compact binary trace files
+
+Layout (little endian):
+
+    header   magic, version, record count, footer count, string table offset
+    records  fixed-width (context id, var id, iteration, kind, value)
+    footer   final values, same record layout with iteration 0
+    strings  count, then (length, utf-8 bytes) for every interned string
+
+The header is completed when the writer is closed.  Context and variable
+names, string values and the text form of any other value are kept once
+in the string table and referenced by id.
+"""
+import mmap
+import struct
+import sys
+
+from tracelang_interpreter import TRACE_HEADER, format_trace_line
+
+MAGIC = b"TLTRACE\0"
+VERSION = 1
+
+HEADER = struct.Struct("<8sI4xQQQ")
+INT_RECORD = struct.Struct("<IIIBq")
+FLOAT_RECORD = struct.Struct("<IIIBd")
+RECORD_SIZE = INT_RECORD.size
+LENGTH = struct.Struct("<I")
+
+# Value kinds; a string table id is stored in the value field for the
+# last four
+KIND_INT = 0
+KIND_FLOAT = 1
+KIND_BOOL = 2
+KIND_NONE = 3
+KIND_STR = 4
+KIND_BIGINT = 5
+KIND_TEXT = 6  # Anything else, kept as the text Trace.txt shows
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+class BinaryTraceWriter:
+    """TraceWriter counterpart that streams binary records"""
+
+    def __init__(self, filename="Trace.bin", flush_lines=1000):
+        self.filename = filename
+        self.flush_lines = max(1, flush_lines)
+        self.pending = bytearray()
+        self.pending_count = 0
+        self.record_count = 0
+        self.footer_count = 0
+        self.strings = {}  # {string: id}
+        self.file = None
+
+    def intern(self, text):
+        string_id = self.strings.get(text)
+        if string_id is None:
+            string_id = self.strings[text] = len(self.strings)
+        return string_id
+
+    def pack(self, context_id, var_id, iteration, value):
+        value_type = type(value)
+        if value_type is int and INT64_MIN <= value <= INT64_MAX:
+            return INT_RECORD.pack(context_id, var_id, iteration, KIND_INT, value)
+        if value_type is float:
+            return FLOAT_RECORD.pack(context_id, var_id, iteration, KIND_FLOAT, value)
+        if value_type is bool:
+            return INT_RECORD.pack(context_id, var_id, iteration, KIND_BOOL, value)
+        if value is None:
+            return INT_RECORD.pack(context_id, var_id, iteration, KIND_NONE, 0)
+        if value_type is str:
+            kind = KIND_STR
+        elif value_type is int:
+            kind = KIND_BIGINT
+        else:
+            kind = KIND_TEXT
+        string_id = self.intern(value if kind == KIND_STR else f"{value}")
+        return INT_RECORD.pack(context_id, var_id, iteration, kind, string_id)
+
+    def write_record(self, context, var_name, iteration, value):
+        self.pending += self.pack(
+            self.intern(context), self.intern(var_name), iteration, value
+        )
+        self.pending_count += 1
+        self.record_count += 1
+        if self.pending_count >= self.flush_lines:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        if self.file is None:
+            self.file = open(self.filename, "wb")
+            self.file.write(bytes(HEADER.size))
+        self.file.write(self.pending)
+        self.file.flush()
+        self.pending.clear()
+        self.pending_count = 0
+
+    def finish(self, final_values):
+        """Append the final values and close the file"""
+        self.flush()
+        if self.file is not None:
+            for var_name, value in final_values:
+                self.file.write(self.pack(0, self.intern(var_name), 0, value))
+                self.footer_count += 1
+        self.close()
+
+    def close(self):
+        """Write the string table and complete the header"""
+        self.flush()
+        if self.file is None:
+            return
+        strings_offset = self.file.tell()
+        self.file.write(LENGTH.pack(len(self.strings)))
+        for text in self.strings:
+            data = text.encode("utf-8")
+            self.file.write(LENGTH.pack(len(data)))
+            self.file.write(data)
+        self.file.seek(0)
+        self.file.write(
+            HEADER.pack(
+                MAGIC, VERSION, self.record_count, self.footer_count, strings_offset
+            )
+        )
+        self.file.close()
+        self.file = None
+
+
+class TraceFile:
+    """Memory-mapped reader for files written by BinaryTraceWriter"""
+
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.record_count, self.footer_count, strings_offset = (
+            HEADER.unpack_from(self.data, 0)
+        )
+        if magic != MAGIC:
+            raise ValueError(f"'{filename}' is not a TraceLang binary trace")
+        if version != VERSION:
+            raise ValueError(f"Unsupported trace file version {version}")
+        if strings_offset == 0:
+            raise ValueError(f"'{filename}' was not closed properly")
+        self.strings = self.read_strings(strings_offset)
+
+    def read_strings(self, offset):
+        data = self.data
+        (count,) = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        strings = []
+        for _ in range(count):
+            (length,) = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            strings.append(str(data[offset : offset + length], "utf-8"))
+            offset += length
+        return strings
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_at(self, offset):
+        """(context id, var id, iteration, value) of the record at offset"""
+        kind = self.data[offset + 12]
+        record = FLOAT_RECORD if kind == KIND_FLOAT else INT_RECORD
+        context_id, var_id, iteration, kind, value = record.unpack_from(
+            self.data, offset
+        )
+        if kind == KIND_BOOL:
+            value = bool(value)
+        elif kind == KIND_NONE:
+            value = None
+        elif kind == KIND_STR or kind == KIND_TEXT:
+            value = self.strings[value]
+        elif kind == KIND_BIGINT:
+            value = int(self.strings[value])
+        return context_id, var_id, iteration, value
+
+    def records(self):
+        """Yield (context, var_name, iteration, value) in trace order"""
+        strings = self.strings
+        offset = HEADER.size
+        for _ in range(self.record_count):
+            context_id, var_id, iteration, value = self.record_at(offset)
+            yield strings[context_id], strings[var_id], iteration, value
+            offset += RECORD_SIZE
+
+    def final_values(self):
+        """Yield (var_name, value) as written in the footer"""
+        offset = HEADER.size + self.record_count * RECORD_SIZE
+        for _ in range(self.footer_count):
+            _, var_id, _, value = self.record_at(offset)
+            yield self.strings[var_id], value
+            offset += RECORD_SIZE
+
+    def histories(self):
+        """{var_name: [values]} for every traced variable"""
+        result = {}
+        for _, var_name, _, value in self.records():
+            result.setdefault(var_name, []).append(value)
+        return result
+
+    def history(self, var_name):
+        """Values of one variable, in order"""
+        if var_name not in self.strings:
+            return []
+        var_id = self.strings.index(var_name)
+        values = []
+        offset = HEADER.size
+        for _ in range(self.record_count):
+            # The var id sits at a fixed position, so other records are
+            # skipped without decoding them
+            if LENGTH.unpack_from(self.data, offset + 4)[0] == var_id:
+                values.append(self.record_at(offset)[3])
+            offset += RECORD_SIZE
+        return values
+
+    def render_text(self):
+        """The Trace.txt text for this trace"""
+        lines = [TRACE_HEADER]
+        for record in self.records():
+            lines.append(format_trace_line(*record) + "\n")
+        lines.append("\n")
+        for var_name, value in self.final_values():
+            lines.append(f"{var_name}: {value}\n")
+        return "".join(lines)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python tracelang_tracefile.py <Trace.bin> [output.txt]")
+        return
+    with TraceFile(sys.argv[1]) as trace:
+        text = trace.render_text()
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,592 @@
+# tracelang_vm.py
+import operator
+
+from tracelang_arrays import (
+    ARRAY_CLASSES,
+    BUILTINS,
+    MUTATING_BUILTINS,
+    array_typecode,
+    arity_error,
+    declared_array,
+    load_element,
+    retyped,
+    store_element,
+    typed_array,
+)
+from tracelang_closures import BINARY_OPS, COMPOUND_OPS, UNARY_OPS, compile_predicate
+from tracelang_interpreter import (
+    HISTORY_BUILTINS,
+    Environment,
+    ReturnException,
+    get_default_value,
+    history_builtin_target,
+)
+from tracelang_policy import trace_policy
+
+# Opcodes
+(
+    CONST,
+    LOAD,
+    DECLARE,
+    DECLARE_TRACED,
+    ASSIGN,
+    STORE,
+    ARRAY_LOAD,
+    ARRAY_STORE,
+    BINARY,
+    UNARY,
+    JUMP,
+    JUMP_IF_FALSE,
+    JUMP_IF_FUNCTION,
+    PUSH_SCOPE,
+    POP_SCOPE,
+    BUILD_ARRAY,
+    TYPED_ARRAY,
+    TRACE_ACCESS,
+    LOAD_FUNCTION,
+    CALL,
+    CALL_BUILTIN,
+    CALL_MUTATING,
+    HISTORY_BUILTIN,
+    DEFINE_FUNCTION,
+    RETURN,
+    RETURN_OUTSIDE,
+    PRINT,
+    POP,
+    RAISE,
+    UNKNOWN,
+) = range(30)
+
+OPNAMES = [
+    "CONST",
+    "LOAD",
+    "DECLARE",
+    "DECLARE_TRACED",
+    "ASSIGN",
+    "STORE",
+    "ARRAY_LOAD",
+    "ARRAY_STORE",
+    "BINARY",
+    "UNARY",
+    "JUMP",
+    "JUMP_IF_FALSE",
+    "JUMP_IF_FUNCTION",
+    "PUSH_SCOPE",
+    "POP_SCOPE",
+    "BUILD_ARRAY",
+    "TYPED_ARRAY",
+    "TRACE_ACCESS",
+    "LOAD_FUNCTION",
+    "CALL",
+    "CALL_BUILTIN",
+    "CALL_MUTATING",
+    "HISTORY_BUILTIN",
+    "DEFINE_FUNCTION",
+    "RETURN",
+    "RETURN_OUTSIDE",
+    "PRINT",
+    "POP",
+    "RAISE",
+    "UNKNOWN",
+]
+
+EXPRESSIONS = {
+    "binop",
+    "unop",
+    "num",
+    "float",
+    "string",
+    "bool",
+    "var",
+    "trace_access",
+    "array",
+    "array_access",
+    "call",
+}
+
+
+class Code:
+    """A flat list of (opcode, argument) pairs with absolute jump targets"""
+
+    def __init__(self, name, instructions):
+        self.name = name
+        self.instructions = instructions
+
+    def disassemble(self):
+        lines = []
+        for pc, (op, arg) in enumerate(self.instructions):
+            if op in (DEFINE_FUNCTION, CALL_BUILTIN, CALL_MUTATING):
+                arg = arg[0]
+            lines.append(f"{pc:4d} {OPNAMES[op]:<16} {'' if arg is None else arg!r}")
+        return "\n".join(lines)
+
+
+class BytecodeCompiler:
+    """Lower the tuple AST to a Code object for the VirtualMachine"""
+
+    def __init__(self, name="<program>", in_function=False, return_type=None):
+        self.name = name
+        self.in_function = in_function
+        self.return_typecode = array_typecode(return_type)
+        self.instructions = []
+
+    def emit(self, op, arg=None):
+        self.instructions.append((op, arg))
+        return len(self.instructions) - 1
+
+    def patch(self, index):
+        """Point the jump at index to the next instruction"""
+        op, _ = self.instructions[index]
+        self.instructions[index] = (op, len(self.instructions))
+
+    def compile_program(self, node):
+        self.statement(node)
+        return Code(self.name, self.instructions)
+
+    def compile_function(self, body):
+        self.statement(body)
+        self.emit(CONST, None)
+        self.emit(RETURN)
+        return Code(self.name, self.instructions)
+
+    # Statements leave the operand stack as they found it
+
+    def statement(self, node):
+        if node is None:
+            return
+        nodetype = node[0]
+
+        if nodetype in EXPRESSIONS:
+            self.expression(node)
+            self.emit(POP)
+
+        elif nodetype == "program" or nodetype == "block":
+            for stmt in node[1]:
+                self.statement(stmt)
+
+        elif nodetype == "declare":
+            _, var_type, name, init_value, is_traced, trace_options = node
+            typecode = array_typecode(var_type)
+            if init_value:
+                self.expression(init_value)
+                if typecode:
+                    self.emit(TYPED_ARRAY, typecode)
+            elif typecode:
+                self.emit(BUILD_ARRAY, 0)
+                self.emit(TYPED_ARRAY, typecode)
+            elif isinstance(var_type, tuple):
+                self.emit(BUILD_ARRAY, 0)
+            else:
+                self.emit(CONST, get_default_value(var_type))
+            if is_traced:
+                policy = trace_policy(name, trace_options, compile_predicate)
+                self.emit(
+                    DECLARE_TRACED,
+                    (name, trace_options.get("history"), var_type, policy),
+                )
+            else:
+                self.emit(DECLARE, name)
+
+        elif nodetype == "assign":
+            _, name, expr = node
+            self.expression(expr)
+            self.emit(ASSIGN, name)
+
+        elif nodetype == "array_assign":
+            _, name, index_expr, value_expr = node
+            self.emit(LOAD, name)
+            self.expression(index_expr)
+            self.expression(value_expr)
+            self.emit(ARRAY_STORE, name)
+
+        elif nodetype == "compound_assign":
+            _, name, op, expr = node
+            self.emit(LOAD, name)
+            self.expression(expr)
+            self.emit(BINARY, COMPOUND_OPS[op])
+            self.emit(STORE, name)
+
+        elif nodetype == "inc_dec":
+            _, name, op = node
+            self.emit(LOAD, name)
+            self.emit(CONST, 1)
+            self.emit(BINARY, operator.add if op == "++" else operator.sub)
+            self.emit(STORE, name)
+
+        elif nodetype == "if":
+            _, condition, then_stmt, else_stmt = node
+            self.expression(condition)
+            skip_then = self.emit(JUMP_IF_FALSE)
+            self.statement(then_stmt)
+            if else_stmt:
+                skip_else = self.emit(JUMP)
+                self.patch(skip_then)
+                self.statement(else_stmt)
+                self.patch(skip_else)
+            else:
+                self.patch(skip_then)
+
+        elif nodetype == "while":
+            _, condition, body = node
+            start = len(self.instructions)
+            self.expression(condition)
+            exit_jump = self.emit(JUMP_IF_FALSE)
+            self.statement(body)
+            self.emit(JUMP, start)
+            self.patch(exit_jump)
+
+        elif nodetype == "for":
+            _, init, condition, update, body = node
+            self.emit(PUSH_SCOPE)
+            self.statement(init)
+            start = len(self.instructions)
+            self.expression(condition)
+            exit_jump = self.emit(JUMP_IF_FALSE)
+            self.statement(body)
+            self.statement(update)
+            self.emit(JUMP, start)
+            self.patch(exit_jump)
+            self.emit(POP_SCOPE)
+
+        elif nodetype == "function":
+            _, return_type, name, params, body = node
+            compiler = BytecodeCompiler(name, in_function=True, return_type=return_type)
+            code = compiler.compile_function(body)
+            self.emit(DEFINE_FUNCTION, (name, (return_type, params, code)))
+
+        elif nodetype == "return":
+            if node[1]:
+                self.expression(node[1])
+            else:
+                self.emit(CONST, None)
+            if self.return_typecode:
+                self.emit(TYPED_ARRAY, self.return_typecode)
+            self.emit(RETURN if self.in_function else RETURN_OUTSIDE)
+
+        elif nodetype == "print":
+            self.expression(node[1])
+            self.emit(PRINT)
+
+        else:
+            self.emit(UNKNOWN, nodetype)
+            self.emit(POP)
+
+    # Expressions push exactly one value
+
+    def expression(self, node):
+        nodetype = node[0]
+
+        if nodetype == "binop":
+            _, op, left, right = node
+            self.expression(left)
+            self.expression(right)
+            self.emit(BINARY, BINARY_OPS[op])
+
+        elif nodetype == "unop":
+            _, op, expr = node
+            self.expression(expr)
+            self.emit(UNARY, UNARY_OPS[op])
+
+        elif nodetype in ("num", "float", "string", "bool"):
+            self.emit(CONST, node[1])
+
+        elif nodetype == "var":
+            self.emit(LOAD, node[1])
+
+        elif nodetype == "trace_access":
+            _, name, index_expr = node
+            self.expression(index_expr)
+            self.emit(TRACE_ACCESS, name)
+
+        elif nodetype == "array":
+            for elem in node[1]:
+                self.expression(elem)
+            self.emit(BUILD_ARRAY, len(node[1]))
+
+        elif nodetype == "array_access":
+            _, name, index_expr = node
+            self.emit(LOAD, name)
+            self.expression(index_expr)
+            self.emit(ARRAY_LOAD, name)
+
+        elif nodetype == "call":
+            _, func_name, args = node
+            if func_name in HISTORY_BUILTINS or func_name in BUILTINS:
+                # A function the program defines shadows the built-in
+                shadowed = self.emit(JUMP_IF_FUNCTION)
+                self.builtin_call(func_name, args)
+                skip_call = self.emit(JUMP)
+                self.instructions[shadowed] = (
+                    JUMP_IF_FUNCTION,
+                    (func_name, len(self.instructions)),
+                )
+                self.function_call(func_name, args)
+                self.patch(skip_call)
+                return
+            self.function_call(func_name, args)
+
+        else:
+            self.emit(UNKNOWN, nodetype)
+
+    def builtin_call(self, func_name, args):
+        if func_name in HISTORY_BUILTINS:
+            try:
+                var_name = history_builtin_target(func_name, args)
+            except TypeError as error:
+                self.emit(RAISE, (TypeError, str(error)))
+                return
+            self.emit(HISTORY_BUILTIN, (func_name, var_name))
+            return
+        argc, function = BUILTINS[func_name]
+        if len(args) != argc:
+            error = arity_error(func_name, len(args))
+            self.emit(RAISE, (TypeError, str(error)))
+            return
+        for arg in args:
+            self.expression(arg)
+        if func_name in MUTATING_BUILTINS:
+            self.emit(CALL_MUTATING, (func_name, function, argc))
+        else:
+            self.emit(CALL_BUILTIN, (func_name, function, argc))
+
+    def function_call(self, func_name, args):
+        # Resolve and arity-check the callee before evaluating arguments,
+        # matching the order of errors in run()
+        self.emit(LOAD_FUNCTION, (func_name, len(args)))
+        for arg in args:
+            self.expression(arg)
+        self.emit(CALL, (len(args), func_name.capitalize()))
+
+
+# Default limit on TraceLang call depth.  Each active call holds a saved
+# (instructions, pc, env) tuple, its Environment with the parameters, and
+# a CallContext in the TraceSystem: roughly 500 bytes with a few
+# parameters, so the default caps call frames at about 500 MB.  Contexts
+# that were traced in outlive their calls, as does the name of each one
+# a trace line was written for, which is as long as its call path.
+MAX_DEPTH = 1_000_000
+
+
+class VirtualMachine:
+    """Stack machine executing Code objects produced by BytecodeCompiler
+
+    TraceLang calls do not recurse in Python: the caller's position is
+    saved on a heap-allocated frame stack and the callee runs in the same
+    dispatch loop, so call depth is limited only by max_depth.
+    """
+
+    def __init__(self, trace_system, functions, max_depth=MAX_DEPTH):
+        self.trace_system = trace_system
+        self.functions = functions
+        self.max_depth = max_depth
+
+    def execute(self, code, env):
+        instructions = code.instructions
+        trace_system = self.trace_system
+        trace_vars = trace_system.trace_vars
+        live_arrays = trace_system.live_arrays
+        functions = self.functions
+        max_depth = self.max_depth
+        # Operands of every active call share one stack: statements leave
+        # it balanced, so a callee returns with only its result on top
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        frames = []  # Saved (instructions, pc, env) of each caller
+        pc = 0
+        end = len(instructions)
+
+        while pc < end:
+            op, arg = instructions[pc]
+            pc += 1
+
+            if op == LOAD:
+                push(env.get(arg))
+
+            elif op == CONST:
+                push(arg)
+
+            elif op == BINARY:
+                right = pop()
+                stack[-1] = arg(stack[-1], right)
+
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+
+            elif op == JUMP:
+                pc = arg
+
+            elif op == ASSIGN:
+                value = pop()
+                if type(value) in ARRAY_CLASSES and env.exists(arg):
+                    value = retyped(env.get(arg), value)
+                env.assign(arg, value)
+                if arg in trace_vars:
+                    trace_system.update(arg, value)
+
+            elif op == STORE:
+                value = pop()
+                if type(value) in ARRAY_CLASSES:
+                    value = retyped(env.get(arg), value)
+                env.update(arg, value)
+                if arg in trace_vars:
+                    trace_system.update(arg, value)
+
+            elif op == DECLARE:
+                env.set(arg, pop())
+
+            elif op == DECLARE_TRACED:
+                name, history, var_type, policy = arg
+                value = pop()
+                env.set(name, value)
+                trace_system.mark_traced(name, history, var_type, policy)
+                trace_system.update(name, value)
+
+            elif op == UNARY:
+                stack[-1] = arg(stack[-1])
+
+            elif op == ARRAY_LOAD:
+                index = pop()
+                array = stack[-1]
+                if type(index) is int and index >= 0 and type(array) in ARRAY_CLASSES:
+                    try:
+                        stack[-1] = array[index]
+                        continue
+                    except IndexError:
+                        pass
+                stack[-1] = load_element(arg, array, index)
+
+            elif op == ARRAY_STORE:
+                value = pop()
+                index = pop()
+                array = pop()
+                if type(index) is int and index >= 0 and type(array) in ARRAY_CLASSES:
+                    try:
+                        array[index] = value
+                    except (IndexError, TypeError, OverflowError):
+                        store_element(arg, array, index, value)
+                else:
+                    store_element(arg, array, index, value)
+                if arg in trace_vars:
+                    trace_system.update_element(arg, array, index)
+                elif live_arrays:
+                    # Perhaps a traced array under another name
+                    trace_system.write_through(array, index)
+
+            elif op == LOAD_FUNCTION:
+                func_name, argc = arg
+                if func_name not in functions:
+                    raise NameError(f"Function '{func_name}' is not defined")
+                function = functions[func_name]
+                params = function[1]
+                if argc != len(params):
+                    raise TypeError(
+                        f"Function '{func_name}' takes {len(params)} arguments ({argc} given)"
+                    )
+                push(function)
+
+            elif op == CALL:
+                argc, context = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = ()
+                return_type, params, body = pop()
+                if len(frames) >= max_depth:
+                    raise RecursionError(
+                        f"Maximum call depth of {max_depth} exceeded"
+                    )
+                func_env = Environment(env)
+                for (param_type, param_name), value in zip(params, args):
+                    if type(value) in ARRAY_CLASSES:
+                        value = declared_array(param_type, value)
+                    func_env.set(param_name, value)
+                trace_system.push_context(context)
+                frames.append((instructions, pc, env))
+                instructions = body.instructions
+                pc = 0
+                end = len(instructions)
+                env = func_env
+
+            elif op == RETURN:
+                if not frames:
+                    return pop()
+                # The return value stays on the stack for the caller
+                trace_system.pop_context()
+                instructions, pc, env = frames.pop()
+                end = len(instructions)
+
+            elif op == POP:
+                pop()
+
+            elif op == PRINT:
+                print(pop())
+
+            elif op == PUSH_SCOPE:
+                env = Environment(env)
+
+            elif op == POP_SCOPE:
+                env = env.parent
+
+            elif op == BUILD_ARRAY:
+                if arg:
+                    array = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    array = []
+                push(array)
+
+            elif op == TYPED_ARRAY:
+                stack[-1] = typed_array(stack[-1], arg)
+
+            elif op == CALL_BUILTIN:
+                _, function, argc = arg
+                if argc == 1:
+                    stack[-1] = function(stack[-1])
+                else:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                    push(function(*args))
+
+            elif op == CALL_MUTATING:
+                _, function, argc = arg
+                args = stack[-argc:]
+                del stack[-argc:]
+                push(function(*args))
+                trace_system.array_changed(args[0])
+
+            elif op == JUMP_IF_FUNCTION:
+                func_name, target = arg
+                if func_name in functions:
+                    pc = target
+
+            elif op == TRACE_ACCESS:
+                stack[-1] = trace_system.history_at(arg, stack[-1])
+
+            elif op == HISTORY_BUILTIN:
+                func_name, var_name = arg
+                push(HISTORY_BUILTINS[func_name](trace_system, var_name))
+
+            elif op == DEFINE_FUNCTION:
+                name, function = arg
+                functions[name] = function
+
+            elif op == RETURN_OUTSIDE:
+                raise ReturnException(pop())
+
+            elif op == RAISE:
+                exc_type, message = arg
+                raise exc_type(message)
+
+            elif op == UNKNOWN:
+                print(f"Unknown node type: {arg}")
+                push(None)
+
+        return None
+
+
+def compile_bytecode(node):
+    """Lower a program AST to a Code object"""
+    return BytecodeCompiler().compile_program(node)